@@ -0,0 +1,147 @@
+"""
+Benchmark Utilities
+
+Shared helpers for the benchmark runners in this directory. Benchmarks are timed with a
+calibrated loop (similar to `timeit.Timer.autorange`), summarized, written to JSON and
+compared against a stored baseline so that regressions fail loudly instead of being argued about.
+
+Key Features:
+- Calibrates the number of calls per sample so each sample runs for a minimum duration.
+- Summarizes samples as per-call min/median/mean/stdev in seconds.
+- Saves and loads results as JSON, including machine information.
+- Compares results against a baseline with a relative regression threshold.
+"""
+
+import json
+import os
+import platform
+import statistics
+import time
+from datetime import datetime, timezone
+from typing import Callable
+
+DEFAULT_MIN_SAMPLE_TIME = 0.2  # Seconds each sample should run for
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.2  # Fail when 20% slower than the baseline
+
+
+def time_callable(
+    func: Callable[[], object], repeat: int = DEFAULT_REPEAT, min_sample_time: float = DEFAULT_MIN_SAMPLE_TIME
+) -> dict:
+    """
+    Time a zero-argument callable and summarize the per-call durations.
+
+    Args:
+        func: The callable to benchmark.
+        repeat: The number of samples to take.
+        min_sample_time: The minimum duration (seconds) of a single sample, used to calibrate calls per sample.
+
+    Returns:
+        dict: Calls per sample, samples taken and per-call min/median/mean/stdev in seconds.
+    """
+    number = _calibrate(func, min_sample_time)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+
+    return {
+        "number": number,
+        "repeat": repeat,
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+
+def build_report(results: dict[str, dict]) -> dict:
+    """Wrap benchmark results with the machine information needed to interpret them."""
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "machine": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "cpu_count": os.cpu_count(),
+        },
+        "benchmarks": results,
+    }
+
+
+def save_report(report: dict, path: str):
+    """Write a benchmark report to a JSON file, creating its directory if needed."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as file:
+        json.dump(report, file, indent=2)
+
+
+def load_report(path: str) -> dict:
+    """Read a benchmark report from a JSON file."""
+    with open(path) as file:
+        return json.load(file)
+
+
+def compare_to_baseline(
+    report: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD, metric: str = "median"
+) -> list[tuple[str, float, float, float]]:
+    """
+    Compare a report against a baseline report.
+
+    Args:
+        report: The current benchmark report.
+        baseline: The stored baseline report.
+        threshold: The allowed relative slowdown before a benchmark counts as a regression.
+        metric: The summary statistic to compare.
+
+    Returns:
+        list: (name, baseline value, current value, relative change) for every regressed benchmark.
+    """
+    regressions = []
+    for name, result in report["benchmarks"].items():
+        baseline_result = baseline["benchmarks"].get(name)
+        if baseline_result is None:
+            continue
+        change = result[metric] / baseline_result[metric] - 1
+        if change > threshold:
+            regressions.append((name, baseline_result[metric], result[metric], change))
+    return regressions
+
+
+def print_report(report: dict, baseline: dict | None = None, metric: str = "median"):
+    """Print a report as a table, including the change against the baseline when provided."""
+    print(f"{'Benchmark':<40} {'Median':>12} {'Min':>12} {'Change':>10}")
+    for name, result in report["benchmarks"].items():
+        change = ""
+        if baseline and name in baseline["benchmarks"]:
+            change = f"{result[metric] / baseline['benchmarks'][name][metric] - 1:+.1%}"
+        print(f"{name:<40} {_format_seconds(result['median']):>12} {_format_seconds(result['min']):>12} {change:>10}")
+
+
+def _calibrate(func: Callable[[], object], min_sample_time: float) -> int:
+    """Find the number of calls needed for a sample to run for at least `min_sample_time` seconds."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_sample_time:
+            return number
+        # Grow towards the target without overshooting wildly on very fast callables
+        number = max(number * 2, int(number * min_sample_time / max(elapsed, 1e-9) * 1.1))
+
+
+def _format_seconds(seconds: float) -> str:
+    """Format a duration with a unit suited to its magnitude."""
+    if seconds < 1e-6:
+        return f"{seconds * 1e9:.1f} ns"
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.2f} us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.3f} s"
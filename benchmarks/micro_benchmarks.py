@@ -0,0 +1,279 @@
+"""
+Micro Benchmarks
+
+Times the hot paths of the simulation and the learning loop in isolation. Each benchmark is a
+factory that prepares its own game objects and returns a zero-argument callable to be timed.
+Results are written to JSON and can be compared against a stored baseline, failing (exit code 1)
+when any benchmark regresses past the threshold.
+
+Run from the root directory:
+
+    python -m benchmarks.micro_benchmarks
+    python -m benchmarks.micro_benchmarks --save-baseline
+    python -m benchmarks.micro_benchmarks --filter game_manager --threshold 0.1
+
+Key Features:
+- Covers bird physics, collision rects, game updates, pipe spawning, state extraction, pixel observations
+  and the agent.
+- Runs headless games that never open a display, as training and pixel observation do, so it also works
+  on servers.
+- Agent benchmarks are skipped when TensorFlow is unavailable.
+"""
+
+import argparse
+import os
+import random
+import sys
+from typing import Callable
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame  # noqa: E402
+
+from benchmarks.benchmark_utils import (  # noqa: E402
+    DEFAULT_REPEAT,
+    DEFAULT_THRESHOLD,
+    build_report,
+    compare_to_baseline,
+    load_report,
+    print_report,
+    save_report,
+    time_callable,
+)
+from flappy_trainer.ai.ai_utils import Action, Knowledge, get_current_state  # noqa: E402
+from flappy_trainer.ai.pixel_observer import PixelObserver  # noqa: E402
+from flappy_trainer.game_managers.game_manager import GameManager  # noqa: E402
+from flappy_trainer.game_objects.pipe.pipe import Pipe  # noqa: E402
+from flappy_trainer.utils import GameState, PipeColor  # noqa: E402
+
+DEFAULT_OUTPUT_PATH = "benchmarks/results/micro_benchmarks.json"
+DEFAULT_BASELINE_PATH = "benchmarks/baselines/micro_benchmarks.json"
+PIPE_X_POSITIONS = [250, 340, 430, 520, 610, 700]  # Clear of the bird's column
+
+
+def _create_game_manager(num_pipes: int = 0) -> GameManager:
+    """Create a running game with `num_pipes` pipes ahead of the bird and no further spawns."""
+    game_manager = GameManager(is_pipes=True, pipe_gap_size_mode="large", pipe_gap_loc_mode="center", headless=True)
+    game_manager.start_game()
+    game_manager.time_between_pipes = float("inf")
+    for x_pos in PIPE_X_POSITIONS[:num_pipes]:
+        game_manager.pipes.append(Pipe(PipeColor.GREEN, x_pos=x_pos, gap_center=300, gap_height=200))
+    return game_manager
+
+
+def _reset_game_manager(game_manager: GameManager, pipes: list[Pipe]):
+    """Restore the bird and pipes so every timed update does the same amount of work."""
+    game_manager.state = GameState.RUNNING
+    game_manager.bird.y_pos = 300
+    game_manager.bird.y_velocity = 0
+    game_manager.pipes = pipes[:]
+    for pipe, x_pos in zip(pipes, PIPE_X_POSITIONS):
+        pipe.x_pos = x_pos
+        pipe.passed = False
+
+
+def bench_bird_update() -> Callable[[], object]:
+    bird = _create_game_manager().bird
+
+    def run():
+        bird.y_pos = 300
+        bird.update(1 / 60)
+
+    return run
+
+
+def bench_bird_get_rect() -> Callable[[], object]:
+    bird = _create_game_manager().bird
+    return bird.get_rect
+
+
+def _bench_game_manager_update(num_pipes: int) -> Callable[[], Callable[[], object]]:
+    def factory():
+        game_manager = _create_game_manager(num_pipes)
+        pipes = game_manager.pipes[:]
+
+        def run():
+            _reset_game_manager(game_manager, pipes)
+            game_manager.update(1 / 60)
+
+        return run
+
+    return factory
+
+
+def _bench_action_interval(use_advance: bool) -> Callable[[], Callable[[], object]]:
+    """One action interval (15 frames) with 3 pipes, stepped frame by frame or advanced in one call."""
+
+    def factory():
+        game_manager = _create_game_manager(3)
+        pipes = game_manager.pipes[:]
+
+        def run():
+            _reset_game_manager(game_manager, pipes)
+            game_manager.bird.flap()
+            if use_advance:
+                game_manager.advance(15 / 60)
+            else:
+                for _ in range(15):
+                    game_manager.update(1 / 60)
+
+        return run
+
+    return factory
+
+
+def _bench_check_bird_collision(pixel_perfect: bool) -> Callable[[], Callable[[], object]]:
+    def factory():
+        game_manager = _create_game_manager(6)
+        game_manager.pixel_perfect_collision = pixel_perfect
+        game_manager.pipes.insert(0, Pipe(PipeColor.GREEN, x_pos=100, gap_center=300, gap_height=200))  # In column
+        return game_manager._check_bird_collision
+
+    return factory
+
+
+def bench_spawn_pipe() -> Callable[[], object]:
+    game_manager = _create_game_manager()
+
+    def run():
+        game_manager._spawn_pipe()
+        game_manager.pipes.clear()
+
+    return run
+
+
+def bench_get_current_state() -> Callable[[], object]:
+    game_manager = _create_game_manager(3)
+    return lambda: get_current_state(game_manager)
+
+
+def bench_to_numpy_array() -> Callable[[], object]:
+    state = get_current_state(_create_game_manager(3))
+    return lambda: state.to_numpy_array(include_batch_dim=True)
+
+
+def _create_pixel_observer() -> PixelObserver:
+    observer = PixelObserver(_create_game_manager(3))
+    observer.reset()
+    return observer
+
+
+def bench_pixel_render() -> Callable[[], object]:
+    return _create_pixel_observer().render
+
+
+def bench_pixel_preprocess() -> Callable[[], object]:
+    observer = _create_pixel_observer()
+    return lambda: observer._preprocess(observer.frames[0])
+
+
+def bench_pixel_observe() -> Callable[[], object]:
+    return _create_pixel_observer().observe
+
+
+def _create_agent():
+    from flappy_trainer.ai.reinforcement_learning_agent import ReinforcementLearningAgent
+
+    agent = ReinforcementLearningAgent()
+    agent.set_exploration_rate(0.0)
+    return agent
+
+
+def bench_choose_action() -> Callable[[], object]:
+    agent = _create_agent()
+    state = get_current_state(_create_game_manager(3))
+    return lambda: agent.choose_action(state)
+
+
+def bench_replay_32() -> Callable[[], object]:
+    agent = _create_agent()
+    game_manager = _create_game_manager(3)
+    while len(agent.memory) < agent.memory.maxlen:
+        game_manager.bird.y_pos = random.randint(100, 500)
+        pre_state = get_current_state(game_manager)
+        game_manager.bird.y_pos = random.randint(100, 500)
+        post_state = get_current_state(game_manager)
+        action = random.choice([Action.FLAP, Action.NO_FLAP])
+        agent.remember(Knowledge(pre_state, action, random.choice([1, -1]), post_state))
+    return lambda: agent.replay(32)
+
+
+SIMULATION_BENCHMARKS = {
+    "bird_update": bench_bird_update,
+    "bird_get_rect": bench_bird_get_rect,
+    "game_manager_update_0_pipes": _bench_game_manager_update(0),
+    "game_manager_update_3_pipes": _bench_game_manager_update(3),
+    "game_manager_update_6_pipes": _bench_game_manager_update(6),
+    "action_interval_update": _bench_action_interval(False),
+    "action_interval_advance": _bench_action_interval(True),
+    "check_bird_collision": _bench_check_bird_collision(False),
+    "check_bird_collision_pixel_perfect": _bench_check_bird_collision(True),
+    "spawn_pipe": bench_spawn_pipe,
+    "get_current_state": bench_get_current_state,
+    "to_numpy_array": bench_to_numpy_array,
+    "pixel_render": bench_pixel_render,
+    "pixel_preprocess": bench_pixel_preprocess,
+    "pixel_observe": bench_pixel_observe,
+}
+
+AGENT_BENCHMARKS = {
+    "choose_action": bench_choose_action,
+    "replay_32": bench_replay_32,
+}
+
+
+def run_benchmarks(name_filter: str | None = None, repeat: int = DEFAULT_REPEAT) -> dict[str, dict]:
+    """Run every benchmark whose name contains `name_filter` and return the timing summaries."""
+    random.seed(42)
+    pygame.init()
+    benchmarks = {**SIMULATION_BENCHMARKS, **AGENT_BENCHMARKS}
+    if name_filter:
+        benchmarks = {name: factory for name, factory in benchmarks.items() if name_filter in name}
+    if any(name in AGENT_BENCHMARKS for name in benchmarks):
+        try:
+            import tensorflow  # noqa: F401
+        except ImportError:
+            print("TensorFlow is not installed, skipping agent benchmarks.")
+            benchmarks = {name: factory for name, factory in benchmarks.items() if name not in AGENT_BENCHMARKS}
+
+    results = {}
+    for name, factory in benchmarks.items():
+        print(f"Running {name}...")
+        results[name] = time_callable(factory(), repeat=repeat)
+    pygame.quit()
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the Flappy Trainer micro benchmarks.")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT_PATH, help="Where to write the JSON results.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH, help="Baseline JSON to compare against.")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the new baseline.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Allowed relative slowdown.")
+    parser.add_argument("--filter", default=None, help="Only run benchmarks whose name contains this string.")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Samples per benchmark.")
+    args = parser.parse_args(argv)
+
+    report = build_report(run_benchmarks(args.filter, args.repeat))
+    save_report(report, args.output)
+    if args.save_baseline:
+        save_report(report, args.baseline)
+        print(f"Baseline saved to {args.baseline}")
+
+    baseline = load_report(args.baseline) if os.path.exists(args.baseline) else None
+    print_report(report, baseline)
+    if baseline is None:
+        print(f"No baseline at {args.baseline}, run with --save-baseline to create one.")
+        return 1
+    if args.save_baseline:
+        return 0
+
+    regressions = compare_to_baseline(report, baseline, args.threshold)
+    for name, baseline_value, value, change in regressions:
+        print(f"REGRESSION {name}: {baseline_value:.3e}s -> {value:.3e}s ({change:+.1%})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
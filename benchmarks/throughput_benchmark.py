@@ -0,0 +1,181 @@
+"""
+Throughput Benchmark
+
+Measures how many simulated frames per second a headless `GameManager` produces under a scripted
+policy, single-threaded and across every core. This is the capacity number for how much experience
+a machine can generate, so it is tracked with the same JSON reports and baseline comparison as the
+micro benchmarks.
+
+Run from the root directory:
+
+    python -m benchmarks.throughput_benchmark
+    python -m benchmarks.throughput_benchmark --frames 50000 --workers 8 --save-baseline
+
+Key Features:
+- Scripted policies: `random` (coin flip each decision) and `below_gap` (flap when below the next gap).
+- Fixed seed and fixed frame budget, restarting the game whenever the bird dies.
+- Decisions are made on the trainer's action tick so the workload matches training.
+- Multi-core runs use a spawned process pool with one independent game per process.
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame  # noqa: E402
+
+from benchmarks.benchmark_utils import (  # noqa: E402
+    DEFAULT_THRESHOLD,
+    build_report,
+    compare_to_baseline,
+    load_report,
+    save_report,
+)
+from flappy_trainer.ai.ai_utils import get_nearest_pipe_details  # noqa: E402
+from flappy_trainer.game_managers.game_manager import GameManager  # noqa: E402
+from flappy_trainer.utils import GameState  # noqa: E402
+
+DEFAULT_OUTPUT_PATH = "benchmarks/results/throughput_benchmark.json"
+DEFAULT_BASELINE_PATH = "benchmarks/baselines/throughput_benchmark.json"
+DEFAULT_FRAMES = 20000
+DEFAULT_SEED = 42
+ACTION_TICK = 15
+POLICIES = ("random", "below_gap")
+
+
+def random_policy(game_manager: GameManager) -> bool:
+    """Flap on half of the decisions."""
+    return random.random() < 0.5
+
+
+def below_gap_policy(game_manager: GameManager) -> bool:
+    """Flap whenever the bird is below the centre of the next gap (or the screen when there are no pipes)."""
+    _, gap_center, _ = get_nearest_pipe_details(game_manager)
+    target = gap_center if gap_center is not None else game_manager.screen.get_height() // 2
+    return game_manager.bird.y_pos > target
+
+
+def simulate(policy_name: str, num_frames: int, seed: int) -> dict:
+    """
+    Run a headless game for `num_frames` frames under a scripted policy.
+
+    Returns:
+        dict: Frames simulated, elapsed seconds, frames per second and episodes played.
+    """
+    policy = random_policy if policy_name == "random" else below_gap_policy
+    random.seed(seed)
+    pygame.init()
+    game_manager = GameManager(True, "random", "random", "random", headless=True)
+    game_manager.start_game()
+    episodes = 1
+    episode_frame = 0
+
+    start = time.perf_counter()
+    for _ in range(num_frames):
+        if game_manager.state is not GameState.RUNNING:
+            game_manager.start_game()
+            episodes += 1
+            episode_frame = 0
+        game_manager.update(1 / 60)
+        episode_frame += 1
+        if (episode_frame == 1 or episode_frame % ACTION_TICK == 0) and policy(game_manager):
+            game_manager.bird.flap()
+    elapsed = time.perf_counter() - start
+    pygame.quit()
+
+    return {"frames": num_frames, "elapsed": elapsed, "fps": num_frames / elapsed, "episodes": episodes}
+
+
+def _simulate_worker(args: tuple[str, int, int]) -> dict:
+    return simulate(*args)
+
+
+def run_single(policy_name: str, num_frames: int, seed: int, repeat: int) -> dict:
+    """Run the simulation `repeat` times in this process and summarize the frame rate."""
+    runs = [simulate(policy_name, num_frames, seed) for _ in range(repeat)]
+    return _summarize(runs, num_frames, workers=1)
+
+
+def run_parallel(policy_name: str, num_frames: int, seed: int, repeat: int, workers: int) -> dict:
+    """Run one simulation per worker process and report the aggregate frame rate across them."""
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(workers) as pool:
+        runs = []
+        for _ in range(repeat):
+            # Each worker gets its own seed so the processes do not simulate identical games
+            worker_runs = pool.map(_simulate_worker, [(policy_name, num_frames, seed + i) for i in range(workers)])
+            slowest = max(run["elapsed"] for run in worker_runs)
+            total_frames = num_frames * workers
+            runs.append({"frames": total_frames, "elapsed": slowest, "fps": total_frames / slowest})
+    return _summarize(runs, num_frames * workers, workers)
+
+
+def _summarize(runs: list[dict], frames: int, workers: int) -> dict:
+    """Reduce repeated runs to a summary, including seconds per frame for baseline comparison."""
+    fps = statistics.median(run["fps"] for run in runs)
+    return {
+        "frames": frames,
+        "workers": workers,
+        "repeat": len(runs),
+        "fps": fps,
+        "max_fps": max(run["fps"] for run in runs),
+        "seconds_per_frame": 1 / fps,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure headless simulation throughput in frames per second.")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="Frames to simulate per process.")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Random seed for the pipe course.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Processes for the multi-core run.")
+    parser.add_argument("--policy", choices=POLICIES, action="append", help="Policies to run (default: all).")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT_PATH, help="Where to write the JSON results.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH, help="Baseline JSON to compare against.")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the new baseline.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Allowed relative slowdown.")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for policy_name in args.policy or POLICIES:
+        print(f"Running {policy_name} policy on 1 core...")
+        results[f"{policy_name}_single"] = run_single(policy_name, args.frames, args.seed, args.repeat)
+        print(f"Running {policy_name} policy on {args.workers} cores...")
+        results[f"{policy_name}_parallel"] = run_parallel(
+            policy_name, args.frames, args.seed, args.repeat, args.workers
+        )
+
+    report = build_report(results)
+    save_report(report, args.output)
+    if args.save_baseline:
+        save_report(report, args.baseline)
+        print(f"Baseline saved to {args.baseline}")
+    baseline = load_report(args.baseline) if os.path.exists(args.baseline) else None
+
+    print(f"{'Benchmark':<25} {'Workers':>8} {'Frames/sec':>14} {'Change':>10}")
+    for name, result in results.items():
+        change = ""
+        if baseline and name in baseline["benchmarks"]:
+            change = f"{result['fps'] / baseline['benchmarks'][name]['fps'] - 1:+.1%}"
+        print(f"{name:<25} {result['workers']:>8} {result['fps']:>14,.0f} {change:>10}")
+    if baseline is None:
+        print(f"No baseline at {args.baseline}, run with --save-baseline to create one.")
+        return 1
+    if args.save_baseline:
+        return 0
+
+    regressions = compare_to_baseline(report, baseline, args.threshold, metric="seconds_per_frame")
+    for name, baseline_value, value, change in regressions:
+        print(f"REGRESSION {name}: {1 / baseline_value:,.0f} -> {1 / value:,.0f} frames/sec")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,36 +7,78 @@ progressing from simple to complex scenarios to build the agent's skills over ti
 
 Key Features:
 - Oversees the GameManager and Reinforcement Learning Agent interactions
-- Structures training into progressively harder curricula
+- Structures training into progressively harder curricula, fixed or scheduled on the agent's progress
 - Simulates gameplay by applying the agent's actions to the game
 - Generates training data (knowledge) based on game events
+- Records episode history and evaluates the agent greedily for hyperparameter sweeps
+- Optionally records every episode as a compact, exactly replayable EpisodeRecording
+- Trains any agent with the ReinforcementLearningAgent interface, such as the TabularQAgent
+- Optional physics domain randomization: every episode draws its own physics from `PhysicsRanges`
 """
 
-from flappy_trainer.ai.ai_utils import Action, Knowledge, get_current_state, record_training_output
-from flappy_trainer.ai.reinforcement_learning_agent import ReinforcementLearningAgent
+import os
+import random
+import time
+
+import numpy as np
+
+from flappy_trainer.ai.ai_utils import Action, get_current_state, record_training_output
+from flappy_trainer.ai.curriculum_scheduler import CurriculumScheduler
+from flappy_trainer.ai.episode_replay import EpisodeRecorder
+from flappy_trainer.ai.transition_builder import TransitionBuilder
+from flappy_trainer.ai.vectorized_environment import PhysicsRanges
+from flappy_trainer.config import DEFAULT_GAME_CONFIG, GameConfig
 from flappy_trainer.game_managers.game_manager import GameManager
 from flappy_trainer.utils import GameState
 
 
 class AITrainer:
-    def __init__(self, model_path: str = None):
-        self.agent = ReinforcementLearningAgent(model_path)
-        self.action_tick = 15  # 4 actions per second (60 fps)
-        self.replay_interval = 45  # Replay every 3 actions
-        self.batch_size = 32  # Replay 32 memories at a time
-
-    def train_gravity(self, csv_file_name: str):
-        num_episodes = 2
+    def __init__(
+        self,
+        model_path: str = None,
+        n_steps: int = 1,
+        action_tick: int = 15,
+        replay_interval: int = 45,
+        batch_size: int = 32,
+        agent=None,
+        recordings_dir: str = None,
+        config: GameConfig = DEFAULT_GAME_CONFIG,
+        physics_ranges: PhysicsRanges | None = None,
+    ):
+        if agent is None:
+            # Imported here so agents that do not need TensorFlow can be trained without it
+            from flappy_trainer.ai.reinforcement_learning_agent import ReinforcementLearningAgent
+
+            agent = ReinforcementLearningAgent(model_path)
+        self.agent = agent
+        self.action_tick = action_tick  # 15 = 4 actions per second (60 fps)
+        self.replay_interval = replay_interval  # 45 = Replay every 3 actions
+        self.batch_size = batch_size  # 32 = Replay 32 memories at a time
+        self.transition_builder = TransitionBuilder(n_steps, self.agent.discount_factor)  # n-step returns
+        self.episode_history: list[dict] = []  # Frames, score and elapsed time of every training episode
+        self.training_start_time = None
+        self.recordings_dir = recordings_dir  # Save every episode here as an EpisodeRecording when set
+        self.num_recordings = 0
+        self.config = config  # The physics and geometry of every game trained and evaluated on
+        self.physics_ranges = physics_ranges  # Ranges each episode draws its own physics from, around `config`
+        self.physics_rng = np.random.default_rng(random.getrandbits(64))
+
+    def train_gravity(
+        self,
+        csv_file_name: str,
+        num_episodes: int = 2,
+        explore_rate: float = 0.7,
+        explore_rate_decay: float = 0.9937,
+        min_explore_rate: float = 0.25,
+    ):
         max_frames_per_episode = 1000
-        explore_rate = 0.7
-        explore_rate_decay = 0.9937
-        min_explore_rate = 0.25
         self.agent.set_exploration_rate(explore_rate)
-        game_manager = GameManager(is_pipes=False)
+        game_manager = GameManager(is_pipes=False, config=self.config)
 
         print(f"Begin Gravity Training: {num_episodes} episodes total")
         for i in range(num_episodes):
             frames_survived = self._run_training_episode(game_manager, max_frames_per_episode)
+            self._record_episode(game_manager, frames_survived)
             record_training_output(i + 1, explore_rate, frames_survived, csv_file_name)
             explore_rate = max(min_explore_rate, explore_rate * explore_rate_decay)
             self.agent.set_exploration_rate(explore_rate)
@@ -53,60 +95,139 @@ class AITrainer:
         max_frames_per_episode = 3000
         explore_rate = init_explore_rate
         self.agent.set_exploration_rate(explore_rate)
-        game_manager = GameManager(is_pipes=True)
+        game_manager = GameManager(is_pipes=True, config=self.config)
 
         print(f"Begin Full Game Training: {num_curricula} curricula at {episodes_per_curricula} episodes each.")
         for curricula in range(num_curricula):
             print(f"Being Curricula {curricula + 1} of full game training. Reset Exploration Rate")
             for i in range(episodes_per_curricula):
                 frames_survived = self._run_training_episode(game_manager, max_frames_per_episode)
+                self._record_episode(game_manager, frames_survived)
                 record_training_output(i + 1, explore_rate, frames_survived, csv_file_name, curricula)
                 explore_rate = max(min_explore_rate, explore_rate * explore_rate_decay)
                 self.agent.set_exploration_rate(explore_rate)
 
-    def _create_knowledge(self, pre_state, action, current_state, game_manager) -> Knowledge | None:
-        # Reward is based on if the action from the pre_state caused death in the current_state
-        if game_manager.state == GameState.GAME_OVER or current_state is None:
-            reward = -1
-        else:
-            reward = 1
-        return Knowledge(pre_state, action, reward, current_state)
+    def train_curriculum(
+        self,
+        num_episodes: int,
+        init_explore_rate: float,
+        explore_rate_decay: float,
+        min_explore_rate: float,
+        csv_file_name: str,
+        scheduler: CurriculumScheduler = None,
+    ):
+        """Train through the scheduler's stages, moving between them as the agent's rolling score allows."""
+        max_frames_per_episode = 3000
+        scheduler = scheduler or CurriculumScheduler()
+        explore_rate = init_explore_rate
+        self.agent.set_exploration_rate(explore_rate)
+        game_manager = scheduler.current_stage.create_game_manager(self.config)
+
+        print(f"Begin Scheduled Curriculum Training: {num_episodes} episodes total")
+        print(f"Begin Stage: {scheduler.current_stage.name}")
+        for i in range(num_episodes):
+            frames_survived = self._run_training_episode(game_manager, max_frames_per_episode)
+            self._record_episode(game_manager, frames_survived)
+            record_training_output(i + 1, explore_rate, frames_survived, csv_file_name)
+            explore_rate = max(min_explore_rate, explore_rate * explore_rate_decay)
+
+            if scheduler.record(frames_survived):
+                print(f"Begin Stage: {scheduler.current_stage.name}. Reset Exploration Rate")
+                game_manager = scheduler.current_stage.create_game_manager(self.config)
+                explore_rate = init_explore_rate
+            self.agent.set_exploration_rate(explore_rate)
+
+    def evaluate(self, num_episodes: int, max_frames_per_episode: int = 3000) -> list[int]:
+        """Play full games without exploring or learning and return the score of each."""
+        exploration_rate = self.agent.exploration_rate
+        self.agent.set_exploration_rate(0.0)
+        game_manager = GameManager(is_pipes=True, config=self.config)
+
+        scores = []
+        for _ in range(num_episodes):
+            recorder = self._start_episode(game_manager)
+            current_frame = 0
+            while game_manager.state is GameState.RUNNING and current_frame < max_frames_per_episode:
+                game_manager.update(1 / 60)
+                current_frame += 1
+                if game_manager.state is not GameState.RUNNING:
+                    break
+                if current_frame == 1 or current_frame % self.action_tick == 0:
+                    action = self.agent.choose_action(get_current_state(game_manager))
+                    if action == Action.FLAP:
+                        game_manager.bird.flap()
+                    if recorder:
+                        recorder.record_decision(action)
+            self._save_recording(recorder, current_frame, "eval")
+            scores.append(game_manager.score)
+
+        self.agent.set_exploration_rate(exploration_rate)
+        return scores
+
+    def _record_episode(self, game_manager: GameManager, frames_survived: int):
+        """Keep the outcome of a training episode, timed from the start of the first episode."""
+        self.episode_history.append(
+            {
+                "episode": len(self.episode_history) + 1,
+                "frames": frames_survived,
+                "score": game_manager.score,
+                "elapsed": time.perf_counter() - self.training_start_time,
+            }
+        )
 
     def _run_training_episode(self, game_manager: GameManager, max_frames: int) -> int:
-        game_manager.start_game()
+        if self.training_start_time is None:
+            self.training_start_time = time.perf_counter()
+        recorder = self._start_episode(game_manager)
+        self.transition_builder.reset()
         current_frame = 0
-        pending_knowledge = []
         while game_manager.state is GameState.RUNNING and current_frame < max_frames:
             # Update the game (60 fps)
             game_manager.update(1 / 60)
             current_frame += 1
+            if game_manager.state is not GameState.RUNNING:
+                break
 
             # Assess game on the first frame and every action tick
             if current_frame == 1 or current_frame % self.action_tick == 0:
-                # Agent makes an action and action is stored to create knowledge for later
+                # Agent makes an action, completing the knowledge of its previous action
                 current_state = get_current_state(game_manager)
                 action = self.agent.choose_action(current_state)
                 if action == Action.FLAP:
                     game_manager.bird.flap()
-                pending_knowledge.append((current_state, action, current_frame))
-
-                # If an action tick has occured since an action, create and store knowledge
-                for action_made in pending_knowledge[:]:
-                    pre_state, action, action_frame = action_made
-                    if current_frame - action_frame >= self.action_tick:
-                        post_state = get_current_state(game_manager)
-                        knowledge = self._create_knowledge(pre_state, action, post_state, game_manager)
-                        self.agent.remember(knowledge)
-                        pending_knowledge.remove(action_made)
+                if recorder:
+                    recorder.record_decision(action)
+                for knowledge in self.transition_builder.add_decision(current_state, action):
+                    self.agent.remember(knowledge)
 
                 # Train the agent on the memories at set intervals
                 if current_frame % self.replay_interval == 0:
                     self.agent.replay(self.batch_size)
 
-                if current_frame < max_frames:
-                    # Always remember the move that caused death
-                    if pending_knowledge is not None:
-                        pre_state, action, action_frame = pending_knowledge[-1]
-                        knowledge = self._create_knowledge(pre_state, action, None, game_manager)
-                        self.agent.remember(knowledge)
+        # Remember the moves that caused death
+        for knowledge in self.transition_builder.end_episode(game_manager.state is GameState.GAME_OVER):
+            self.agent.remember(knowledge)
+        self._save_recording(recorder, current_frame, "train")
         return current_frame
+
+    def _start_episode(self, game_manager: GameManager) -> EpisodeRecorder | None:
+        """
+        Start a game, on its own seeded pipe course with a recorder when episodes are recorded, and with its own
+        physics when the trainer has physics ranges.
+        """
+        if self.physics_ranges is not None:
+            # Games read their physics from their config as they start, and states carry the config they are from
+            game_manager.config = self.physics_ranges.sample_config(self.config, self.physics_rng)
+        if not self.recordings_dir:
+            game_manager.start_game()
+            return None
+        recorder = EpisodeRecorder(game_manager, self.action_tick)
+        recorder.start(random.getrandbits(63))
+        return recorder
+
+    def _save_recording(self, recorder: EpisodeRecorder | None, num_frames: int, kind: str):
+        if recorder is None:
+            return
+        self.num_recordings += 1
+        os.makedirs(self.recordings_dir, exist_ok=True)
+        recorder.finish(num_frames).save(os.path.join(self.recordings_dir, f"{kind}-{self.num_recordings:06d}.ftep"))
@@ -2,9 +2,12 @@ import csv
 import os
 from dataclasses import dataclass
 from enum import Enum
+from typing import Sequence
+
+import numpy as np
 
 from flappy_trainer.ai.environment_state import EnvironmentState
-from flappy_trainer.config import INITIAL_PIPE_SPEED, PIPE_SPEED_INCREASE_PER_LEVEL_UP, PIPE_WIDTH
+from flappy_trainer.ai.state_encoder import StateEncoder
 from flappy_trainer.game_managers.game_manager import GameManager
 from flappy_trainer.game_objects.pipe.pipe import Pipe
 from flappy_trainer.utils import GameState
@@ -15,15 +18,54 @@ class Action(Enum):
     NO_FLAP = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Knowledge:
     pre_state: EnvironmentState
     action: Action
     reward: float
     post_state: EnvironmentState
+    n_steps: int = 1  # Decisions between pre_state and post_state, used to discount the bootstrap
 
     def as_tuple(self) -> tuple:
-        return tuple(self.pre_state, self.action, self.reward, self.post_state)
+        return (self.pre_state, self.action, self.reward, self.post_state)
+
+
+# One replay transition as a fixed-size record, for compact storage, serialization and batch conversion
+TRANSITION_DTYPE = np.dtype(
+    [
+        ("state", np.float32, (EnvironmentState.get_num_features(),)),
+        ("action", np.int8),  # Action value
+        ("reward", np.float32),
+        ("next_state", np.float32, (EnvironmentState.get_num_features(),)),  # Zeros when done
+        ("done", np.bool_),
+        ("n_steps", np.uint8),
+    ]
+)
+
+
+def knowledge_to_records(batch: Sequence[Knowledge], out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Convert knowledge into TRANSITION_DTYPE records.
+
+    Args:
+        batch: The knowledge to convert.
+        out: Optional TRANSITION_DTYPE array with at least `len(batch)` records to write into.
+
+    Returns:
+        np.ndarray: The records, one per knowledge.
+    """
+    records = np.zeros(len(batch), dtype=TRANSITION_DTYPE) if out is None else out[: len(batch)]
+    for record, knowledge in zip(records, batch):
+        StateEncoder.encode_state(knowledge.pre_state, record["state"], knowledge.pre_state.config)
+        record["action"] = knowledge.action.value
+        record["reward"] = knowledge.reward
+        record["done"] = knowledge.post_state is None or not knowledge.post_state.bird_is_alive
+        if record["done"]:
+            record["next_state"] = 0
+        else:
+            StateEncoder.encode_state(knowledge.post_state, record["next_state"], knowledge.post_state.config)
+        record["n_steps"] = knowledge.n_steps
+    return records
 
 
 def get_current_state(game_manager: GameManager) -> EnvironmentState:
@@ -45,11 +87,13 @@ def get_current_state(game_manager: GameManager) -> EnvironmentState:
         second_pipe_distance=dist_to_sec_pipe,
         second_pipe_gap_pos=sec_pipe_gap_pos,
         second_pipe_gap_height=sec_pipe_gap_height,
+        config=game_manager.config,
     )
 
 
 def get_curr_pipe_velocity(game_manager: GameManager) -> int:
-    return INITIAL_PIPE_SPEED + (game_manager.level * PIPE_SPEED_INCREASE_PER_LEVEL_UP)
+    config = game_manager.config
+    return config.initial_pipe_speed + (game_manager.level * config.pipe_speed_increase_per_level_up)
 
 
 def get_nearest_pipe_details(game_manager: GameManager) -> tuple[int, int, int]:
@@ -58,7 +102,7 @@ def get_nearest_pipe_details(game_manager: GameManager) -> tuple[int, int, int]:
         return (None, None, None)
     else:
         pipe: Pipe = min(unpassed_pipes, key=lambda pipe: pipe.x_pos)
-        next_pipe_distance = (pipe.x_pos + PIPE_WIDTH) - game_manager.bird.x_pos
+        next_pipe_distance = (pipe.x_pos + game_manager.config.pipe_width) - game_manager.bird.x_pos
         next_pipe_gap_pos = pipe.gap_center
         next_pipe_gap_height = pipe.gap_height
     return (next_pipe_distance, next_pipe_gap_pos, next_pipe_gap_height)
@@ -70,7 +114,7 @@ def get_second_nearest_pipe_details(game_manager: GameManager) -> tuple[int, int
         return (None, None, None)
     else:
         second_pipe = sorted(unpassed_pipes, key=lambda pipe: pipe.x_pos)[1]
-        second_pipe_distance = (second_pipe.x_pos + PIPE_WIDTH) - game_manager.bird.x_pos
+        second_pipe_distance = (second_pipe.x_pos + game_manager.config.pipe_width) - game_manager.bird.x_pos
         second_pipe_gap_pos = second_pipe.gap_center
         second_pipe_gap_height = second_pipe.gap_height
 
@@ -100,9 +144,11 @@ def record_training_output(
     print(f"Episode: {episode_num}, Explore Rate: {exploration_rate:.2f}, frames: {frames_survived}")
 
     # Record the episode output to a csv file
+    if not file_name:
+        return
     csv_file = os.path.join("flappy_trainer/ai/training_logs", f"{file_name}-{curricula_num}.csv")
 
-    is_first_entry = episode_num == 1 and file_name
+    is_first_entry = episode_num == 1
     with open(csv_file, mode="w" if is_first_entry else "a", newline="") as file:
         writer = csv.writer(file)
         if is_first_entry:
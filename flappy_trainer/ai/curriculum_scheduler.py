@@ -0,0 +1,114 @@
+"""
+CurriculumScheduler
+
+Decides which curriculum stage the AITrainer trains on, based on how the agent is doing instead of a fixed
+number of episodes per curriculum. The stages are built from the GameManager's pipe modes and get
+progressively harder: no pipes, large centered gaps, alternating gaps, and finally the random full game.
+
+The scheduler keeps a rolling window of episode results (frames survived) for the current stage. When the
+rolling mean crosses the advance threshold the agent moves on to the next stage. When the agent has had a
+fair number of episodes on a stage and its rolling mean is still below the fallback threshold, it has
+regressed (or the stage is too hard for now) and goes back one stage to consolidate.
+
+Key Features:
+- Stages describe the GameManager that is trained on.
+- Advances on a rolling score threshold, so easy stages are not over-trained.
+- Falls back a stage on regression.
+- Reports every stage change, so the trainer can reset its exploration rate.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+
+from flappy_trainer.config import DEFAULT_GAME_CONFIG, GameConfig
+from flappy_trainer.game_managers.game_manager import GameManager
+
+
+@dataclass(frozen=True)
+class CurriculumStage:
+    name: str
+    is_pipes: bool = True
+    pipe_gap_size_mode: str = "random"  # Options: 'large', 'small', 'random'
+    pipe_distance_mode: str = "random"  # Options: 'large', 'random'
+    pipe_gap_loc_mode: str = "random"  # Options: 'top', 'bottom', 'center', 'alternating', 'random'
+
+    def create_game_manager(self, config: GameConfig = DEFAULT_GAME_CONFIG) -> GameManager:
+        return GameManager(
+            self.is_pipes, self.pipe_gap_size_mode, self.pipe_distance_mode, self.pipe_gap_loc_mode, config=config
+        )
+
+
+DEFAULT_STAGES = (
+    CurriculumStage("No Pipes", is_pipes=False),
+    CurriculumStage("Large Centered Gaps", True, "large", "large", "center"),
+    CurriculumStage("Alternating Gaps", True, "large", "random", "alternating"),
+    CurriculumStage("Full Game", True, "random", "random", "random"),
+)
+
+
+class CurriculumScheduler:
+    def __init__(
+        self,
+        stages: tuple[CurriculumStage, ...] = DEFAULT_STAGES,
+        advance_threshold: float = 1000,
+        fallback_threshold: float = 250,
+        window: int = 20,
+        patience: int = 200,
+    ):
+        """
+        Args:
+            stages: The stages from easiest to hardest.
+            advance_threshold: Rolling mean of frames survived that moves the agent to the next stage.
+            fallback_threshold: Rolling mean of frames survived below which the agent goes back a stage.
+            window: The number of recent episodes in the rolling mean.
+            patience: The episodes a stage is trained before falling back is considered.
+        """
+        self.stages = stages
+        self.advance_threshold = advance_threshold
+        self.fallback_threshold = fallback_threshold
+        self.window = window
+        self.patience = max(patience, window)
+        self.stage_index = 0
+        self.episodes_in_stage = 0
+        self.recent_results: deque[float] = deque(maxlen=window)
+
+    @property
+    def current_stage(self) -> CurriculumStage:
+        return self.stages[self.stage_index]
+
+    @property
+    def is_final_stage(self) -> bool:
+        return self.stage_index == len(self.stages) - 1
+
+    @property
+    def rolling_mean(self) -> float | None:
+        """The mean result over the window, once the window is full."""
+        if len(self.recent_results) < self.window:
+            return None
+        return sum(self.recent_results) / self.window
+
+    def record(self, frames_survived: float) -> bool:
+        """
+        Record the result of an episode on the current stage and advance or fall back if it is time to.
+
+        Returns:
+            bool: True if the stage changed.
+        """
+        self.recent_results.append(frames_survived)
+        self.episodes_in_stage += 1
+        rolling_mean = self.rolling_mean
+        if rolling_mean is None:
+            return False
+
+        if rolling_mean >= self.advance_threshold and not self.is_final_stage:
+            self._set_stage(self.stage_index + 1)
+            return True
+        if rolling_mean < self.fallback_threshold and self.episodes_in_stage >= self.patience and self.stage_index:
+            self._set_stage(self.stage_index - 1)
+            return True
+        return False
+
+    def _set_stage(self, stage_index: int):
+        self.stage_index = stage_index
+        self.episodes_in_stage = 0
+        self.recent_results.clear()
@@ -0,0 +1,155 @@
+"""
+Demonstrations
+
+Records human gameplay to a compact binary log and uses it to warm-start the agent with supervised
+pretraining (behavior cloning), cutting the early random-exploration phase of reinforcement learning.
+
+A log is a small header (magic, version, feature count, RNG seed) followed by one fixed-size record per
+running frame: the episode number, frame number, frame time, whether the player flapped, and the encoded
+`StateEncoder` features of the game before the flap.
+
+Key Features:
+- Compact binary log written in blocks, read back as one NumPy structured array.
+- Converts per-frame human flaps into the agent's per-decision-tick actions.
+- Pretrains the agent's network on the demonstrations in large, class-balanced batches.
+"""
+
+import os
+import struct
+
+import numpy as np
+
+from flappy_trainer.ai.ai_utils import Action
+from flappy_trainer.ai.state_encoder import NUM_FEATURES, StateEncoder
+from flappy_trainer.game_managers.game_manager import GameManager
+
+MAGIC = b"FTDEMO"
+VERSION = 1
+HEADER = struct.Struct("<6sBBq")  # Magic, version, num features, seed
+FRAME_DTYPE = np.dtype(
+    [
+        ("episode", "<u4"),
+        ("frame", "<u4"),
+        ("delta_time", "<f4"),
+        ("flap", "u1"),
+        ("features", "<f4", (NUM_FEATURES,)),
+    ]
+)
+
+
+class DemonstrationRecorder:
+    """Logs the frames of human games. Use as a context manager, or call `close` when done."""
+
+    def __init__(self, path: str, seed: int, block_size: int = 600):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, NUM_FEATURES, seed))
+        self.seed = seed
+        self.episode = 0
+        self.frame = 0
+        self._block = np.zeros(block_size, dtype=FRAME_DTYPE)
+        self._buffered = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def start_episode(self):
+        self.episode += 1
+        self.frame = 0
+
+    def record_frame(self, game_manager: GameManager, flap: bool, delta_time: float):
+        """Record a running frame: the game before the player's input, and whether they flapped."""
+        record = self._block[self._buffered]
+        record["episode"] = self.episode
+        record["frame"] = self.frame
+        record["delta_time"] = delta_time
+        record["flap"] = flap
+        StateEncoder.encode(game_manager, record["features"])
+        self.frame += 1
+        self._buffered += 1
+        if self._buffered == len(self._block):
+            self.flush()
+
+    def flush(self):
+        self._block[: self._buffered].tofile(self.file)
+        self.file.flush()
+        self._buffered = 0
+
+    def close(self):
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+
+def load_demonstrations(path: str) -> tuple[int, np.ndarray]:
+    """
+    Load a demonstration log.
+
+    Returns:
+        tuple[int, np.ndarray]: The RNG seed of the session and its frames as a FRAME_DTYPE array.
+    """
+    with open(path, "rb") as file:
+        magic, version, num_features, seed = HEADER.unpack(file.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} demonstration log.")
+        if num_features != NUM_FEATURES:
+            raise ValueError(f"Demonstrations have {num_features} features, expected {NUM_FEATURES}.")
+        frames = np.fromfile(file, dtype=FRAME_DTYPE)
+    return seed, frames
+
+
+def demonstrations_to_actions(frames: np.ndarray, action_tick: int = 15) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Turn per-frame human inputs into the agent's decisions: the action for the state of a frame is FLAP when
+    the player flapped within the `action_tick` frames that follow it in the same episode.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The (N, num_features) states and their (N,) Action values.
+    """
+    flaps = frames["flap"].astype(np.int32)
+    episodes = frames["episode"]
+    flap_counts = np.concatenate([[0], np.cumsum(flaps)])  # Flaps in frames[i:j] = flap_counts[j] - flap_counts[i]
+
+    # A decision's window ends after `action_tick` frames or at the end of its episode
+    window_ends = np.minimum(np.arange(len(frames)) + action_tick, len(frames))
+    episode_ends = np.searchsorted(episodes, episodes, side="right")  # Episodes are recorded in order
+    window_ends = np.minimum(window_ends, episode_ends)
+
+    flapped = flap_counts[window_ends] - flap_counts[np.arange(len(frames))] > 0
+    actions = np.where(flapped, Action.FLAP.value, Action.NO_FLAP.value)
+    return np.ascontiguousarray(frames["features"]), actions
+
+
+def pretrain_agent(
+    agent,
+    frames: np.ndarray,
+    action_tick: int = 15,
+    epochs: int = 10,
+    batch_size: int = 1024,
+    margin: float = 1.0,
+):
+    """
+    Fit the agent's network to the demonstrated actions before reinforcement learning begins.
+
+    The demonstrated action's Q-value is fitted to the value of surviving forever, 1 / (1 - discount),
+    and the other action's to `margin` below it, so the pretrained Q-values start on the scale RL uses.
+    Flaps are rare, so every sample is weighted to balance the two actions.
+    """
+    states, actions = demonstrations_to_actions(frames, action_tick)
+    survive_value = 1 / (1 - agent.discount_factor)
+    is_flap = actions == Action.FLAP.value
+
+    # Q-value order: (FLAP, NO_FLAP)
+    targets = np.full((len(states), 2), survive_value - margin, dtype=np.float32)
+    targets[is_flap, 0] = survive_value
+    targets[~is_flap, 1] = survive_value
+
+    num_flaps = int(is_flap.sum())
+    flap_weight = len(states) / (2 * max(num_flaps, 1))
+    no_flap_weight = len(states) / (2 * max(len(states) - num_flaps, 1))
+    sample_weight = np.where(is_flap, flap_weight, no_flap_weight)
+
+    agent.model.fit(states, targets, sample_weight=sample_weight, epochs=epochs, batch_size=batch_size, verbose=0)
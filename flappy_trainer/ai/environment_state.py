@@ -1,9 +1,23 @@
 import numpy as np
 
-from flappy_trainer.config import MAX_BIRD_VELOCITY, MAX_PIPE_VELOCITY, SCREEN_HEIGHT, SCREEN_WIDTH
+from flappy_trainer.config import DEFAULT_GAME_CONFIG, GameConfig
 
 
 class EnvironmentState:
+    __slots__ = (
+        "bird_is_alive",
+        "bird_vert_pos",
+        "bird_vert_velocity",
+        "pipe_velocity",
+        "next_pipe_distance",
+        "next_pipe_gap_pos",
+        "next_pipe_gap_height",
+        "second_pipe_distance",
+        "second_pipe_gap_pos",
+        "second_pipe_gap_height",
+        "config",
+    )  # No per-instance __dict__, replay memory holds many of these
+
     def __init__(
         self,
         bird_is_alive: bool,
@@ -16,43 +30,49 @@ class EnvironmentState:
         second_pipe_distance: int | None = None,
         second_pipe_gap_pos: int | None = None,
         second_pipe_gap_height: int | None = None,
+        config: GameConfig = DEFAULT_GAME_CONFIG,
     ):
+        screen_width, screen_height = config.screen_width, config.screen_height
+        self.config = config  # The config of the game the state is from, which its features are normalized by
         self.bird_is_alive = bird_is_alive
         self.bird_vert_pos = bird_vert_pos
         self.bird_vert_velocity = bird_vert_velocity
         self.pipe_velocity = pipe_velocity
-        self.next_pipe_distance = SCREEN_WIDTH if next_pipe_distance is None else next_pipe_distance
-        self.next_pipe_gap_pos = SCREEN_HEIGHT // 2 if next_pipe_gap_pos is None else next_pipe_gap_pos
-        self.next_pipe_gap_height = SCREEN_HEIGHT // 4 if next_pipe_gap_height is None else next_pipe_gap_height
-        self.second_pipe_distance = SCREEN_WIDTH if second_pipe_distance is None else second_pipe_distance
-        self.second_pipe_gap_pos = SCREEN_HEIGHT // 2 if second_pipe_gap_pos is None else second_pipe_gap_pos
-        self.second_pipe_gap_height = SCREEN_HEIGHT // 4 if second_pipe_gap_height is None else second_pipe_gap_height
+        self.next_pipe_distance = screen_width if next_pipe_distance is None else next_pipe_distance
+        self.next_pipe_gap_pos = screen_height // 2 if next_pipe_gap_pos is None else next_pipe_gap_pos
+        self.next_pipe_gap_height = screen_height // 4 if next_pipe_gap_height is None else next_pipe_gap_height
+        self.second_pipe_distance = screen_width if second_pipe_distance is None else second_pipe_distance
+        self.second_pipe_gap_pos = screen_height // 2 if second_pipe_gap_pos is None else second_pipe_gap_pos
+        self.second_pipe_gap_height = screen_height // 4 if second_pipe_gap_height is None else second_pipe_gap_height
 
-    def to_numpy_array(self, include_batch_dim: bool = False) -> np.ndarray:
+    def to_numpy_array(self, include_batch_dim: bool = False, config: GameConfig | None = None) -> np.ndarray:
         """
         Converts the current state to a normalized numpy array for TensorFlow compatibility.
 
         Args:
             include_batch_dim (bool): If True, adds a batch dimension (shape: [1, num_features])
                                       for compatibility with TensorFlow models.
+            config (GameConfig): The config to normalize the features by, the state's own config when None.
 
         Returns:
             np.array: Normalized feature array representing the current environment state.
         """
+        config = config or self.config
+        screen_width, screen_height = config.screen_width, config.screen_height
         data = np.array(
             [
                 # Bird State
-                self.bird_vert_pos / SCREEN_HEIGHT,
-                self.bird_vert_velocity / MAX_BIRD_VELOCITY,
-                self.pipe_velocity / MAX_PIPE_VELOCITY,
+                self.bird_vert_pos / screen_height,
+                self.bird_vert_velocity / config.max_bird_velocity,
+                self.pipe_velocity / config.max_pipe_velocity,
                 # First Pipe
-                self.next_pipe_distance / SCREEN_WIDTH,
-                self.next_pipe_gap_pos / SCREEN_HEIGHT,
-                self.next_pipe_gap_height / SCREEN_HEIGHT,
+                self.next_pipe_distance / screen_width,
+                self.next_pipe_gap_pos / screen_height,
+                self.next_pipe_gap_height / screen_height,
                 # Second Pipe
-                self.second_pipe_distance / SCREEN_WIDTH,
-                self.second_pipe_gap_pos / SCREEN_HEIGHT,
-                self.second_pipe_gap_height / SCREEN_HEIGHT,
+                self.second_pipe_distance / screen_width,
+                self.second_pipe_gap_pos / screen_height,
+                self.second_pipe_gap_height / screen_height,
             ],
             dtype=np.float16,
         )
@@ -0,0 +1,256 @@
+"""
+Episode Replay
+
+Records an episode as the few things needed to re-simulate it exactly: a hash of the game config, the seed
+of the game's pipe course, and one bit per decision tick for the action taken. A recording is a few hundred
+bytes, so millions of episodes can be archived instead of videos, and any failure can be replayed exactly
+instead of hoping it happens again.
+
+The EpisodePlayer re-simulates a recording frame by frame, headless or rendered, with the AITrainer's
+frame and decision timing. It keeps a snapshot of the game every `snapshot_interval` frames, so seeking to
+any frame only re-simulates from the nearest earlier snapshot.
+
+Key Features:
+- Compact binary recordings: a fixed header plus the packed action bitstream.
+- Refuses to replay a recording made with a different game config or bird collision shape.
+- Frame-exact re-simulation, headless or rendered at 60 fps.
+- Seeking to any frame through periodic snapshots.
+"""
+
+import copy
+import hashlib
+import struct
+from dataclasses import asdict, dataclass
+
+import numpy as np
+import pygame
+
+from flappy_trainer.ai.ai_utils import Action
+from flappy_trainer.config import DEFAULT_GAME_CONFIG, GameConfig
+from flappy_trainer.game_managers.game_manager import GameManager
+from flappy_trainer.game_objects.bird.bird_spritesheet import load_frame_hitboxes, load_frame_pixel_counts
+from flappy_trainer.utils import GameState
+
+MAGIC = b"FTEP"
+VERSION = 1
+# Magic, version, config hash, seed, action tick, frames, decisions, pipes, gap size, distance, gap location,
+# previous gap center (-1 when None)
+HEADER = struct.Struct("<4sB8sQHIIB8s8s12sh")
+FRAME_TIME = 1 / 60
+
+
+def get_config_hash(game_config: GameConfig = DEFAULT_GAME_CONFIG) -> bytes:
+    """
+    A hash of everything that decides how an episode plays out, to detect recordings made under different
+    game settings: the game config values plus the bird's collision shape from its sprite sheet. Settings
+    that only affect drawing or training, such as colors or the agent's memory, are left out.
+    """
+    digest = hashlib.sha256(repr(sorted(asdict(game_config).items())).encode())
+    digest.update(repr([tuple(hitbox) for hitbox in load_frame_hitboxes()]).encode())
+    for pixel_counts in load_frame_pixel_counts():
+        digest.update(pixel_counts.tobytes())
+    return digest.digest()[:8]
+
+
+def is_decision_frame(frame: int, action_tick: int) -> bool:
+    """Whether the agent decides on this frame: the first frame and every action tick."""
+    return frame == 1 or frame % action_tick == 0
+
+
+@dataclass
+class EpisodeRecording:
+    config_hash: bytes
+    seed: int
+    action_tick: int
+    num_frames: int
+    actions: np.ndarray  # One bool per decision, True for FLAP
+    is_pipes: bool = True
+    pipe_gap_size_mode: str = "random"
+    pipe_distance_mode: str = "random"
+    pipe_gap_loc_mode: str = "random"
+    previous_gap_center: int | None = None
+
+    def to_bytes(self) -> bytes:
+        header = HEADER.pack(
+            MAGIC,
+            VERSION,
+            self.config_hash,
+            self.seed,
+            self.action_tick,
+            self.num_frames,
+            len(self.actions),
+            self.is_pipes,
+            self.pipe_gap_size_mode.encode(),
+            self.pipe_distance_mode.encode(),
+            self.pipe_gap_loc_mode.encode(),
+            -1 if self.previous_gap_center is None else self.previous_gap_center,
+        )
+        return header + np.packbits(self.actions).tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "EpisodeRecording":
+        fields = HEADER.unpack(data[: HEADER.size])
+        magic, version, config_hash, seed, action_tick, num_frames, num_decisions = fields[:7]
+        is_pipes, gap_size_mode, distance_mode, gap_loc_mode, previous_gap_center = fields[7:]
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not a version {VERSION} episode recording.")
+        actions = np.unpackbits(np.frombuffer(data[HEADER.size :], dtype=np.uint8), count=num_decisions)
+        return cls(
+            config_hash,
+            seed,
+            action_tick,
+            num_frames,
+            actions.astype(bool),
+            bool(is_pipes),
+            gap_size_mode.rstrip(b"\0").decode(),
+            distance_mode.rstrip(b"\0").decode(),
+            gap_loc_mode.rstrip(b"\0").decode(),
+            None if previous_gap_center == -1 else previous_gap_center,
+        )
+
+    def save(self, path: str):
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> "EpisodeRecording":
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+
+class EpisodeRecorder:
+    """Records the episode a GameManager is about to play. Call `start` in place of `start_game`."""
+
+    def __init__(self, game_manager: GameManager, action_tick: int):
+        self.game_manager = game_manager
+        self.action_tick = action_tick
+        self.seed = None
+        self.previous_gap_center = None
+        self.actions: list[bool] = []
+
+    def start(self, seed: int):
+        """Start the game on the seeded pipe course."""
+        self.seed = seed
+        self.previous_gap_center = self.game_manager.previous_gap_center  # Alternating gaps carry over games
+        self.actions = []
+        self.game_manager.start_game(seed)
+
+    def record_decision(self, action: Action):
+        self.actions.append(action == Action.FLAP)
+
+    def finish(self, num_frames: int) -> EpisodeRecording:
+        return EpisodeRecording(
+            get_config_hash(self.game_manager.config),
+            self.seed,
+            self.action_tick,
+            num_frames,
+            np.array(self.actions, dtype=bool),
+            self.game_manager.is_pipes_active,
+            self.game_manager.pipe_gap_size_mode,
+            self.game_manager.pipe_distance_mode,
+            self.game_manager.pipe_gap_loc_mode,
+            self.previous_gap_center,
+        )
+
+
+class EpisodePlayer:
+    """Re-simulates a recorded episode frame by frame, optionally drawing it."""
+
+    def __init__(
+        self,
+        recording: EpisodeRecording,
+        render: bool = False,
+        snapshot_interval: int = 300,
+        game_config: GameConfig = DEFAULT_GAME_CONFIG,
+    ):
+        if recording.config_hash != get_config_hash(game_config):
+            raise ValueError("The episode was recorded with a different game config.")
+        self.recording = recording
+        self.render = render
+        self.snapshot_interval = snapshot_interval
+        self.game_manager = GameManager(
+            recording.is_pipes,
+            recording.pipe_gap_size_mode,
+            recording.pipe_distance_mode,
+            recording.pipe_gap_loc_mode,
+            config=game_config,
+        )
+        self.game_manager.previous_gap_center = recording.previous_gap_center
+        self.game_manager.start_game(recording.seed)
+        self.frame = 0
+        self.decision = 0
+        self.snapshots = {0: self._take_snapshot()}
+        self.clock = pygame.time.Clock()
+
+    @property
+    def is_finished(self) -> bool:
+        return self.frame >= self.recording.num_frames or self.game_manager.state is not GameState.RUNNING
+
+    def step(self):
+        """Advance one frame, then apply the recorded decision if this frame is a decision tick."""
+        self.game_manager.update(FRAME_TIME)
+        self.frame += 1
+        if self.game_manager.state is GameState.RUNNING and is_decision_frame(self.frame, self.recording.action_tick):
+            if self.recording.actions[self.decision]:
+                self.game_manager.bird.flap()
+            self.decision += 1
+
+        if self.frame % self.snapshot_interval == 0 and self.frame not in self.snapshots:
+            self.snapshots[self.frame] = self._take_snapshot()
+        if self.render:
+            self.game_manager.draw()
+            self.clock.tick(60)
+
+    def play(self, until_frame: int | None = None) -> GameManager:
+        """Play up to `until_frame` (the end of the episode when None) and return the game."""
+        last_frame = self.recording.num_frames if until_frame is None else min(until_frame, self.recording.num_frames)
+        while self.frame < last_frame and not self.is_finished:
+            self.step()
+        return self.game_manager
+
+    def seek(self, frame: int) -> GameManager:
+        """Jump to a frame, re-simulating only from the nearest snapshot before it."""
+        nearest = max(snapshot_frame for snapshot_frame in self.snapshots if snapshot_frame <= frame)
+        if self.frame > frame or self.frame < nearest:  # Otherwise moving forward from here is faster
+            self._restore_snapshot(nearest)
+        render, self.render = self.render, False
+        self.play(frame)
+        self.render = render
+        if render:
+            self.game_manager.draw()
+        return self.game_manager
+
+    def _take_snapshot(self) -> dict:
+        game_manager = self.game_manager
+        return {
+            "frame": self.frame,
+            "decision": self.decision,
+            "state": game_manager.state,
+            "bird": copy.copy(game_manager.bird),  # Pipes and birds only hold values and replace their rects
+            "pipes": [copy.copy(pipe) for pipe in game_manager.pipes],
+            "level": game_manager.level,
+            "score": game_manager.score,
+            "pipe_speed": game_manager.pipe_speed,
+            "next_level_score": game_manager.next_level_score,
+            "time_since_last_pipe": game_manager.time_since_last_pipe,
+            "time_between_pipes": game_manager.time_between_pipes,
+            "previous_gap_center": game_manager.previous_gap_center,
+            "rng_state": game_manager.rng.getstate(),
+        }
+
+    def _restore_snapshot(self, frame: int):
+        snapshot = self.snapshots[frame]
+        game_manager = self.game_manager
+        self.frame = snapshot["frame"]
+        self.decision = snapshot["decision"]
+        game_manager.state = snapshot["state"]
+        game_manager.bird = copy.copy(snapshot["bird"])
+        game_manager.pipes = [copy.copy(pipe) for pipe in snapshot["pipes"]]
+        game_manager.level = snapshot["level"]
+        game_manager.score = snapshot["score"]
+        game_manager.pipe_speed = snapshot["pipe_speed"]
+        game_manager.next_level_score = snapshot["next_level_score"]
+        game_manager.time_since_last_pipe = snapshot["time_since_last_pipe"]
+        game_manager.time_between_pipes = snapshot["time_between_pipes"]
+        game_manager.previous_gap_center = snapshot["previous_gap_center"]
+        game_manager.rng.setstate(snapshot["rng_state"])
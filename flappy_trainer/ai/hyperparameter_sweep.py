@@ -0,0 +1,297 @@
+"""
+Hyperparameter Sweep
+
+Runs independent, seeded AITrainer trainings for every configuration of a grid or random search spec
+across a process pool, and collects each run's time-to-score and final evaluation score into a single
+CSV results table.
+
+Every worker process is pinned to its own CPUs and limited to a fixed number of threads before TensorFlow
+is imported, so parallel runs do not fight over cores.
+
+Spec (JSON):
+    {
+        "method": "random",                                 # "grid" or "random"
+        "num_samples": 20,                                  # Random search only
+        "seeds": [0, 1],                                    # Every configuration runs once per seed
+        "target_score": 5,                                  # Score that counts as "reached" for time-to-score
+        "eval_episodes": 10,                                # Greedy evaluation games after training
+        "params": {
+            "action_tick": [10, 15],                        # Lists are grid axes / random choices
+            "init_explore_rate": {"low": 0.3, "high": 0.7}  # Ranges are sampled uniformly (random only)
+        }
+    }
+
+Run from the root directory:
+
+    python -m flappy_trainer.ai.hyperparameter_sweep flappy_trainer/ai/sweep_spec.sample.json --workers 8
+
+Key Features:
+- Grid and random search over AITrainer and curriculum hyperparameters.
+- Seeded runs, so every row of the results table can be reproduced.
+- CPU pinning and per-run thread limits for worker processes.
+- Results are appended as runs finish so a partial sweep is never lost.
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import random
+import time
+import traceback
+
+DEFAULT_PARAMS = {
+    "n_steps": 1,
+    "action_tick": 15,
+    "replay_interval": 45,
+    "batch_size": 32,
+    "gravity_episodes": 2,
+    "gravity_explore_rate": 0.7,
+    "gravity_explore_rate_decay": 0.9937,
+    "gravity_min_explore_rate": 0.25,
+    "num_curricula": 3,
+    "episodes_per_curricula": 600,
+    "init_explore_rate": 0.5,
+    "explore_rate_decay": 0.996,
+    "min_explore_rate": 0.15,
+}
+RESULT_COLUMNS = [
+    "run_id",
+    "seed",
+    *DEFAULT_PARAMS,
+    "time_to_score",
+    "episodes_to_score",
+    "train_seconds",
+    "eval_score_mean",
+    "eval_score_max",
+    "error",
+]
+THREAD_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "TF_NUM_INTRAOP_THREADS",
+    "TF_NUM_INTEROP_THREADS",
+)
+
+
+def expand_spec(spec: dict) -> list[dict]:
+    """
+    Expand a search spec into the list of runs to execute.
+
+    Args:
+        spec: The search spec (see module docstring).
+
+    Returns:
+        list[dict]: One run per configuration and seed, with the full set of hyperparameters.
+    """
+    params = spec.get("params", {})
+    unknown = set(params) - set(DEFAULT_PARAMS)
+    if unknown:
+        raise ValueError(f"Unknown hyperparameters in sweep spec: {sorted(unknown)}.")
+
+    method = spec.get("method", "grid")
+    if method == "grid":
+        for name, values in params.items():
+            if not isinstance(values, list):
+                raise ValueError(f"Grid search needs a list of values for '{name}'.")
+        configurations = [dict(zip(params, values)) for values in itertools.product(*params.values())]
+    elif method == "random":
+        rng = random.Random(spec.get("sample_seed", 0))
+        configurations = [
+            {name: _sample_value(values, rng) for name, values in params.items()}
+            for _ in range(spec.get("num_samples", 10))
+        ]
+    else:
+        raise ValueError(f"Invalid search method: '{method}'. Must be 'grid' or 'random'.")
+
+    runs = []
+    for configuration in configurations:
+        for seed in spec.get("seeds", [0]):
+            runs.append(
+                {
+                    "run_id": len(runs),
+                    "seed": seed,
+                    "params": {**DEFAULT_PARAMS, **configuration},
+                    "target_score": spec.get("target_score", 5),
+                    "eval_episodes": spec.get("eval_episodes", 10),
+                }
+            )
+    return runs
+
+
+def run_trial(run: dict) -> dict:
+    """Train and evaluate one configuration, returning a row of the results table."""
+    row = {"run_id": run["run_id"], "seed": run["seed"], **run["params"]}
+    try:
+        row.update(_train_and_evaluate(run))
+    except Exception:
+        row["error"] = traceback.format_exc(limit=3).strip().splitlines()[-1]
+    return row
+
+
+def run_sweep(runs: list[dict], output_path: str, workers: int, threads_per_run: int = 1) -> list[dict]:
+    """
+    Execute the runs across a process pool and write every finished run to the results table.
+
+    Args:
+        runs: The runs produced by `expand_spec`.
+        output_path: The CSV results table to write.
+        workers: The number of runs to execute at once.
+        threads_per_run: The CPUs (and math library threads) given to each run.
+
+    Returns:
+        list[dict]: The rows of the results table.
+    """
+    context = multiprocessing.get_context("spawn")  # Fresh interpreters, so TensorFlow is loaded after pinning
+    cpu_queue = context.Queue()
+    for cpu_set in _partition_cpus(workers, threads_per_run):
+        cpu_queue.put(cpu_set)
+
+    rows = []
+    with open(output_path, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=RESULT_COLUMNS)
+        writer.writeheader()
+        with context.Pool(workers, initializer=_init_worker, initargs=(cpu_queue, threads_per_run)) as pool:
+            for row in pool.imap_unordered(run_trial, runs):
+                writer.writerow(row)
+                file.flush()
+                rows.append(row)
+                print(
+                    f"Run {row['run_id']} (seed {row['seed']}) finished: "
+                    f"eval score {row.get('eval_score_mean')}, time to score {row.get('time_to_score')}"
+                )
+            # Let the workers exit on their own; terminating a worker with TensorFlow loaded can hang the join
+            pool.close()
+            pool.join()
+    return rows
+
+
+def print_summary(rows: list[dict], top: int = 5):
+    """Print the best runs ordered by evaluation score, then by time to reach the target score."""
+    finished = [row for row in rows if not row.get("error")]
+    finished.sort(key=lambda row: (-row["eval_score_mean"], row["time_to_score"] or math.inf))
+    print(f"{len(finished)} of {len(rows)} runs finished. Best {min(top, len(finished))}:")
+    for row in finished[:top]:
+        params = {name: row[name] for name in DEFAULT_PARAMS if row[name] != DEFAULT_PARAMS[name]}
+        time_to_score = row["time_to_score"]
+        print(f"\tRun {row['run_id']}: eval {row['eval_score_mean']:.2f}, time to score {time_to_score}, {params}")
+
+
+def _train_and_evaluate(run: dict) -> dict:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    import pygame
+
+    # Imported here so the worker's thread limits are in place before TensorFlow is loaded
+    from flappy_trainer.ai.ai_trainer import AITrainer
+
+    params = run["params"]
+    _seed_everything(run["seed"])
+    pygame.init()
+    trainer = AITrainer(
+        n_steps=params["n_steps"],
+        action_tick=params["action_tick"],
+        replay_interval=params["replay_interval"],
+        batch_size=params["batch_size"],
+    )
+
+    start = time.perf_counter()
+    trainer.train_gravity(
+        None,
+        num_episodes=params["gravity_episodes"],
+        explore_rate=params["gravity_explore_rate"],
+        explore_rate_decay=params["gravity_explore_rate_decay"],
+        min_explore_rate=params["gravity_min_explore_rate"],
+    )
+    trainer.train_full_game(
+        num_curricula=params["num_curricula"],
+        episodes_per_curricula=params["episodes_per_curricula"],
+        init_explore_rate=params["init_explore_rate"],
+        explore_rate_decay=params["explore_rate_decay"],
+        min_explore_rate=params["min_explore_rate"],
+        csv_file_name=None,
+    )
+    train_seconds = time.perf_counter() - start
+    scores = trainer.evaluate(run["eval_episodes"])
+    pygame.quit()
+
+    reached = next((ep for ep in trainer.episode_history if ep["score"] >= run["target_score"]), None)
+    return {
+        "time_to_score": reached["elapsed"] if reached else None,
+        "episodes_to_score": reached["episode"] if reached else None,
+        "train_seconds": train_seconds,
+        "eval_score_mean": sum(scores) / len(scores) if scores else 0.0,
+        "eval_score_max": max(scores, default=0),
+    }
+
+
+def _seed_everything(seed: int):
+    """Seed every random number generator a training run draws from."""
+    import numpy as np
+
+    random.seed(seed)
+    np.random.seed(seed)
+    try:
+        import tensorflow as tf
+
+        tf.random.set_seed(seed)
+    except ImportError:
+        pass
+
+
+def _init_worker(cpu_queue, threads_per_run: int):
+    """Limit math library threads and pin the worker to its CPUs before anything heavy is imported."""
+    for var in THREAD_ENV_VARS:
+        os.environ[var] = str(threads_per_run)
+    cpu_set = cpu_queue.get()
+    if cpu_set and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cpu_set)
+
+
+def _partition_cpus(workers: int, threads_per_run: int) -> list[set[int]]:
+    """Split the CPUs available to this process into one disjoint set per worker, where there are enough."""
+    if hasattr(os, "sched_getaffinity"):
+        cpus = sorted(os.sched_getaffinity(0))
+    else:
+        cpus = list(range(os.cpu_count() or 1))
+    if len(cpus) < workers * threads_per_run:
+        return [set() for _ in range(workers)]  # Oversubscribed, leave scheduling to the OS
+    return [set(cpus[i * threads_per_run : (i + 1) * threads_per_run]) for i in range(workers)]
+
+
+def _sample_value(values, rng: random.Random):
+    """Draw one value for a random search: a choice from a list, or uniform (optionally log-uniform) in a range."""
+    if isinstance(values, list):
+        return rng.choice(values)
+    low, high = values["low"], values["high"]
+    if values.get("log"):
+        value = math.exp(rng.uniform(math.log(low), math.log(high)))
+    else:
+        value = rng.uniform(low, high)
+    if isinstance(low, int) and isinstance(high, int):
+        return int(round(value))
+    return value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a hyperparameter sweep over AITrainer configurations.")
+    parser.add_argument("spec", help="Path to the JSON sweep spec.")
+    parser.add_argument("--output", default="sweep-results.csv", help="CSV results table to write.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Runs to execute at once.")
+    parser.add_argument("--threads-per-run", type=int, default=1, help="CPUs and math threads per run.")
+    args = parser.parse_args()
+
+    with open(args.spec) as file:
+        runs = expand_spec(json.load(file))
+    print(f"Running {len(runs)} trainings across {args.workers} workers.")
+    rows = run_sweep(runs, args.output, args.workers, args.threads_per_run)
+    print_summary(rows)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
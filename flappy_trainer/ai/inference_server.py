@@ -0,0 +1,443 @@
+"""
+InferenceServer
+
+One process holds the policy and answers action requests from many game and evaluation processes, so the
+workers do not each load their own copy of TensorFlow. Clients connect to a Unix socket
+(`InferenceClient.connect`) or are handed one end of a multiprocessing pipe (`InferenceServer.connect_pipe`),
+send encoded observations and block until their actions come back.
+
+Requests are batched dynamically. The first request opens a batch, and the batch is run as one forward pass
+once it holds `max_batch_size` observations or `max_latency` seconds after it opened, whichever comes first.
+Thousands of single-observation `predict` calls become a few large ones, and a lone client waits at most
+`max_latency` longer than its forward pass.
+
+Weights can be swapped while clients play, either in the server process (`set_weights`) or from any client.
+A swap lands between batches, so every batch is answered by a single set of weights.
+
+Run from the root directory:
+
+    python -m flappy_trainer.ai.inference_server flappy_trainer/ai/models/flappy_trainer_model.keras
+    python -m flappy_trainer.ai.inference_server best_weights.npz --swap
+
+Key Features:
+- One model in memory for any number of client processes.
+- Dynamic batching with a max-latency deadline.
+- Hot-swapping of weights without restarting the server or its clients.
+- Restarts on the socket path of a crashed server, whose socket file is left behind.
+- Raw float32 buffers on the wire, no pickling of observations, actions or weights.
+- A TensorFlow-free NumPy policy, e.g. for networks from the NeuroevolutionTrainer.
+"""
+
+import argparse
+import io
+import multiprocessing
+import os
+import socket
+import stat
+import tempfile
+import threading
+import time
+from multiprocessing.connection import Client, Connection, Listener, wait
+
+import numpy as np
+
+from flappy_trainer.ai.ai_utils import Action
+from flappy_trainer.ai.environment_state import EnvironmentState
+from flappy_trainer.ai.state_encoder import StateEncoder
+
+DEFAULT_ADDRESS = os.path.join(tempfile.gettempdir(), "flappy_trainer_inference.sock")
+POLL_INTERVAL = 0.1  # Seconds between checks for a stop while no requests arrive
+
+# The first byte of every message
+PREDICT = b"P"  # Client: float32 observations, one row per game
+SET_WEIGHTS = b"W"  # Client: weights as a NumPy `.npz` archive
+REPLY = b"A"  # Server: uint8 Action values, one per observation, or empty for a swap
+ERROR = b"E"  # Server: an error message
+
+
+class NumpyPolicy:
+    """The agent's MLP as a NumPy forward pass, from weights in Keras `get_weights` order: [W1, b1, W2, b2, ...]."""
+
+    def __init__(self, weights: list[np.ndarray]):
+        self.set_weights(weights)
+
+    def get_weights(self) -> list[np.ndarray]:
+        return [layer for weights_and_biases in self.layers for layer in weights_and_biases]
+
+    def set_weights(self, weights: list[np.ndarray]):
+        weights = [np.asarray(layer, dtype=np.float32) for layer in weights]
+        self.layers = list(zip(weights[::2], weights[1::2]))
+
+    def predict(self, observations: np.ndarray) -> np.ndarray:
+        """The Q-values of a (n, features) batch of observations."""
+        hidden = observations
+        for index, (weights, biases) in enumerate(self.layers):
+            hidden = hidden @ weights + biases
+            if index < len(self.layers) - 1:
+                np.maximum(hidden, 0, out=hidden)  # ReLU
+        return hidden
+
+
+class KerasPolicy:
+    """A saved Keras model, such as the ones in `flappy_trainer/ai/models`. Imports TensorFlow."""
+
+    def __init__(self, model_path: str):
+        from tensorflow.keras.models import load_model
+
+        self.model = load_model(model_path)
+
+    def get_weights(self) -> list[np.ndarray]:
+        return self.model.get_weights()
+
+    def set_weights(self, weights: list[np.ndarray]):
+        self.model.set_weights(weights)
+
+    def predict(self, observations: np.ndarray) -> np.ndarray:
+        """The Q-values of a (n, features) batch of observations."""
+        return np.asarray(self.model.predict_on_batch(observations))
+
+
+def load_weights(path: str) -> list[np.ndarray]:
+    """Weights in Keras `get_weights` order from a `.npz` archive (`NeuroevolutionTrainer.save_weights`) or a model."""
+    if path.endswith(".npz"):
+        return _unpack_weights(path)
+    return KerasPolicy(path).model.get_weights()
+
+
+def load_policy(path: str) -> NumpyPolicy | KerasPolicy:
+    """A NumpyPolicy for a `.npz` archive of weights, otherwise a KerasPolicy."""
+    return NumpyPolicy(_unpack_weights(path)) if path.endswith(".npz") else KerasPolicy(path)
+
+
+class InferenceServer:
+    def __init__(
+        self,
+        policy,
+        address: str | None = None,
+        max_batch_size: int = 1024,
+        max_latency: float = 0.002,
+        num_features: int = EnvironmentState.get_num_features(),
+    ):
+        """
+        Args:
+            policy: Anything with `predict(observations) -> q_values` for a (n, num_features) float32 batch,
+                `get_weights()` and `set_weights(weights)`, e.g. a NumpyPolicy or KerasPolicy.
+            address: The Unix socket path to listen on, None to only serve pipe clients.
+            max_batch_size: Run a batch as soon as it holds this many observations.
+            max_latency: Run a batch at most this many seconds after its first request arrived.
+            num_features: The features of every observation.
+        """
+        self.policy = policy
+        self.address = address
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.num_features = num_features
+        self.num_batches = 0
+        self.num_observations = 0
+        self._row_size = num_features * np.dtype(np.float32).itemsize
+        if address:
+            _remove_stale_socket(address)
+        self._listener = Listener(address) if address else None
+        self._connections: list[Connection] = []
+        self._pending_weights: list[np.ndarray] | None = None  # Set by `set_weights`, applied between batches
+        self._lock = threading.Lock()
+        self._wake_receiver, self._wake_sender = multiprocessing.Pipe(duplex=False)  # Interrupts the wait
+        self._stopped = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    def __enter__(self) -> "InferenceServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self) -> "InferenceServer":
+        """Serve in background threads of this process."""
+        self._start_accepting()
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+        return self
+
+    def serve_forever(self):
+        """Answer requests until `stop` is called."""
+        self._start_accepting()
+        while not self._stopped.is_set():
+            self._serve_batch()
+
+    def stop(self):
+        """Stop serving and close every connection."""
+        self._stopped.set()
+        self._wake()
+        if self._listener is not None and any(thread.is_alive() for thread in self._threads):
+            try:
+                Client(self.address).close()  # Unblocks `accept`
+            except OSError:
+                pass
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join()
+        self._threads.clear()
+        if self._listener is not None:
+            self._listener.close()
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+
+    def connect_pipe(self) -> Connection:
+        """Create a pipe client and return its end, to hand to a worker process (see `InferenceClient`)."""
+        server_end, client_end = multiprocessing.Pipe()
+        self.add_connection(server_end)
+        return client_end
+
+    def add_connection(self, connection: Connection):
+        """Serve the requests sent over `connection`."""
+        with self._lock:
+            self._connections.append(connection)
+        self._wake()
+
+    def set_weights(self, weights: list[np.ndarray]):
+        """
+        Swap the policy's weights before the next batch. Safe to call from any thread. Weights that do not fit
+        the policy are discarded, keeping the current ones.
+        """
+        with self._lock:
+            self._pending_weights = weights
+        self._wake()
+
+    def _start_accepting(self):
+        """Accept socket clients in a background thread, once."""
+        if self._listener is None or any(thread.name == "accept" for thread in self._threads):
+            return
+        thread = threading.Thread(target=self._accept_forever, name="accept", daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def _accept_forever(self):
+        while not self._stopped.is_set():
+            try:
+                connection = self._listener.accept()
+            except OSError:
+                return
+            if self._stopped.is_set():
+                connection.close()
+                return
+            self.add_connection(connection)
+
+    def _wake(self):
+        self._wake_sender.send_bytes(b"")
+
+    def _serve_batch(self):
+        """Collect requests until the batch is full or its deadline passes, then answer them."""
+        self._apply_pending_weights()
+        requests: list[tuple[Connection, memoryview]] = []
+        num_rows = 0
+        deadline = None
+        while num_rows < self.max_batch_size and not self._stopped.is_set():
+            timeout = POLL_INTERVAL if deadline is None else deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            with self._lock:
+                connections = [self._wake_receiver, *self._connections]
+            ready = wait(connections, timeout)
+            if not ready and deadline is None:
+                return
+            for connection in ready:
+                if connection is self._wake_receiver:
+                    connection.recv_bytes()
+                    if self._pending_weights is not None:
+                        self._run_batch(requests)  # Answered with the old weights
+                        requests, num_rows, deadline = [], 0, None
+                        self._apply_pending_weights()
+                    continue
+                message = self._receive(connection)
+                if message is None:
+                    continue
+                kind, payload = message[:1], message[1:]
+                if kind == PREDICT and len(payload) % self._row_size == 0:
+                    requests.append((connection, payload))
+                    num_rows += len(payload) // self._row_size
+                    if deadline is None:
+                        deadline = time.monotonic() + self.max_latency
+                elif kind == SET_WEIGHTS:
+                    # Answer the requests that arrived before the swap with the old weights
+                    self._run_batch(requests)
+                    requests, num_rows, deadline = [], 0, None
+                    try:
+                        error = self._swap_weights(_unpack_weights(io.BytesIO(payload)))
+                    except Exception as unpack_error:
+                        error = f"Invalid weights archive: {unpack_error}"
+                    self._send(connection, REPLY if error is None else ERROR + error.encode())
+                else:
+                    self._send(connection, ERROR + f"Invalid request of {len(message)} bytes.".encode())
+        self._run_batch(requests)
+
+    def _run_batch(self, requests: list[tuple[Connection, memoryview]]):
+        """Run one forward pass over every request and send each its actions."""
+        if not requests:
+            return
+        observations = np.frombuffer(b"".join(payload for _, payload in requests), dtype=np.float32)
+        observations = observations.reshape(-1, self.num_features)
+        try:
+            q_values = self.policy.predict(observations)
+        except Exception as error:
+            for connection, _ in requests:
+                self._send(connection, ERROR + f"Prediction failed: {error}".encode())
+            return
+        actions = np.where(q_values[:, 0] > q_values[:, 1], Action.FLAP.value, Action.NO_FLAP.value)
+        actions = actions.astype(np.uint8)
+        first_row = 0
+        for connection, payload in requests:
+            last_row = first_row + len(payload) // self._row_size
+            self._send(connection, REPLY + actions[first_row:last_row].tobytes())
+            first_row = last_row
+        self.num_batches += 1
+        self.num_observations += len(observations)
+
+    def _apply_pending_weights(self):
+        with self._lock:
+            weights, self._pending_weights = self._pending_weights, None
+        if weights is not None:
+            error = self._swap_weights(weights)
+            if error is not None:
+                print(f"Discarded weights: {error}")
+
+    def _swap_weights(self, weights: list[np.ndarray]) -> str | None:
+        """Give the policy new weights, keeping the old ones if they do not fit. Returns the error, if any."""
+        current_weights = self.policy.get_weights()
+        shapes = [np.shape(layer) for layer in weights]
+        expected_shapes = [np.shape(layer) for layer in current_weights]
+        if shapes != expected_shapes:
+            return f"Weights of shapes {shapes} do not fit the policy's {expected_shapes}."
+        try:
+            self.policy.set_weights(weights)
+        except Exception as error:
+            self.policy.set_weights(current_weights)
+            return f"Setting weights failed: {error}"
+        return None
+
+    def _receive(self, connection: Connection) -> memoryview | None:
+        """The next message from a client, None if it disconnected."""
+        try:
+            return memoryview(connection.recv_bytes())
+        except (EOFError, OSError):
+            self._remove_connection(connection)
+            return None
+
+    def _send(self, connection: Connection, message: bytes):
+        try:
+            connection.send_bytes(message)
+        except OSError:
+            self._remove_connection(connection)
+
+    def _remove_connection(self, connection: Connection):
+        with self._lock:
+            if connection in self._connections:
+                self._connections.remove(connection)
+        connection.close()
+
+
+class InferenceClient:
+    """A game or evaluation process's handle on an InferenceServer. Drop-in for an agent's `choose_action`."""
+
+    def __init__(self, connection: Connection):
+        """
+        Args:
+            connection: A connection to the server, e.g. the end returned by `InferenceServer.connect_pipe`.
+        """
+        self.connection = connection
+        self._state_buffer = StateEncoder.allocate(1)  # Reused by every decision
+
+    @classmethod
+    def connect(cls, address: str = DEFAULT_ADDRESS) -> "InferenceClient":
+        """Connect to a server listening on the Unix socket `address`."""
+        return cls(Client(address))
+
+    def choose_action(self, state: EnvironmentState) -> Action:
+        """The server policy's greedy action for one state."""
+        StateEncoder.encode_state(state, self._state_buffer[0], state.config)
+        return Action(int(self.predict_actions(self._state_buffer)[0]))
+
+    def predict_actions(self, observations: np.ndarray) -> np.ndarray:
+        """The Action values (1 = FLAP, 0 = NO_FLAP) for a (n, features) batch of encoded observations."""
+        observations = np.ascontiguousarray(observations, dtype=np.float32)
+        return np.frombuffer(self._request(PREDICT + observations.tobytes()), dtype=np.uint8)
+
+    def set_weights(self, weights: list[np.ndarray]):
+        """
+        Swap the server's weights. Requests sent after this returns are answered with the new weights. Throws
+        RuntimeError if the server rejects them, e.g. for shapes that do not fit its policy.
+        """
+        archive = io.BytesIO()
+        np.savez(archive, *weights)
+        self._request(SET_WEIGHTS + archive.getvalue())
+
+    def close(self):
+        self.connection.close()
+
+    def _request(self, message: bytes) -> bytes:
+        """Send a message and return the server's reply without its kind. Throws RuntimeError on an error reply."""
+        self.connection.send_bytes(message)
+        reply = self.connection.recv_bytes()
+        if reply[:1] == ERROR:
+            raise RuntimeError(reply[1:].decode())
+        return reply[1:]
+
+
+def _unpack_weights(file) -> list[np.ndarray]:
+    """The arrays of an `np.savez(file, *weights)` archive, in order."""
+    with np.load(file, allow_pickle=False) as archive:
+        return [archive[f"arr_{index}"] for index in range(len(archive.files))]
+
+
+def _remove_stale_socket(address: str):
+    """Remove the socket file a crashed server left at `address`, unless a server is still listening on it."""
+    try:
+        if not stat.S_ISSOCK(os.stat(address).st_mode):
+            return
+    except FileNotFoundError:
+        return
+    probe = socket.socket(socket.AF_UNIX)
+    try:
+        probe.connect(address)
+    except ConnectionRefusedError:
+        os.unlink(address)
+    finally:
+        probe.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a policy's actions to many game processes.")
+    parser.add_argument("model", help="A Keras model or a `.npz` archive of weights.")
+    parser.add_argument("--address", default=DEFAULT_ADDRESS, help="Unix socket path to listen on.")
+    parser.add_argument("--max-batch-size", type=int, default=1024, help="Observations per forward pass.")
+    parser.add_argument("--max-latency-ms", type=float, default=2.0, help="Longest wait for a batch to fill.")
+    parser.add_argument("--swap", action="store_true", help="Send the weights to a running server instead.")
+    args = parser.parse_args()
+
+    if args.swap:
+        client = InferenceClient.connect(args.address)
+        client.set_weights(load_weights(args.model))
+        client.close()
+        print(f"Swapped in the weights of {args.model}.")
+        return
+
+    server = InferenceServer(load_policy(args.model), args.address, args.max_batch_size, args.max_latency_ms / 1000)
+    print(f"Serving {args.model} on {args.address}. Press Ctrl+C to stop.")
+    start_time = time.perf_counter()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+    elapsed = time.perf_counter() - start_time
+    print(
+        f"Answered {server.num_observations} observations in {server.num_batches} batches "
+        f"({server.num_observations / max(server.num_batches, 1):.1f} per batch, {elapsed:.0f}s)."
+    )
+
+
+if __name__ == "__main__":
+    main()
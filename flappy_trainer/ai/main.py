@@ -1,45 +1,33 @@
 import os
 import random
-import time
 
 import pygame
 
 from flappy_trainer.ai.ai_trainer import AITrainer  # noqa: F401
-from flappy_trainer.ai.ai_utils import Action, get_current_state
+from flappy_trainer.ai.curriculum_scheduler import CurriculumScheduler  # noqa: F401
+from flappy_trainer.ai.demonstrations import load_demonstrations, pretrain_agent  # noqa: F401
+from flappy_trainer.ai.neuroevolution_trainer import NeuroevolutionTrainer  # noqa: F401
 from flappy_trainer.ai.reinforcement_learning_agent import ReinforcementLearningAgent
+from flappy_trainer.ai.spectator import Spectator
+from flappy_trainer.ai.tabular_q_agent import TabularQAgent  # noqa: F401
 from flappy_trainer.game_managers.game_manager import GameManager
-from flappy_trainer.utils import GameState
 
 """############################### OBSERVE AN EXISTING MODEL ################################"""
+# Keys 1-4 watch at 1x, 4x, 16x or unthrottled speed, N skips to the next death and ESC stops watching
 MODELS_DIR = "flappy_trainer/ai/models"
 NAME_OF_MODEL = "flappy_trainer_model.keras"
 MODEL_PATH = os.path.join(MODELS_DIR, NAME_OF_MODEL)
 random.seed(42)
 pygame.init()
 agent = ReinforcementLearningAgent(MODEL_PATH)
+# Decide with a TFLite export instead: python -m flappy_trainer.ai.tflite_export MODEL_PATH --states ... --int8
+# agent = ReinforcementLearningAgent(MODEL_PATH, tflite_model_path=MODEL_PATH.replace(".keras", ".int8.tflite"))
 agent.set_exploration_rate(0.0)
-game_manager = GameManager(True, "random", "random", "random")
+game_manager = GameManager(True, "random", "random", "random", dirty_rect_rendering=True)
 
-while True:
-    game_manager.start_game()
-    current_frame = 0
-    start_time = time.time()
-
-    while game_manager.state is GameState.RUNNING:
-        frame_start = time.time()
-        game_manager.draw()
-        game_manager.update(1 / 60)
-        current_frame += 1
-
-        if current_frame == 1 or current_frame % 15 == 0:
-            current_state = get_current_state(game_manager)
-            action = agent.choose_action(current_state)
-            if action == Action.FLAP:
-                game_manager.bird.flap()
-
-        # Maintain 60 FPS
-        elapsed = time.time() - frame_start
-        time.sleep(max(0, (1 / 60) - elapsed))
+spectator = Spectator(agent, game_manager)
+spectator.watch()
+pygame.quit()
 
 
 """################################ TRAIN AN EXISTING MODEL #################################"""
@@ -107,3 +95,92 @@ while True:
 # model.save(MODEL_PATH)
 # print(f"Model saved to {MODEL_PATH}")
 # pygame.quit()
+
+
+"""################### TRAIN A NEW MODEL ON A SCHEDULED CURRICULUM FROM SCRATCH ###################"""
+# MODELS_DIR = "flappy_trainer/ai/models"
+# NAME_OF_MODEL = "my_new_model.keras"
+# MODEL_PATH = os.path.join(MODELS_DIR, NAME_OF_MODEL)
+# OUTPUT_FILE = "curriculum-training-output"
+# random.seed(42)
+# pygame.init()
+
+# trainer = AITrainer()
+# trainer.train_curriculum(
+#     num_episodes=3000,
+#     init_explore_rate=0.5,
+#     explore_rate_decay=0.996,
+#     min_explore_rate=0.15,
+#     csv_file_name=OUTPUT_FILE,
+#     scheduler=CurriculumScheduler(advance_threshold=1000, fallback_threshold=250),
+# )
+# model = trainer.agent.model
+
+# model.save(MODEL_PATH)
+# print(f"Model saved to {MODEL_PATH}")
+# pygame.quit()
+
+
+"""################ WARM START A NEW MODEL FROM HUMAN DEMONSTRATIONS, THEN TRAIN IT ################"""
+# Record demonstrations by playing: python -m flappy_trainer.main --record flappy_trainer/ai/demos/session.demo
+# MODELS_DIR = "flappy_trainer/ai/models"
+# NAME_OF_MODEL = "my_new_model.keras"
+# MODEL_PATH = os.path.join(MODELS_DIR, NAME_OF_MODEL)
+# DEMONSTRATIONS_PATH = "flappy_trainer/ai/demos/session.demo"
+# OUTPUT_FILE = "full-training-output"
+# random.seed(42)
+# pygame.init()
+
+# trainer = AITrainer()
+# seed, frames = load_demonstrations(DEMONSTRATIONS_PATH)
+# pretrain_agent(trainer.agent, frames, action_tick=trainer.action_tick, epochs=10)
+# trainer.train_full_game(
+#     num_curricula=3,
+#     episodes_per_curricula=600,
+#     init_explore_rate=0.2,
+#     explore_rate_decay=0.996,
+#     min_explore_rate=0.1,
+#     csv_file_name=OUTPUT_FILE
+# )
+# model = trainer.agent.model
+
+# model.save(MODEL_PATH)
+# print(f"Model saved to {MODEL_PATH}")
+# pygame.quit()
+
+
+"""########################## EVOLVE A NEW MODEL WITH NEUROEVOLUTION ##########################"""
+# MODELS_DIR = "flappy_trainer/ai/models"
+# NAME_OF_MODEL = "neuroevolution_model.keras"
+# MODEL_PATH = os.path.join(MODELS_DIR, NAME_OF_MODEL)
+# pygame.init()
+
+# trainer = NeuroevolutionTrainer(population_size=1000, seed=42)
+# trainer.train(num_generations=100)
+
+# trainer.save_model(MODEL_PATH)
+# print(f"Model saved to {MODEL_PATH}")
+# pygame.quit()
+
+
+"""############################ TRAIN A TABULAR Q-LEARNING BASELINE ############################"""
+# MODELS_DIR = "flappy_trainer/ai/models"
+# NAME_OF_TABLE = "tabular_q_table.npy"
+# TABLE_PATH = os.path.join(MODELS_DIR, NAME_OF_TABLE)
+# OUTPUT_FILE = "tabular-training-output"
+# random.seed(42)
+# pygame.init()
+
+# trainer = AITrainer(agent=TabularQAgent(TABLE_PATH))
+# trainer.train_full_game(
+#     num_curricula=3,
+#     episodes_per_curricula=600,
+#     init_explore_rate=0.5,
+#     explore_rate_decay=0.996,
+#     min_explore_rate=0.15,
+#     csv_file_name=OUTPUT_FILE
+# )
+
+# trainer.agent.save(TABLE_PATH)
+# print(f"Q-table saved to {TABLE_PATH}")
+# pygame.quit()
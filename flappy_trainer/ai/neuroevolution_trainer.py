@@ -0,0 +1,187 @@
+"""
+NeuroevolutionTrainer
+
+A gradient-free alternative to the AITrainer. A population of networks with the same MLP shape as
+`ReinforcementLearningAgent._create_model` is evolved with a genetic algorithm: every generation the whole
+population plays one shared pipe course in a `VectorizedEnvironment`, the birds that survive longest are
+kept as elites, and the rest of the population is replaced by mutated copies of the elites.
+
+All population members are evaluated at once. Their weights are stacked along a leading population axis,
+so one batched NumPy forward pass decides the actions of every bird on each action tick.
+
+Key Features:
+- Evaluates thousands of birds per generation without TensorFlow.
+- Elitism with Gaussian mutation, a simple genetic algorithm with no gradients or replay memory.
+- Fitness is frames survived on a course shared by the whole generation, so birds are compared fairly.
+- Exports the best network as NumPy weights or as a Keras model the ReinforcementLearningAgent can load.
+- Optionally draws every generation live, each bird colored by the elite it descends from.
+- Optional physics domain randomization, with the drawn physics optionally part of the network's input.
+"""
+
+import numpy as np
+
+from flappy_trainer.ai.environment_state import EnvironmentState
+from flappy_trainer.ai.population_renderer import PopulationRenderer
+from flappy_trainer.ai.state_encoder import StateEncoder
+from flappy_trainer.ai.vectorized_environment import PhysicsRanges, VectorizedEnvironment
+
+# Same MLP as ReinforcementLearningAgent._create_model: features -> 128 -> 64 -> 32 -> Q(FLAP), Q(NO_FLAP)
+LAYER_SIZES = (EnvironmentState.get_num_features(), 128, 64, 32, 2)
+
+
+class NeuroevolutionTrainer:
+    def __init__(
+        self,
+        population_size: int = 1000,
+        elite_fraction: float = 0.05,
+        mutation_std: float = 0.02,
+        action_tick: int = 15,
+        seed: int | None = None,
+        physics_ranges: PhysicsRanges | None = None,
+        observe_physics: bool = False,
+    ):
+        """
+        Args:
+            physics_ranges: Ranges every bird's physics are drawn from for each generation, so the network learns
+                to fly any tuning in them. None plays every game with the default config.
+            observe_physics: If True the network also sees each bird's physics, appended to its features.
+        """
+        self.physics_ranges = physics_ranges
+        self.observe_physics = observe_physics
+        # The MLP's input is as wide as the observations of the environments it plays
+        self.layer_sizes = (VectorizedEnvironment.get_num_features(observe_physics), *LAYER_SIZES[1:])
+        self.population_size = population_size
+        self.num_elites = max(1, int(population_size * elite_fraction))
+        self.mutation_std = mutation_std
+        self.action_tick = action_tick  # 15 = 4 actions per second (60 fps), the same as the AITrainer
+        self.rng = np.random.default_rng(seed)
+        self.weights, self.biases = self._initialize_population()
+        self.lineages = np.arange(population_size)  # The elite rank each member descends from, for coloring
+        self.best_weights: list[np.ndarray] | None = None  # Keras `get_weights` order: [W1, b1, W2, b2, ...]
+        self.best_fitness = -1
+
+    def train(
+        self,
+        num_generations: int,
+        max_frames_per_episode: int = 3000,
+        is_pipes: bool = True,
+        pipe_gap_size_mode: str = "random",
+        pipe_distance_mode: str = "random",
+        pipe_gap_loc_mode: str = "random",
+        render: bool = False,
+    ) -> list[np.ndarray]:
+        """
+        Evolve the population until a bird survives `max_frames_per_episode` frames or the generations run out.
+        With `render`, every generation is drawn live in a window. Every bird plays each generation with its own
+        physics drawn from the trainer's `physics_ranges`, if it has them.
+
+        Returns:
+            list[np.ndarray]: The weights of the best network found, in Keras `get_weights` order.
+        """
+        env = VectorizedEnvironment(
+            self.population_size,
+            is_pipes,
+            pipe_gap_size_mode,
+            pipe_distance_mode,
+            pipe_gap_loc_mode,
+            shared_course=True,
+            seed=int(self.rng.integers(2**32)),
+            physics_ranges=self.physics_ranges,
+            observe_physics=self.observe_physics,
+        )
+        renderer = PopulationRenderer(config=env.config) if render else None
+
+        print(f"Begin Neuroevolution: {num_generations} generations of {self.population_size} birds.")
+        for generation in range(num_generations):
+            fitness = self.evaluate_population(env, max_frames_per_episode, renderer)
+            best = int(fitness.argmax())
+            if fitness[best] > self.best_fitness:
+                self.best_fitness = int(fitness[best])
+                self.best_weights = self._get_member_weights(best)
+            print(
+                f"Generation: {generation + 1}, Best Frames: {fitness[best]}, "
+                f"Mean Frames: {fitness.mean():.1f}, Best Score: {env.score.max()}"
+            )
+            if fitness[best] >= max_frames_per_episode:
+                print(f"Solved in {generation + 1} generations.")
+                break
+            self._next_generation(fitness)
+        return self.best_weights
+
+    def evaluate_population(
+        self, env: VectorizedEnvironment, max_frames: int, renderer: PopulationRenderer | None = None
+    ) -> np.ndarray:
+        """Play one game per member on a fresh course and return the frames each survived. Draws it with `renderer`."""
+        if env.num_features != self.layer_sizes[0]:
+            raise ValueError(
+                f"The environment observes {env.num_features} features, the networks take {self.layer_sizes[0]}."
+            )
+        env.reset()
+        observations = np.zeros((self.population_size, env.num_features), dtype=np.float32)
+        flap = np.zeros(self.population_size, dtype=bool)
+        for current_frame in range(1, max_frames + 1):
+            env.step(flap)
+            flap[:] = False
+            if not env.alive.any():
+                break
+            if renderer:
+                renderer.draw(env, self.lineages)
+
+            # Assess game on the first frame and every action tick
+            if current_frame == 1 or current_frame % self.action_tick == 0:
+                q_values = self.predict(StateEncoder.encode_vectorized(env, observations))
+                flap = (q_values[:, 0] > q_values[:, 1]) & env.alive
+        return env.frames.copy()
+
+    def predict(self, observations: np.ndarray) -> np.ndarray:
+        """Batched forward pass: row i of `observations` goes through member i's network."""
+        hidden = observations[:, None, :]
+        for layer, (weights, biases) in enumerate(zip(self.weights, self.biases)):
+            hidden = hidden @ weights + biases[:, None, :]
+            if layer < len(self.weights) - 1:
+                np.maximum(hidden, 0, out=hidden)  # ReLU
+        return hidden[:, 0, :]
+
+    def save_weights(self, path: str):
+        """Save the best network's weights as a NumPy `.npz` archive."""
+        np.savez(path, *self.best_weights)
+
+    def save_model(self, path: str):
+        """Save the best network as a Keras model that `ReinforcementLearningAgent(path)` can load."""
+        if self.observe_physics:
+            raise ValueError("The agent does not observe physics; save a network that does with save_weights.")
+        from flappy_trainer.ai.reinforcement_learning_agent import ReinforcementLearningAgent
+
+        agent = ReinforcementLearningAgent()
+        agent.model.set_weights(self.best_weights)
+        agent.model.save(path)
+
+    def _initialize_population(self) -> tuple[list[np.ndarray], list[np.ndarray]]:
+        """Glorot uniform weights and zero biases, like Keras `Dense` layers, for every member."""
+        weights, biases = [], []
+        for fan_in, fan_out in zip(self.layer_sizes, self.layer_sizes[1:]):
+            limit = np.sqrt(6 / (fan_in + fan_out))
+            shape = (self.population_size, fan_in, fan_out)
+            weights.append(self.rng.uniform(-limit, limit, shape).astype(np.float32))
+            biases.append(np.zeros((self.population_size, fan_out), dtype=np.float32))
+        return weights, biases
+
+    def _get_member_weights(self, member: int) -> list[np.ndarray]:
+        """Copy one member's network out of the population, in Keras `get_weights` order."""
+        member_weights = []
+        for weights, biases in zip(self.weights, self.biases):
+            member_weights.extend([weights[member].copy(), biases[member].copy()])
+        return member_weights
+
+    def _next_generation(self, fitness: np.ndarray):
+        """Keep the elites and refill the population with mutated copies of them."""
+        elites = np.argsort(-fitness, kind="stable")[: self.num_elites]
+        child_lineages = self.rng.choice(self.num_elites, self.population_size - self.num_elites)
+        self.lineages = np.concatenate([np.arange(self.num_elites), child_lineages])
+        parents = elites[self.lineages]
+        for params in (self.weights, self.biases):
+            for i, layer in enumerate(params):
+                layer = layer[parents]
+                noise = self.rng.standard_normal(layer[self.num_elites :].shape, dtype=np.float32)
+                layer[self.num_elites :] += noise * self.mutation_std
+                params[i] = layer
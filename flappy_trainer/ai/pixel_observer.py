@@ -0,0 +1,107 @@
+"""
+PixelObserver
+
+Pixel observations of a game, for training convolutional agents as an alternative to the hand-built
+`EnvironmentState` features. The game is drawn to an offscreen surface, never to the display; observe a
+`GameManager(headless=True)` to have no window at all. The surface is read in place through
+`pygame.surfarray.pixels3d`, then grayscaled and downsampled in NumPy straight into a preallocated ring of
+the most recent frames.
+
+An observation is the ring in time order, oldest frame first: a (stack_size, height, width) uint8 array
+that is also preallocated and overwritten by every call.
+
+Key Features:
+- Offscreen rendering of the bird and pipes over the cached background, without the HUD or debug overlays. Like the
+  GameManager's dirty-rect mode, only the areas drawn last frame are erased.
+- Zero-copy pixel access; downsampling is a strided view, so only the kept pixels are read.
+- Integer luma grayscale into reused buffers, with no allocation per frame.
+- Frame stacking in a ring buffer, filled with the first frame on reset.
+"""
+
+import numpy as np
+import pygame
+
+from flappy_trainer.game_managers.game_manager import GameManager
+
+# ITU-R BT.601 luma weights, scaled to sum to 256
+LUMA_WEIGHTS = np.array([77, 150, 29], dtype=np.uint16)
+
+
+class PixelObserver:
+    def __init__(self, game_manager: GameManager, downsample: int = 8, stack_size: int = 4):
+        """
+        Args:
+            game_manager: The game to observe.
+            downsample: Keep every `downsample`-th pixel in both directions.
+            stack_size: The number of most recent frames in an observation.
+        """
+        self.game_manager = game_manager
+        self.downsample = downsample
+        self.stack_size = stack_size
+        self.surface = pygame.Surface(game_manager.screen.get_size(), depth=32)
+        width, height = self.surface.get_size()
+        self.width = -(-width // downsample)
+        self.height = -(-height // downsample)
+
+        self.frames = np.zeros((stack_size, self.height, self.width), dtype=np.uint8)  # The ring
+        self.newest = stack_size - 1
+        self.observation = np.zeros_like(self.frames)
+        self._luma = np.zeros((self.width, self.height), dtype=np.uint16)  # Surfarrays are indexed [x, y]
+        self._channel = np.zeros_like(self._luma)
+        self._drawn_rects: list[pygame.Rect] | None = None  # Areas drawn last frame, None to redraw everything
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        return self.frames.shape
+
+    def reset(self) -> np.ndarray:
+        """Fill every frame of the stack with the current game, e.g. after `start_game`, and return it."""
+        self._drawn_rects = None
+        self.render()
+        self.newest = 0
+        self._preprocess(self.frames[0])
+        self.frames[1:] = self.frames[0]
+        return self.get_observation()
+
+    def observe(self) -> np.ndarray:
+        """Render the current game, push it onto the stack and return the stacked observation."""
+        self.render()
+        self.newest = (self.newest + 1) % self.stack_size
+        self._preprocess(self.frames[self.newest])
+        return self.get_observation()
+
+    def render(self):
+        """Draw the bird and pipes over the background onto the offscreen surface."""
+        game_manager = self.game_manager
+        if self._drawn_rects is None:
+            self.surface.blit(game_manager.background, (0, 0))
+        else:
+            for rect in self._drawn_rects:
+                self.surface.blit(game_manager.background, rect, rect)
+
+        # Never with debug overlays, which are not part of the game
+        drawn_rects = [game_manager.bird.draw(self.surface, debug=False)] if game_manager.bird is not None else []
+        drawn_rects.extend(pipe.draw(self.surface, debug=False) for pipe in game_manager.pipes)
+        self._drawn_rects = drawn_rects
+
+    def get_observation(self) -> np.ndarray:
+        """The stacked frames, oldest first. The returned array is reused by the next call."""
+        oldest = (self.newest + 1) % self.stack_size
+        self.observation[: self.stack_size - oldest] = self.frames[oldest:]
+        self.observation[self.stack_size - oldest :] = self.frames[:oldest]
+        return self.observation
+
+    def _preprocess(self, out: np.ndarray):
+        """Grayscale and downsample the offscreen surface into `out`, a (height, width) uint8 frame."""
+        pixels = pygame.surfarray.pixels3d(self.surface)  # A view of the surface, locked while the view lives
+        try:
+            sampled = pixels[:: self.downsample, :: self.downsample]
+            luma, channel = self._luma, self._channel
+            np.multiply(sampled[..., 0], LUMA_WEIGHTS[0], out=luma)
+            for index in (1, 2):
+                np.multiply(sampled[..., index], LUMA_WEIGHTS[index], out=channel)
+                luma += channel
+            luma >>= 8
+            np.copyto(out.T, luma, casting="unsafe")
+        finally:
+            del pixels
@@ -0,0 +1,129 @@
+"""
+PopulationRenderer
+
+Draws every bird of a `VectorizedEnvironment` at once, translucent, against one pipe course, so a
+neuroevolution population or a batch of parallel actors can be watched live. The pipes drawn are those of
+the first bird still alive, which are everyone's pipes when the environment uses a shared course.
+
+The bird frames are tinted once per color when the renderer is created. Drawing a frame then only gathers
+the cached frame and position of every living bird and hands them to one `Surface.blits` call.
+
+Key Features:
+- Birds colored by score, from blue (lowest) to red (the best bird), or by caller-supplied groups such as
+  the policy or lineage a bird belongs to.
+- One cached, pre-tinted set of bird frames per color; all birds drawn with a single batched blit.
+- HUD with the number of birds alive and the best score.
+"""
+
+import colorsys
+
+import numpy as np
+import pygame
+
+from flappy_trainer.ai.vectorized_environment import VectorizedEnvironment
+from flappy_trainer.config import DEFAULT_GAME_CONFIG, GameConfig
+from flappy_trainer.game_managers.base_game_manager import BaseGameManager
+from flappy_trainer.game_objects.bird.bird_spritesheet import BirdSpriteSheet
+from flappy_trainer.game_objects.pipe.pipe import Pipe
+from flappy_trainer.utils import CachedText, PipeColor
+
+
+class PopulationRenderer:
+    def __init__(
+        self,
+        screen: pygame.Surface | None = None,
+        alpha: int = 96,
+        num_colors: int = 8,
+        fps: int | None = 60,
+        config: GameConfig = DEFAULT_GAME_CONFIG,
+    ):
+        """
+        Args:
+            screen: The surface to draw on, a new window the size of the config's screen when None.
+            alpha: The opacity (0-255) of every bird.
+            num_colors: The number of group colors and steps in the score color ramp.
+            fps: The frame rate drawing is capped at, uncapped when None.
+            config: The game configuration of the environments that will be drawn.
+        """
+        if screen is None:
+            screen = pygame.display.set_mode((config.screen_width, config.screen_height))
+        self.screen = screen
+        self.background = pygame.Surface(self.screen.get_size())
+        if pygame.display.get_surface() is not None:
+            self.background = self.background.convert()
+        BaseGameManager.draw_background(self.background, config)
+        self.fps = fps
+        self.clock = pygame.time.Clock()
+
+        frames = BirdSpriteSheet().frames
+        group_hues = np.arange(num_colors) / num_colors
+        score_hues = np.linspace(2 / 3, 0, num_colors)  # Blue to red
+        self.group_frames = [self._tint_frames(frames, hue, alpha) for hue in group_hues]
+        self.score_frames = [self._tint_frames(frames, hue, alpha) for hue in score_hues]
+
+        self.pipes: dict[int, Pipe] = {}  # Pipe slot of the environment -> the Pipe drawn for it
+        self.font = pygame.font.Font(None, 36)
+        self.alive_text = CachedText(self.font, "Alive: {}", (255, 255, 255))
+        self.score_text = CachedText(self.font, "Best Score: {}", (255, 255, 255))
+
+    def draw(self, env: VectorizedEnvironment, groups: np.ndarray | None = None):
+        """
+        Draw the living birds of every game in `env` and update the display, if one is open.
+
+        Args:
+            env: The games to draw.
+            groups: Optional group (e.g. policy) of every game. Birds are colored by group when given and by
+                score otherwise.
+        """
+        pygame.event.pump()
+        self.screen.blit(self.background, (0, 0))
+        alive = np.flatnonzero(env.alive)
+        self._draw_pipes(env, alive[0] if len(alive) else 0)
+
+        if groups is None:
+            palettes = self.score_frames
+            colors = env.score[alive] * (len(palettes) - 1) // max(int(env.score.max()), 1)
+        else:
+            palettes = self.group_frames
+            colors = np.asarray(groups)[alive] % len(palettes)
+        x_pos = env.config.bird_start_x_pos
+        self.screen.blits(
+            [
+                (palettes[color][frame], (x_pos, y_pos))
+                for color, frame, y_pos in zip(
+                    colors.tolist(), env.bird_frame[alive].tolist(), env.bird_y[alive].tolist()
+                )
+            ],
+            doreturn=False,
+        )
+
+        self.screen.blit(self.alive_text.render(len(alive)), (10, 10))
+        self.screen.blit(self.score_text.render(int(env.score.max())), (10, 50))
+        if pygame.display.get_surface() is not None:
+            pygame.display.flip()
+        if self.fps:
+            self.clock.tick(self.fps)
+
+    def _draw_pipes(self, env: VectorizedEnvironment, row: int):
+        """Draw the pipes of one game, reusing the Pipe drawn for a slot until a new pipe spawns in it."""
+        for slot in np.flatnonzero(env.pipe_active[row]).tolist():
+            gap_center, gap_height = int(env.pipe_gap_center[row, slot]), int(env.pipe_gap_height[row, slot])
+            pipe = self.pipes.get(slot)
+            if pipe is None or (pipe.gap_center, pipe.gap_height) != (gap_center, gap_height):
+                pipe = self.pipes[slot] = Pipe(
+                    PipeColor.GREEN, gap_center=gap_center, gap_height=gap_height, config=env.config
+                )
+            pipe.x_pos = env.pipe_x[row, slot]
+            pipe.update_rects()
+            pipe.draw(self.screen)
+
+    @staticmethod
+    def _tint_frames(frames: list[pygame.Surface], hue: float, alpha: int) -> list[pygame.Surface]:
+        """Copies of the bird frames multiplied by a bright color of the given hue and made translucent."""
+        color = [round(channel * 255) for channel in colorsys.hsv_to_rgb(hue, 0.6, 1.0)]
+        tinted_frames = []
+        for frame in frames:
+            tinted = frame.copy()
+            tinted.fill((*color, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+            tinted_frames.append(tinted)
+        return tinted_frames
@@ -7,8 +7,10 @@ from tensorflow.keras.layers import Dense
 from tensorflow.keras.mixed_precision import set_global_policy
 from tensorflow.keras.models import Sequential, load_model
 
-from flappy_trainer.ai.ai_utils import Action, Knowledge
+from flappy_trainer.ai.ai_utils import TRANSITION_DTYPE, Action, Knowledge, knowledge_to_records
 from flappy_trainer.ai.environment_state import EnvironmentState
+from flappy_trainer.ai.state_encoder import StateEncoder
+from flappy_trainer.ai.tflite_export import TFLitePolicy
 from flappy_trainer.config import AGENT_MAX_MEMORY
 
 
@@ -16,17 +18,24 @@ class ReinforcementLearningAgent:
     """
     A reinforcement learning agent that uses a neural network to predict Q-values
     for state-action pairs and trains via experience replay.
+
+    With `tflite_model_path`, decisions are made by a TFLite interpreter instead of the Keras model (see
+    tflite_export.py). The interpreter runs a frozen export, so training does not change its decisions.
     """
 
-    def __init__(self, model_path: str = None):
+    def __init__(self, model_path: str = None, tflite_model_path: str = None):
         if model_path and os.path.exists(model_path):
             self.model = load_model(model_path)
             print(f"Model loaded from {model_path}")
         else:
             self.model: Sequential = self._create_model()
+        self.tflite_policy = TFLitePolicy(tflite_model_path) if tflite_model_path else None
         self.memory: deque[Knowledge] = deque(maxlen=AGENT_MAX_MEMORY)
         self.discount_factor = 0.9
+        self.exploration_rate = 1.0
         self.min_exploration_rate = 0.03
+        self._state_buffer = StateEncoder.allocate(1)  # Reused by every decision
+        self._replay_records = np.zeros(0, dtype=TRANSITION_DTYPE)  # Grown to the batch size
         set_global_policy("mixed_float16")
 
     def set_exploration_rate(self, exploration_rate: float):
@@ -50,8 +59,11 @@ class ReinforcementLearningAgent:
         if random.random() < self.exploration_rate:
             return random.choice([Action.FLAP, Action.NO_FLAP])
 
-        state_array = state.to_numpy_array(include_batch_dim=True)
-        q_values = self.model.predict(state_array, verbose=0)[0]
+        StateEncoder.encode_state(state, self._state_buffer[0], state.config)
+        if self.tflite_policy is not None:
+            q_values = self.tflite_policy.predict(self._state_buffer)[0]
+        else:
+            q_values = self.model.predict(self._state_buffer, verbose=0)[0]
         return Action.FLAP if q_values[0] > q_values[1] else Action.NO_FLAP
 
     def remember(self, knowledge: Knowledge):
@@ -63,27 +75,41 @@ class ReinforcementLearningAgent:
         if len(self.memory) < batch_size:
             return
         batch = random.sample(self.memory, batch_size)
-        states = []
-        targets = []
-
-        for knowledge in batch:
-            pre_state_array = knowledge.pre_state.to_numpy_array(include_batch_dim=False)
-            q_values = self.model.predict(pre_state_array.reshape(1, -1), verbose=0)[0]
-
-            # Determine action index (0 for FLAP, 1 for NO_FLAP)
-            action_index = 0 if knowledge.action == Action.FLAP else 1
-
-            # Compute reward update
-            if knowledge.post_state is not None and knowledge.post_state.bird_is_alive:
-                next_state_array = knowledge.post_state.to_numpy_array(include_batch_dim=True)
-                future_q_values = self.model.predict(next_state_array, verbose=0)[0]
-                future_reward = max(future_q_values)  # Max Q-value for the next state
-                q_values[action_index] = knowledge.reward + self.discount_factor * future_reward
-            else:
-                q_values[action_index] = knowledge.reward  # Terminal state
+        if len(self._replay_records) < batch_size:
+            self._replay_records = np.zeros(batch_size, dtype=TRANSITION_DTYPE)
+        records = knowledge_to_records(batch, out=self._replay_records)
+        self.learn_from_batch(
+            records["state"],
+            records["action"],
+            records["reward"],
+            records["next_state"],
+            records["done"],
+            records["n_steps"],
+        )
 
-            states.append(pre_state_array)
-            targets.append(q_values)
+    def learn_from_batch(
+        self,
+        states: np.ndarray,
+        actions: np.ndarray,
+        rewards: np.ndarray,
+        next_states: np.ndarray,
+        dones: np.ndarray,
+        n_steps: np.ndarray,
+    ):
+        """
+        Fit the model once on a batch of transitions given as arrays (the fields of TRANSITION_DTYPE records),
+        whether they were sampled from memory or streamed from a replay dataset.
+        """
+        targets = self.model.predict(states, verbose=0)
+        future_rewards = self.model.predict(next_states, verbose=0).max(axis=1)  # Max Q-value for the next state
+
+        # Rewards of n-step knowledge are already discounted, so the bootstrap is discounted n times.
+        # Terminal states have no future reward.
+        bootstrap = np.where(dones, 0, self.discount_factor ** np.asarray(n_steps, dtype=np.float32) * future_rewards)
+
+        # Action index 0 for FLAP (value 1), 1 for NO_FLAP (value 0)
+        action_indices = np.where(np.asarray(actions) == Action.FLAP.value, 0, 1)
+        targets[np.arange(len(targets)), action_indices] = rewards + bootstrap
 
         # Train the model
-        self.model.fit(np.array(states), np.array(targets), epochs=1, verbose=0)
+        self.model.fit(states, targets, epochs=1, verbose=0)
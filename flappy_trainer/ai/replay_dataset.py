@@ -0,0 +1,166 @@
+"""
+Replay Dataset
+
+Exports the agent's experience to an on-disk dataset and streams it back in minibatches, so agents can be
+trained offline from past runs, datasets can be shared between machines, and new agents can be warm-started
+without regenerating experience through the simulator.
+
+A dataset is a directory of fixed-size chunks. Every chunk stores one `.npy` file per field, and a small JSON
+manifest lists the chunks and their sizes:
+
+    dataset/
+        manifest.json
+        chunk-00000-obs.npy        (N, num_features) float32
+        chunk-00000-action.npy     (N,) int8, the Action value
+        chunk-00000-reward.npy     (N,) float32
+        chunk-00000-next_obs.npy   (N, num_features) float32, zeros when done
+        chunk-00000-done.npy       (N,) bool
+        chunk-00000-n_steps.npy    (N,) uint8, decisions between obs and next_obs
+        chunk-00001-...
+
+Key Features:
+- Chunks are written as experience arrives, so exporting never holds the whole dataset in RAM.
+- Chunks are opened with `np.load(mmap_mode="r")`, so streaming only reads the rows of each minibatch.
+- Shuffled minibatches, in the arrays `ReinforcementLearningAgent.learn_from_batch` trains on.
+"""
+
+import json
+import os
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from flappy_trainer.ai.ai_utils import TRANSITION_DTYPE, Knowledge, knowledge_to_records
+from flappy_trainer.ai.environment_state import EnvironmentState
+
+MANIFEST_FILE_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+# Dataset field -> TRANSITION_DTYPE field
+FIELDS = {
+    "obs": "state",
+    "action": "action",
+    "reward": "reward",
+    "next_obs": "next_state",
+    "done": "done",
+    "n_steps": "n_steps",
+}
+
+
+class ReplayDatasetWriter:
+    """Writes knowledge to a chunked replay dataset. Use as a context manager, or call `close` when done."""
+
+    def __init__(self, directory: str, chunk_size: int = 65536):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self.chunks: list[dict] = []
+        self._buffer = np.zeros(chunk_size, dtype=TRANSITION_DTYPE)
+        self._buffered = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def add(self, batch: Iterable[Knowledge]):
+        """Add knowledge to the dataset, writing a chunk every time `chunk_size` transitions are buffered."""
+        batch = list(batch)
+        while batch:
+            count = min(len(batch), self.chunk_size - self._buffered)
+            knowledge_to_records(batch[:count], out=self._buffer[self._buffered :])
+            self._buffered += count
+            batch = batch[count:]
+            if self._buffered == self.chunk_size:
+                self.flush()
+
+    def flush(self):
+        """Write the buffered transitions as a chunk and update the manifest."""
+        if self._buffered == 0:
+            return
+        name = f"chunk-{len(self.chunks):05d}"
+        records = self._buffer[: self._buffered]
+        for field, record_field in FIELDS.items():
+            np.save(os.path.join(self.directory, f"{name}-{field}.npy"), np.ascontiguousarray(records[record_field]))
+        self.chunks.append({"name": name, "size": self._buffered})
+        self._buffered = 0
+        self._write_manifest()
+
+    def close(self):
+        self.flush()
+        self._write_manifest()
+
+    def _write_manifest(self):
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "num_features": EnvironmentState.get_num_features(),
+            "num_transitions": sum(chunk["size"] for chunk in self.chunks),
+            "fields": {field: TRANSITION_DTYPE[record_field].base.str for field, record_field in FIELDS.items()},
+            "chunks": self.chunks,
+        }
+        with open(os.path.join(self.directory, MANIFEST_FILE_NAME), "w") as file:
+            json.dump(manifest, file, indent=2)
+
+
+class ReplayDataset:
+    """Reads a chunked replay dataset through memory maps."""
+
+    def __init__(self, directory: str):
+        with open(os.path.join(directory, MANIFEST_FILE_NAME)) as file:
+            self.manifest = json.load(file)
+        if self.manifest["version"] != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported replay dataset version: {self.manifest['version']}.")
+        if self.manifest["num_features"] != EnvironmentState.get_num_features():
+            raise ValueError(
+                f"Replay dataset has {self.manifest['num_features']} features, "
+                f"expected {EnvironmentState.get_num_features()}."
+            )
+        self.directory = directory
+        self.chunks = [
+            {field: np.load(os.path.join(directory, f"{chunk['name']}-{field}.npy"), mmap_mode="r") for field in FIELDS}
+            for chunk in self.manifest["chunks"]
+        ]
+
+    def __len__(self) -> int:
+        return self.manifest["num_transitions"]
+
+    def iter_minibatches(
+        self, batch_size: int, shuffle: bool = True, seed: int | None = None
+    ) -> Iterator[dict[str, np.ndarray]]:
+        """
+        Stream the dataset once as minibatches of in-memory arrays.
+
+        Args:
+            batch_size: The transitions per minibatch. The last minibatch of each chunk may be smaller.
+            shuffle: Visit chunks and the transitions within them in random order.
+            seed: Seed for the shuffle.
+
+        Yields:
+            dict[str, np.ndarray]: One array per dataset field (obs, action, reward, next_obs, done, n_steps).
+        """
+        rng = np.random.default_rng(seed)
+        chunk_order = rng.permutation(len(self.chunks)) if shuffle else range(len(self.chunks))
+        for chunk_index in chunk_order:
+            chunk = self.chunks[chunk_index]
+            size = len(chunk["obs"])
+            order = rng.permutation(size) if shuffle else np.arange(size)
+            for start in range(0, size, batch_size):
+                rows = np.sort(order[start : start + batch_size])  # Sorted rows read the memory map in order
+                yield {field: array[rows] for field, array in chunk.items()}
+
+
+def export_knowledge(batch: Iterable[Knowledge], directory: str, chunk_size: int = 65536) -> int:
+    """Export knowledge, such as an agent's memory, to a new replay dataset and return the transitions written."""
+    with ReplayDatasetWriter(directory, chunk_size) as writer:
+        writer.add(batch)
+    return sum(chunk["size"] for chunk in writer.chunks)
+
+
+def train_on_dataset(agent, dataset: ReplayDataset, batch_size: int = 256, epochs: int = 1, seed: int | None = None):
+    """Train an agent offline, fitting it once on every minibatch of the dataset for each epoch."""
+    for epoch in range(epochs):
+        for batch in dataset.iter_minibatches(batch_size, seed=None if seed is None else seed + epoch):
+            agent.learn_from_batch(
+                batch["obs"], batch["action"], batch["reward"], batch["next_obs"], batch["done"], batch["n_steps"]
+            )
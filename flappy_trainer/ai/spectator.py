@@ -0,0 +1,134 @@
+"""
+Spectator
+
+Watches an agent play with the simulation decoupled from rendering. The game is always simulated with the
+trainer's fixed 1/60 second frames and decision timing, but at a speed multiplier above 1x only every k-th
+frame is drawn, and unthrottled the game is simulated as fast as the CPU allows and drawn at most 60 times a
+second. Skipping simulates without drawing until the bird dies, so long runs can be reviewed in seconds.
+
+Controls:
+    1, 2, 3, 4   1x, 4x, 16x and unthrottled speed
+    N            Skip to the next death
+    ESC          Stop watching
+
+Key Features:
+- Frame-exact simulation at every speed, identical to the AITrainer's.
+- Renders every k-th frame at k times speed, holding 60 frames drawn per second.
+- Skip-to-next-death, holding the death frame on screen before the next episode.
+"""
+
+import time
+
+import pygame
+
+from flappy_trainer.ai.ai_utils import Action, get_current_state
+from flappy_trainer.ai.episode_replay import is_decision_frame
+from flappy_trainer.game_managers.game_manager import GameManager
+from flappy_trainer.utils import GameState
+
+FRAME_TIME = 1 / 60
+RENDER_FPS = 60
+UNTHROTTLED = None
+SPEEDS = {pygame.K_1: 1, pygame.K_2: 4, pygame.K_3: 16, pygame.K_4: UNTHROTTLED}
+
+
+class Spectator:
+    def __init__(self, agent, game_manager: GameManager, action_tick: int = 15, death_hold: float = 0.75):
+        """
+        Args:
+            agent: The agent to watch, anything with `choose_action(state)`.
+            game_manager: The game the agent plays.
+            action_tick: The frames between the agent's decisions.
+            death_hold: The seconds the death frame stays on screen.
+        """
+        self.agent = agent
+        self.game_manager = game_manager
+        self.action_tick = action_tick
+        self.death_hold = death_hold
+        self.speed: int | None = 1
+        self.is_skipping = False
+        self.is_watching = True
+        self.frame = 0
+        self.clock = pygame.time.Clock()
+        self._last_render_time = 0.0
+
+    def handle_event(self, event: pygame.event.Event):
+        """Change the speed, skip to the next death or stop watching."""
+        if event.type == pygame.QUIT:
+            self.is_watching = False
+        elif event.type == pygame.KEYDOWN:
+            if event.key in SPEEDS:
+                self.speed = SPEEDS[event.key]
+            elif event.key == pygame.K_n:
+                self.is_skipping = True
+            elif event.key == pygame.K_ESCAPE:
+                self.is_watching = False
+
+    def start_episode(self, seed: int | None = None):
+        self.game_manager.start_game(seed)
+        self.frame = 0
+
+    def step(self) -> bool:
+        """
+        Simulate one frame and let the agent decide if it is a decision tick.
+
+        Returns:
+            bool: True if the bird is still alive.
+        """
+        game_manager = self.game_manager
+        game_manager.update(FRAME_TIME)
+        self.frame += 1
+        if game_manager.state is not GameState.RUNNING:
+            return False
+        if is_decision_frame(self.frame, self.action_tick):
+            if self.agent.choose_action(get_current_state(game_manager)) == Action.FLAP:
+                game_manager.bird.flap()
+        return True
+
+    def should_render(self) -> bool:
+        """Whether the current frame is drawn at the current speed."""
+        if self.is_skipping:
+            return False
+        if self.speed is UNTHROTTLED:
+            return time.perf_counter() - self._last_render_time >= 1 / RENDER_FPS
+        return self.frame % self.speed == 0
+
+    def watch_episode(self, seed: int | None = None) -> int:
+        """Watch one episode, on the seeded pipe course if a seed is given, and return the frames it lasted."""
+        self.start_episode(seed)
+        while self.is_watching:
+            for event in pygame.event.get():
+                self.handle_event(event)
+
+            if not self.step():
+                self.is_skipping = False
+                self._draw_death()
+                break
+
+            if self.should_render():
+                self.game_manager.draw()
+                self._last_render_time = time.perf_counter()
+                if self.speed is not UNTHROTTLED:
+                    self.clock.tick(RENDER_FPS)
+        return self.frame
+
+    def watch(self, num_episodes: int | None = None) -> list[int]:
+        """Watch episodes until `num_episodes` are played (forever when None) or the spectator stops watching."""
+        results = []
+        while self.is_watching and (num_episodes is None or len(results) < num_episodes):
+            frames = self.watch_episode()
+            results.append(frames)
+            print(f"Episode {len(results)}: {frames} frames, score {self.game_manager.score}")
+        return results
+
+    def _draw_death(self):
+        """Draw the frame the bird died on in place of the game over menu, and hold it on screen."""
+        game_manager = self.game_manager
+        state, game_manager.state = game_manager.state, GameState.RUNNING
+        game_manager.draw()
+        game_manager.state = state
+        hold_until = time.perf_counter() + self.death_hold
+        while self.is_watching and time.perf_counter() < hold_until:
+            for event in pygame.event.get():
+                self.handle_event(event)
+            self.clock.tick(RENDER_FPS)
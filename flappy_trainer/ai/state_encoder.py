@@ -0,0 +1,117 @@
+"""
+StateEncoder
+
+Writes the normalized features the agents learn from straight into rows of preallocated float32 arrays.
+It reads a GameManager (or a VectorizedEnvironment) directly, so deciding and replaying do not have to build
+an `EnvironmentState` object and a fresh array for every state. `EnvironmentState` remains the readable
+view of a state for debugging and for the knowledge the agents remember.
+
+The features match `EnvironmentState.to_numpy_array`:
+    bird height, bird velocity, pipe velocity, then distance, gap center and gap height of the nearest
+    and second nearest unpassed pipes (defaults when there is no such pipe).
+
+Key Features:
+- Encodes one game into a caller-supplied row without allocating.
+- Bulk variants for many games, many stored states, or a whole VectorizedEnvironment.
+"""
+
+import functools
+from typing import Iterable, Sequence
+
+import numpy as np
+
+from flappy_trainer.ai.environment_state import EnvironmentState
+from flappy_trainer.ai.vectorized_environment import VectorizedEnvironment
+from flappy_trainer.config import DEFAULT_GAME_CONFIG, GameConfig
+from flappy_trainer.game_managers.game_manager import GameManager
+
+NUM_FEATURES = EnvironmentState.get_num_features()
+
+
+@functools.lru_cache(maxsize=16)  # Bounded, as games with randomized physics each have their own config
+def get_no_pipe_features(config: GameConfig) -> tuple[float, float, float]:
+    """Normalized features of a missing pipe: as far away as the screen is wide, with a default centered gap."""
+    return 1.0, (config.screen_height // 2) / config.screen_height, (config.screen_height // 4) / config.screen_height
+
+
+NO_PIPE_FEATURES = get_no_pipe_features(DEFAULT_GAME_CONFIG)
+
+
+class StateEncoder:
+    num_features = NUM_FEATURES
+
+    @staticmethod
+    def allocate(num_states: int = 1) -> np.ndarray:
+        """Allocate a float32 buffer with room for `num_states` encoded states."""
+        return np.zeros((num_states, NUM_FEATURES), dtype=np.float32)
+
+    @staticmethod
+    def encode(game_manager: GameManager, out: np.ndarray) -> np.ndarray:
+        """
+        Write the features of a game into `out`, normalized by the game's config.
+
+        Args:
+            game_manager: The game to encode.
+            out: A float32 row of length `num_features`, e.g. one row of an `allocate`d buffer.
+
+        Returns:
+            np.ndarray: `out`, holding the features.
+        """
+        bird, config = game_manager.bird, game_manager.config
+        screen_width, screen_height = config.screen_width, config.screen_height
+        out[0] = bird.y_pos / screen_height
+        out[1] = bird.y_velocity / config.max_bird_velocity
+        pipe_speed = config.initial_pipe_speed + game_manager.level * config.pipe_speed_increase_per_level_up
+        out[2] = pipe_speed / config.max_pipe_velocity
+
+        # Pipes are kept in spawn order, which is also their order on screen
+        column = 3
+        for pipe in game_manager.pipes:
+            if not pipe.passed:
+                out[column] = (pipe.x_pos + config.pipe_width - bird.x_pos) / screen_width
+                out[column + 1] = pipe.gap_center / screen_height
+                out[column + 2] = pipe.gap_height / screen_height
+                column += 3
+                if column == NUM_FEATURES:
+                    return out
+        out[column:] = get_no_pipe_features(config) * ((NUM_FEATURES - column) // 3)
+        return out
+
+    @classmethod
+    def encode_many(cls, game_managers: Iterable[GameManager], out: np.ndarray) -> np.ndarray:
+        """Write the features of each game into the matching row of `out`."""
+        for row, game_manager in zip(out, game_managers):
+            cls.encode(game_manager, row)
+        return out
+
+    @staticmethod
+    def encode_vectorized(env: VectorizedEnvironment, out: np.ndarray) -> np.ndarray:
+        """Write the features of every game of a VectorizedEnvironment into `out`, one row per game."""
+        return env.get_observations(out=out)
+
+    @staticmethod
+    def encode_state(state: EnvironmentState, out: np.ndarray, config: GameConfig | None = None) -> np.ndarray:
+        """Write the features of a stored `EnvironmentState`, normalized by `config` (the state's own by default)."""
+        config = config or state.config
+        screen_width, screen_height = config.screen_width, config.screen_height
+        out[:] = (
+            state.bird_vert_pos / screen_height,
+            state.bird_vert_velocity / config.max_bird_velocity,
+            state.pipe_velocity / config.max_pipe_velocity,
+            state.next_pipe_distance / screen_width,
+            state.next_pipe_gap_pos / screen_height,
+            state.next_pipe_gap_height / screen_height,
+            state.second_pipe_distance / screen_width,
+            state.second_pipe_gap_pos / screen_height,
+            state.second_pipe_gap_height / screen_height,
+        )
+        return out
+
+    @classmethod
+    def encode_states(
+        cls, states: Sequence[EnvironmentState], out: np.ndarray, config: GameConfig | None = None
+    ) -> np.ndarray:
+        """Write the features of each stored state into the matching row of `out`."""
+        for row, state in zip(out, states):
+            cls.encode_state(state, row, config)
+        return out
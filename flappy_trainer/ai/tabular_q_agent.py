@@ -0,0 +1,126 @@
+"""
+TabularQAgent
+
+A Q-learning agent that keeps its Q-values in a NumPy table instead of a neural network. The continuous
+`EnvironmentState` features the decision depends on most (bird height, bird velocity, horizontal distance
+to the next pipe and height of the bird relative to the next gap) are discretized into bins, and every
+combination of bins is one row of the table.
+
+It has the same interface as `ReinforcementLearningAgent`, so the AITrainer trains it with the same loop.
+
+Key Features:
+- No TensorFlow: trains in minutes and decides in microseconds, for low-resource demo machines.
+- A sanity baseline for the neural agent.
+- Vectorized replay updates over a whole batch of memories at once.
+- Saves and loads the Q-table as a `.npy` file.
+"""
+
+import bisect
+import os
+import random
+from collections import deque
+
+import numpy as np
+
+from flappy_trainer.ai.ai_utils import Action, Knowledge
+from flappy_trainer.ai.environment_state import EnvironmentState
+from flappy_trainer.config import AGENT_MAX_MEMORY
+
+# Inner bin edges of each discretized feature, values outside the range fall into the first or last bin
+BIN_EDGES = (
+    np.linspace(0, 1, 13)[1:-1],  # Bird height, as a fraction of the screen height
+    np.linspace(-10, 15, 11)[1:-1],  # Bird velocity
+    np.linspace(0, 1, 11)[1:-1],  # Distance to the next pipe, as a fraction of the screen width
+    np.linspace(-200, 200, 17)[1:-1],  # Next gap center relative to the bird
+)
+TABLE_SHAPE = tuple(len(edges) + 1 for edges in BIN_EDGES)
+
+
+class TabularQAgent:
+    """
+    A reinforcement learning agent that looks up Q-values for state-action pairs in a table
+    and trains via experience replay.
+    """
+
+    def __init__(self, model_path: str = None, learning_rate: float = 0.1):
+        if model_path and os.path.exists(model_path):
+            self.q_table = np.load(model_path)
+            print(f"Q-table loaded from {model_path}")
+        else:
+            self.q_table = np.zeros((int(np.prod(TABLE_SHAPE)), 2), dtype=np.float32)
+        self.memory: deque[Knowledge] = deque(maxlen=AGENT_MAX_MEMORY)
+        self.learning_rate = learning_rate
+        self.discount_factor = 0.9
+        self.exploration_rate = 1.0
+        self.min_exploration_rate = 0.03
+        self._bin_edges = [edges.tolist() for edges in BIN_EDGES]  # Python lists for fast single lookups
+
+    def set_exploration_rate(self, exploration_rate: float):
+        self.exploration_rate = exploration_rate
+
+    def choose_action(self, state: EnvironmentState) -> Action:
+        """Choose an action based on exploration vs exploitation."""
+        if random.random() < self.exploration_rate:
+            return random.choice([Action.FLAP, Action.NO_FLAP])
+
+        q_values = self.q_table[self.get_state_index(state)]
+        return Action.FLAP if q_values[0] > q_values[1] else Action.NO_FLAP
+
+    def remember(self, knowledge: Knowledge):
+        """Store experience in memory with a fixed buffer size."""
+        self.memory.append(knowledge)
+
+    def replay(self, batch_size: int):
+        """Update the Q-table towards the targets of a random batch of past experiences."""
+        if len(self.memory) < batch_size:
+            return
+        batch = random.sample(self.memory, batch_size)
+
+        states = self.get_state_indices(np.array([get_features(knowledge.pre_state) for knowledge in batch]))
+        actions = np.array([0 if knowledge.action == Action.FLAP else 1 for knowledge in batch])
+        rewards = np.array([knowledge.reward for knowledge in batch], dtype=np.float32)
+        discounts = self.discount_factor ** np.array([knowledge.n_steps for knowledge in batch], dtype=np.float32)
+        is_alive = np.array(
+            [knowledge.post_state is not None and knowledge.post_state.bird_is_alive for knowledge in batch]
+        )
+
+        # Terminal states have no future reward, their features are never looked up
+        next_features = [
+            get_features(knowledge.post_state) if alive else (0, 0, 0, 0) for knowledge, alive in zip(batch, is_alive)
+        ]
+        next_states = self.get_state_indices(np.array(next_features))
+        future_rewards = np.where(is_alive, self.q_table[next_states].max(axis=1), 0)
+
+        targets = rewards + discounts * future_rewards
+        errors = targets - self.q_table[states, actions]
+
+        # Average the errors of repeated state-action pairs, so a batch moves each Q-value at most once
+        cells, inverse, counts = np.unique(states * 2 + actions, return_inverse=True, return_counts=True)
+        self.q_table.reshape(-1)[cells] += self.learning_rate * np.bincount(inverse, weights=errors) / counts
+
+    def save(self, path: str):
+        """Save the Q-table as a `.npy` file."""
+        np.save(path, self.q_table)
+
+    def get_state_index(self, state: EnvironmentState) -> int:
+        """Get the Q-table row of a single state."""
+        index = 0
+        for value, edges, size in zip(get_features(state), self._bin_edges, TABLE_SHAPE):
+            index = index * size + bisect.bisect_right(edges, value)
+        return index
+
+    @staticmethod
+    def get_state_indices(features: np.ndarray) -> np.ndarray:
+        """Get the Q-table rows of many states at once from their (N, 4) features (see `get_features`)."""
+        bins = [np.digitize(features[:, i], edges) for i, edges in enumerate(BIN_EDGES)]
+        return np.ravel_multi_index(bins, TABLE_SHAPE)
+
+
+def get_features(state: EnvironmentState) -> tuple[float, float, float, float]:
+    """The values of the features the Q-table is indexed by, with positions scaled by the state's screen size."""
+    return (
+        state.bird_vert_pos / state.config.screen_height,
+        state.bird_vert_velocity,
+        state.next_pipe_distance / state.config.screen_width,
+        state.next_pipe_gap_pos - state.bird_vert_pos,
+    )
@@ -0,0 +1,247 @@
+"""
+TFLite Export
+
+Converts the agent's Keras models to TensorFlow Lite, optionally with int8 post-training quantization
+calibrated on recorded states, and reports how every converted policy compares to the Keras model it came
+from: action agreement on a validation set of recorded states, next to the latency of a single decision and
+of a batch. The fastest policy that still decides like the Keras model can then be picked for play and
+evaluation, e.g. with `ReinforcementLearningAgent(model_path, tflite_model_path=...)`.
+
+Recorded states are read from demonstration logs (see demonstrations.py) and replay dataset directories (see
+replay_dataset.py). With int8 quantization they are shuffled once, the first `num_calibration` calibrate the
+quantization and the rest are the validation set, so the two never overlap. Float-only exports validate on all
+of them.
+
+Run from the root directory:
+
+    python -m flappy_trainer.ai.tflite_export flappy_trainer/ai/models/*.keras \\
+        --states flappy_trainer/ai/demos/session.demo --int8
+
+Key Features:
+- Float32 export. Mixed-precision models are cast to float32 first, as TFLite has no float16 kernels for them.
+- Full-integer int8 quantization with float inputs and outputs, a drop-in for the float model.
+- An interpreter-backed policy, with the interpreter resized only when the batch size changes.
+- A side-by-side report of file size, action agreement and latency for every exported model.
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from flappy_trainer.ai.demonstrations import load_demonstrations
+from flappy_trainer.ai.replay_dataset import ReplayDataset
+
+REPORT_BATCH_SIZE = 256
+
+
+class TFLitePolicy:
+    """A TFLite model run by the interpreter, from a `.tflite` file or converted model content."""
+
+    def __init__(self, model_path: str | None = None, model_content: bytes | None = None, num_threads: int = 1):
+        self.interpreter = _create_interpreter(model_path, model_content, num_threads)
+        self._input_index = self.interpreter.get_input_details()[0]["index"]
+        self._output_index = self.interpreter.get_output_details()[0]["index"]
+        self._batch_size = None  # The batch size the interpreter's tensors are allocated for
+
+    def predict(self, observations: np.ndarray) -> np.ndarray:
+        """The Q-values of a (n, features) batch of observations."""
+        if len(observations) != self._batch_size:
+            self.interpreter.resize_tensor_input(self._input_index, observations.shape)
+            self.interpreter.allocate_tensors()
+            self._batch_size = len(observations)
+        self.interpreter.set_tensor(self._input_index, np.ascontiguousarray(observations, dtype=np.float32))
+        self.interpreter.invoke()
+        return self.interpreter.get_tensor(self._output_index)
+
+
+def to_float32_model(model):
+    """A float32 copy of a Keras model, e.g. of one trained under the `mixed_float16` policy."""
+    import keras
+
+    def clone_layer(layer):
+        return layer.__class__.from_config({**layer.get_config(), "dtype": "float32"})
+
+    float32_model = keras.models.clone_model(model, clone_function=clone_layer)
+    float32_model.set_weights([weights.astype(np.float32) for weights in model.get_weights()])
+    return float32_model
+
+
+def convert_model(model, calibration_states: np.ndarray | None = None) -> bytes:
+    """
+    Convert a Keras model to TFLite. With `calibration_states`, the weights and activations are quantized to
+    int8 with ranges measured on those states, keeping float32 inputs and outputs.
+
+    Returns:
+        bytes: The TFLite model content.
+    """
+    import tensorflow as tf
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(to_float32_model(model))
+    if calibration_states is not None:
+        calibration_states = np.asarray(calibration_states, dtype=np.float32)
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.representative_dataset = lambda: ([state[None]] for state in calibration_states)
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    return converter.convert()
+
+
+def load_recorded_states(paths: list[str]) -> np.ndarray:
+    """The encoded states of demonstration logs and replay dataset directories, as one (N, features) array."""
+    states = []
+    for path in paths:
+        if os.path.isdir(path):
+            states.extend(np.asarray(chunk["obs"]) for chunk in ReplayDataset(path).chunks)
+        else:
+            _, frames = load_demonstrations(path)
+            states.append(frames["features"])
+    return np.concatenate(states).astype(np.float32)
+
+
+def split_states(states: np.ndarray, num_calibration: int, seed: int | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """Shuffle recorded states and split them into calibration and validation sets that do not overlap."""
+    if len(states) <= num_calibration:
+        raise ValueError(f"{len(states)} recorded states leave none to validate {num_calibration} calibrations.")
+    states = states[np.random.default_rng(seed).permutation(len(states))]
+    return states[:num_calibration], states[num_calibration:]
+
+
+def get_action_agreement(q_values: np.ndarray, reference_q_values: np.ndarray) -> float:
+    """The fraction of states on which two policies choose the same greedy action, breaking ties as the agent does."""
+    return float(np.mean((q_values[:, 0] > q_values[:, 1]) == (reference_q_values[:, 0] > reference_q_values[:, 1])))
+
+
+def measure_latency(predict, states: np.ndarray, batch_size: int = 1, max_seconds: float = 1.0) -> float:
+    """The mean seconds `predict` takes per batch of `batch_size` states, over at most `max_seconds`."""
+    batch_size = min(batch_size, len(states))
+    batches = [states[start : start + batch_size] for start in range(0, len(states) - batch_size + 1, batch_size)]
+    predict(batches[0])  # Warm up
+    num_calls = 0
+    start_time = time.perf_counter()
+    elapsed = 0.0
+    for batch in batches:
+        predict(batch)
+        num_calls += 1
+        elapsed = time.perf_counter() - start_time
+        if elapsed > max_seconds:
+            break
+    return elapsed / num_calls
+
+
+def export_model(
+    model_path: str,
+    calibration_states: np.ndarray | None,
+    validation_states: np.ndarray,
+    quantize_int8: bool = False,
+    output_dir: str | None = None,
+) -> list[dict]:
+    """
+    Export a Keras model as `<name>.tflite` and, with `quantize_int8`, `<name>.int8.tflite`, next to it or in
+    `output_dir`, and compare them to the Keras model on the validation states. The calibration states are only
+    needed with `quantize_int8`.
+
+    Returns:
+        list[dict]: One report row per policy, the Keras model first.
+    """
+    from tensorflow.keras.models import load_model
+
+    model = load_model(model_path)
+    name = os.path.splitext(os.path.basename(model_path))[0]
+    output_dir = output_dir or os.path.dirname(model_path)
+    os.makedirs(output_dir, exist_ok=True)
+
+    reference_q_values = model.predict(validation_states, verbose=0)
+    rows = [
+        _report_row(
+            model_path,
+            lambda observations: model.predict(observations, verbose=0),  # How the agent decides
+            model.predict_on_batch,
+            reference_q_values,
+            validation_states,
+        )
+    ]
+    exports = {f"{name}.tflite": None}
+    if quantize_int8:
+        exports[f"{name}.int8.tflite"] = calibration_states
+    for file_name, states in exports.items():
+        path = os.path.join(output_dir, file_name)
+        with open(path, "wb") as file:
+            file.write(convert_model(model, states))
+        policy = TFLitePolicy(path)
+        rows.append(_report_row(path, policy.predict, policy.predict, reference_q_values, validation_states))
+    return rows
+
+
+def print_report(rows: list[dict]):
+    """Print the report rows of `export_model` as a table."""
+    header = f"{'Policy':<50}{'Size':>10}{'Agreement':>12}{'Decision':>14}{f'Batch of {REPORT_BATCH_SIZE}':>16}"
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        print(
+            f"{row['policy']:<50}{row['size_kb']:>8.1f}kB{row['agreement']:>11.2%} "
+            f"{row['decision_us']:>11.1f}us{row['batch_us']:>14.1f}us"
+        )
+
+
+def _report_row(
+    path: str, decide, predict_batch, reference_q_values: np.ndarray, validation_states: np.ndarray
+) -> dict:
+    """Agreement with the reference Q-values and latency of one policy."""
+    q_values = np.concatenate(
+        [
+            predict_batch(validation_states[start : start + REPORT_BATCH_SIZE])
+            for start in range(0, len(validation_states), REPORT_BATCH_SIZE)
+        ]
+    )
+    return {
+        "policy": path,
+        "size_kb": os.path.getsize(path) / 1024,
+        "agreement": get_action_agreement(q_values, reference_q_values),
+        "decision_us": measure_latency(decide, validation_states) * 1e6,
+        "batch_us": measure_latency(predict_batch, validation_states, REPORT_BATCH_SIZE) * 1e6,
+    }
+
+
+def _create_interpreter(model_path: str | None, model_content: bytes | None, num_threads: int):
+    """A TFLite interpreter from the LiteRT package if it is installed, otherwise from TensorFlow."""
+    try:
+        from ai_edge_litert.interpreter import Interpreter
+    except ImportError:
+        import tensorflow as tf
+
+        Interpreter = tf.lite.Interpreter
+
+    interpreter = Interpreter(model_path=model_path, model_content=model_content, num_threads=num_threads)
+    interpreter.allocate_tensors()
+    return interpreter
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export Keras models to TFLite and compare them to the originals.")
+    parser.add_argument("models", nargs="+", help="Keras models to export.")
+    parser.add_argument(
+        "--states", nargs="+", required=True, help="Demonstration logs or replay dataset directories to validate on."
+    )
+    parser.add_argument("--int8", action="store_true", help="Also export an int8 quantized model.")
+    parser.add_argument("--num-calibration", type=int, default=500, help="Recorded states to calibrate int8 on.")
+    parser.add_argument("--output-dir", default=None, help="Where to write the models, next to each by default.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the calibration/validation split.")
+    args = parser.parse_args()
+
+    states = load_recorded_states(args.states)
+    if args.int8:
+        calibration_states, validation_states = split_states(states, args.num_calibration, args.seed)
+        print(f"Calibrating on {len(calibration_states)} states, validating on {len(validation_states)}.")
+    else:
+        calibration_states, validation_states = None, states
+        print(f"Validating on {len(validation_states)} states.")
+    rows = []
+    for model_path in args.models:
+        rows.extend(export_model(model_path, calibration_states, validation_states, args.int8, args.output_dir))
+    print_report(rows)
+
+
+if __name__ == "__main__":
+    main()
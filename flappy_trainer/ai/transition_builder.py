@@ -0,0 +1,98 @@
+"""
+TransitionBuilder
+
+This class turns the agent's decisions into training transitions (knowledge) for the AI Trainer.
+Every decision waits in a FIFO queue until its horizon (`n_steps` decision ticks) elapses, at which point
+exactly one (pre_state, action, reward, post_state) transition is emitted for it. When the game ends,
+the decisions still waiting are emitted once as terminal transitions.
+
+With `n_steps` > 1 the reward is the discounted n-step return and the post state is the state n decisions
+later, so a death propagates back to the decisions that caused it without waiting for repeated replays.
+
+Key Features:
+- Bookkeeping bounded by `n_steps` per decision, using a deque instead of copying and searching a list.
+- Emits every transition exactly once, with no duplicate "death" samples.
+- Emits the true terminal transition (post_state=None) on game over.
+- Optionally emits n-step discounted returns with the matching bootstrap state.
+- Drops pending decisions when an episode is cut short without a game over.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+
+from flappy_trainer.ai.ai_utils import Action, Knowledge
+from flappy_trainer.ai.environment_state import EnvironmentState
+
+
+@dataclass
+class PendingDecision:
+    """A decision waiting for its horizon, accumulating its discounted return."""
+
+    state: EnvironmentState
+    action: Action
+    discounted_return: float = 0.0
+    steps: int = 0
+
+
+class TransitionBuilder:
+    def __init__(
+        self, n_steps: int = 1, discount_factor: float = 0.9, alive_reward: float = 1, death_reward: float = -1
+    ):
+        if n_steps < 1:
+            raise ValueError(f"n_steps must be at least 1. Got: {n_steps}.")
+        self.n_steps = n_steps
+        self.discount_factor = discount_factor
+        self.alive_reward = alive_reward
+        self.death_reward = death_reward
+        self.pending: deque[PendingDecision] = deque()
+
+    def reset(self):
+        """Forget any pending decisions, e.g. at the start of an episode."""
+        self.pending.clear()
+
+    def add_decision(self, state: EnvironmentState, action: Action) -> list[Knowledge]:
+        """
+        Record a decision and emit the transitions whose horizon has elapsed.
+
+        Args:
+            state: The state the decision was made in, which is also the bootstrap state of earlier decisions.
+            action: The action the agent chose in `state`.
+
+        Returns:
+            list[Knowledge]: The transitions completed by reaching `state` alive.
+        """
+        self._add_reward(self.alive_reward)
+        transitions = []
+        while self.pending and self.pending[0].steps >= self.n_steps:
+            decision = self.pending.popleft()
+            transitions.append(
+                Knowledge(decision.state, decision.action, decision.discounted_return, state, decision.steps)
+            )
+        self.pending.append(PendingDecision(state, action))
+        return transitions
+
+    def end_episode(self, is_game_over: bool) -> list[Knowledge]:
+        """
+        Close the episode and emit the terminal transitions.
+
+        Args:
+            is_game_over: Whether the bird died. If False the episode was truncated and pending decisions are dropped.
+
+        Returns:
+            list[Knowledge]: The terminal transitions for the decisions that led to death.
+        """
+        transitions = []
+        if is_game_over:
+            self._add_reward(self.death_reward)
+            transitions = [
+                Knowledge(decision.state, decision.action, decision.discounted_return, None, decision.steps)
+                for decision in self.pending
+            ]
+        self.pending.clear()
+        return transitions
+
+    def _add_reward(self, reward: float):
+        """Add the reward of the interval that just elapsed to every pending decision's return."""
+        for decision in self.pending:
+            decision.discounted_return += self.discount_factor**decision.steps * reward
+            decision.steps += 1
@@ -0,0 +1,437 @@
+"""
+VectorizedEnvironment
+
+A NumPy re-implementation of the GameManager's game logic that steps many independent Flappy Bird games
+at once. Every bird, pipe, score and timer is an array with one row per game, so a whole population of
+birds advances with a handful of array operations per frame instead of one object graph per game.
+It follows `GameManager.update` frame for frame, including the bird's animation (which decides its
+hitbox), and needs no window.
+
+Key Features:
+- Steps N games per call: bird physics, animation, collisions, pipe movement, spawning, scoring and level ups.
+- Optional shared pipe course, so a population is evaluated against identical pipes.
+- Per-game resets for parallel actors.
+- Produces the normalized `EnvironmentState` features of every game at once.
+- Optional physics domain randomization: gravity, flap force, flap decay, pipe speed and gap heights drawn
+  per game from `PhysicsRanges` on every reset, exposed in `info` and optionally appended to the features.
+"""
+
+import math
+from dataclasses import dataclass, replace
+
+import numpy as np
+
+from flappy_trainer.ai.environment_state import EnvironmentState
+from flappy_trainer.config import DEFAULT_GAME_CONFIG, GameConfig
+from flappy_trainer.game_objects.bird.bird import Bird
+from flappy_trainer.game_objects.bird.bird_spritesheet import load_frame_hitboxes
+from flappy_trainer.utils import BirdFrame, BirdState
+
+# The `GameConfig` physics drawn per game by `PhysicsRanges`, in the order they are appended to the features
+PHYSICS_PARAMETERS = (
+    "bird_gravity",
+    "bird_flap_force",
+    "bird_flap_decay_force",
+    "initial_pipe_speed",
+    "pipe_min_gap_height",
+    "pipe_max_gap_height",
+)
+
+IDLE = BirdState.IDLE.value
+FLAPPING_UP = BirdState.FLAPPING_UP.value
+TRANSITION = BirdState.TRANSITION.value
+DESCENDING = BirdState.DESCENDING.value
+NOSE_DIVE = BirdState.NOSE_DIVE.value
+
+
+@dataclass(frozen=True)
+class PhysicsRanges:
+    """
+    The (low, high) ranges per-game physics are drawn uniformly from on every reset. A parameter left None
+    keeps the value of the environment's `GameConfig`. Gap heights are drawn as whole pixels.
+    """
+
+    bird_gravity: tuple[float, float] | None = None
+    bird_flap_force: tuple[float, float] | None = None
+    bird_flap_decay_force: tuple[float, float] | None = None
+    initial_pipe_speed: tuple[float, float] | None = None
+    pipe_min_gap_height: tuple[int, int] | None = None
+    pipe_max_gap_height: tuple[int, int] | None = None
+
+    def __post_init__(self):
+        for name in PHYSICS_PARAMETERS:
+            value_range = getattr(self, name)
+            if value_range is not None and not value_range[0] <= value_range[1]:
+                raise ValueError(f"The {name} range {value_range} must be (low, high) with low <= high.")
+
+    def sample(self, config: GameConfig, rng: np.random.Generator, count: int) -> dict[str, np.ndarray]:
+        """
+        Draw the physics of `count` games, one array per parameter in `PHYSICS_PARAMETERS`. Gap heights are
+        whole pixels and the max gap height is never below the min.
+        """
+        physics = {}
+        for name in PHYSICS_PARAMETERS:
+            value_range = getattr(self, name)
+            if value_range is None:
+                physics[name] = np.full(count, getattr(config, name), dtype=float)
+            else:
+                physics[name] = rng.uniform(*value_range, count)
+        np.round(physics["pipe_min_gap_height"], out=physics["pipe_min_gap_height"])
+        np.round(physics["pipe_max_gap_height"], out=physics["pipe_max_gap_height"])
+        np.maximum(physics["pipe_max_gap_height"], physics["pipe_min_gap_height"], out=physics["pipe_max_gap_height"])
+        return physics
+
+    def sample_config(self, config: GameConfig, rng: np.random.Generator) -> GameConfig:
+        """A copy of `config` with the physics of one game drawn from the ranges, e.g. for a `GameManager`."""
+        physics = {name: values[0].item() for name, values in self.sample(config, rng, 1).items()}
+        physics["pipe_min_gap_height"] = int(physics["pipe_min_gap_height"])
+        physics["pipe_max_gap_height"] = int(physics["pipe_max_gap_height"])
+        return replace(config, **physics)
+
+    @classmethod
+    def around(cls, config: GameConfig = DEFAULT_GAME_CONFIG, spread: float = 0.1) -> "PhysicsRanges":
+        """Ranges of +/- `spread` (a fraction) around every value of `config`."""
+        ranges = {}
+        for name in PHYSICS_PARAMETERS:
+            value = getattr(config, name)
+            ranges[name] = (value * (1 - spread), value * (1 + spread))
+        return cls(**ranges)
+
+
+class VectorizedEnvironment:
+    def __init__(
+        self,
+        num_envs: int,
+        is_pipes: bool = True,
+        pipe_gap_size_mode: str = "random",  # Options: 'large', 'small', 'random'
+        pipe_distance_mode: str = "random",  # Options: 'large', 'random'
+        pipe_gap_loc_mode: str = "random",  # Options: 'top', 'bottom', 'center', 'alternating', 'random'
+        shared_course: bool = False,
+        seed: int | None = None,
+        config: GameConfig = DEFAULT_GAME_CONFIG,
+        physics_ranges: PhysicsRanges | None = None,
+        observe_physics: bool = False,
+    ):
+        """
+        Initialize `num_envs` games, matching the options of `GameManager`.
+
+        Args:
+            shared_course: If True every game draws the same random pipes, so birds face identical courses.
+            seed: Seed for the pipe course random number generator.
+            config: The physics and geometry of every game.
+            physics_ranges: Ranges the physics of every game are drawn from on each reset. None keeps `config`'s.
+            observe_physics: If True the physics of each game, relative to `config`'s, are appended to its
+                features.
+        """
+        self.config = config
+        self.physics_ranges = physics_ranges
+        self.observe_physics = observe_physics
+        self.num_features = self.get_num_features(observe_physics)
+        self.num_envs = num_envs
+        self.is_pipes_active = is_pipes
+        self.pipe_gap_size_mode = pipe_gap_size_mode
+        self.pipe_distance_mode = pipe_distance_mode
+        self.pipe_gap_loc_mode = pipe_gap_loc_mode
+        self.shared_course = shared_course
+        self.rng = np.random.default_rng(seed)
+        self.max_pipes = self._get_max_pipes()
+        self.hitboxes = np.array([(rect.x, rect.y, rect.w, rect.h) for rect in load_frame_hitboxes()])
+        self._allocate()
+        self.reset()
+
+    @staticmethod
+    def get_num_features(observe_physics: bool = False) -> int:
+        """The number of features of each game's observation, with or without its physics appended."""
+        return EnvironmentState.get_num_features() + (len(PHYSICS_PARAMETERS) if observe_physics else 0)
+
+    def reset(self, mask: np.ndarray | None = None):
+        """Start new games for the environments selected by `mask` (all when None)."""
+        config = self.config
+        envs = np.ones(self.num_envs, dtype=bool) if mask is None else mask
+        count = int(envs.sum())
+
+        # Physics
+        physics = None if self.physics_ranges is None else self.physics_ranges.sample(config, self.rng, count)
+        for name in PHYSICS_PARAMETERS:
+            getattr(self, name)[envs] = getattr(config, name) if physics is None else physics[name]
+
+        # Bird
+        self.bird_y[envs] = config.bird_start_y_pos
+        self.bird_velocity[envs] = 0
+        self.animation_state[envs] = IDLE
+        self.bird_frame[envs] = BirdFrame.FLAPPING_TOP.value
+        self.time_since_animation_change[envs] = 0
+        self.alive[envs] = True
+        self.frames[envs] = 0
+
+        # Game progress
+        self.score[envs] = config.start_score
+        self.level[envs] = config.start_level
+        self.pipe_speed[envs] = self.initial_pipe_speed[envs]
+        self.next_level_score[envs] = config.start_score + config.score_per_level_up
+
+        # Pipes
+        self.pipe_active[envs] = False
+        self.pipe_passed[envs] = False
+        self.time_since_last_pipe[envs] = 0
+        if self.pipe_distance_mode == "large":
+            self.time_between_pipes[envs] = config.max_time_between_pipes
+        elif self.pipe_distance_mode == "random":
+            self.time_between_pipes[envs] = self._randint(
+                config.min_time_between_pipes, config.max_time_between_pipes, count
+            )
+        else:
+            self.time_between_pipes[envs] = config.min_time_between_pipes
+
+    def step(self, flap: np.ndarray | None = None, delta_time: float = 1 / 60) -> np.ndarray:
+        """
+        Apply the flaps, then advance every running game by one frame.
+
+        Args:
+            flap: Boolean array of the birds that flap before this frame.
+            delta_time: The frame time in seconds.
+
+        Returns:
+            np.ndarray: Boolean array of the birds that died during this frame.
+        """
+        config = self.config
+        running = self.alive.copy()
+        if flap is not None:
+            flapping = flap & running
+            self.bird_velocity[flapping] = -self.bird_flap_force[flapping]
+            self.animation_state[flapping] = FLAPPING_UP
+
+        self._update_birds(running, delta_time)
+        died = running & self._check_collisions()
+        self.alive[died] = False
+        if self.is_pipes_active:
+            self._update_pipes(running, delta_time)
+
+        level_up = running & (self.score >= self.next_level_score)
+        self.level[level_up] += 1
+        self.pipe_speed[level_up] = np.minimum(
+            self.pipe_speed[level_up] + config.pipe_speed_increase_per_level_up, config.max_pipe_velocity
+        )
+        self.next_level_score[level_up] += config.score_per_level_up
+        return died
+
+    @property
+    def info(self) -> dict[str, np.ndarray]:
+        """The physics of every game, one array per parameter in `PHYSICS_PARAMETERS`, updated in place on reset."""
+        return {name: getattr(self, name) for name in PHYSICS_PARAMETERS}
+
+    def get_observations(self, out: np.ndarray | None = None) -> np.ndarray:
+        """
+        Get the normalized `EnvironmentState` features of every game.
+
+        Args:
+            out: Optional float32 array of shape (num_envs, num_features) to write into.
+
+        Returns:
+            np.ndarray: The features, one row per game, followed by the physics of the game relative to the
+                config's when `observe_physics` is set.
+        """
+        config = self.config
+        if out is None:
+            out = np.empty((self.num_envs, self.num_features), dtype=np.float32)
+
+        out[:, 0] = self.bird_y / config.screen_height
+        out[:, 1] = self.bird_velocity / config.max_bird_velocity
+        out[:, 2] = (
+            self.initial_pipe_speed + self.level * config.pipe_speed_increase_per_level_up
+        ) / config.max_pipe_velocity
+
+        # Nearest and second nearest unpassed pipes, ordered by position
+        pipe_x = np.where(self.pipe_active & ~self.pipe_passed, self.pipe_x, np.inf)
+        rows = np.arange(self.num_envs)
+        for column in (3, 6):
+            index = pipe_x.argmin(axis=1)
+            has_pipe = np.isfinite(pipe_x[rows, index])
+            distance = self.pipe_x[rows, index] + config.pipe_width - config.bird_start_x_pos
+            out[:, column] = np.where(has_pipe, distance, config.screen_width) / config.screen_width
+            out[:, column + 1] = np.where(has_pipe, self.pipe_gap_center[rows, index], config.screen_height // 2)
+            out[:, column + 1] /= config.screen_height
+            out[:, column + 2] = np.where(has_pipe, self.pipe_gap_height[rows, index], config.screen_height // 4)
+            out[:, column + 2] /= config.screen_height
+            pipe_x[rows, index] = np.inf
+
+        if self.observe_physics:
+            column = EnvironmentState.get_num_features()
+            for name in PHYSICS_PARAMETERS:
+                out[:, column] = getattr(self, name) / getattr(config, name)
+                column += 1
+        return out
+
+    def _allocate(self):
+        """Allocate the per-game arrays once; resets only overwrite them."""
+        num_envs, max_pipes = self.num_envs, self.max_pipes
+        self.bird_y = np.zeros(num_envs)
+        self.bird_velocity = np.zeros(num_envs)
+        self.animation_state = np.zeros(num_envs, dtype=np.int64)
+        self.bird_frame = np.zeros(num_envs, dtype=np.int64)
+        self.time_since_animation_change = np.zeros(num_envs)
+        self.alive = np.zeros(num_envs, dtype=bool)
+        self.frames = np.zeros(num_envs, dtype=np.int64)
+        self.score = np.zeros(num_envs, dtype=np.int64)
+        self.level = np.zeros(num_envs, dtype=np.int64)
+        self.pipe_speed = np.zeros(num_envs)
+        self.next_level_score = np.zeros(num_envs, dtype=np.int64)
+        self.time_since_last_pipe = np.zeros(num_envs)
+        self.time_between_pipes = np.zeros(num_envs)
+        self.previous_gap_center = np.full(num_envs, -1, dtype=np.int64)  # -1 until the first alternating pipe
+        self.pipe_x = np.zeros((num_envs, max_pipes))
+        self.pipe_gap_center = np.zeros((num_envs, max_pipes), dtype=np.int64)
+        self.pipe_gap_height = np.zeros((num_envs, max_pipes), dtype=np.int64)
+        self.pipe_active = np.zeros((num_envs, max_pipes), dtype=bool)
+        self.pipe_passed = np.zeros((num_envs, max_pipes), dtype=bool)
+        for name in PHYSICS_PARAMETERS:
+            setattr(self, name, np.zeros(num_envs))
+
+    def _update_birds(self, running: np.ndarray, delta_time: float):
+        """Vectorized `Bird.update`: velocity, position, animation state and animation frame."""
+        config = self.config
+        decaying = running & (self.animation_state == FLAPPING_UP)
+        self.bird_velocity[decaying] *= self.bird_flap_decay_force[decaying]
+        self.bird_velocity[running] += self.bird_gravity[running] * delta_time
+        self.bird_y[running] += self.bird_velocity[running]
+        self.frames[running] += 1
+
+        velocity = self.bird_velocity
+        new_state = np.select(
+            [
+                velocity < Bird.FLAPPING_UP_THRESHOLD,
+                velocity < 0,
+                velocity > Bird.NOSE_DIVE_THRESHOLD,
+                velocity > 0,
+            ],
+            [FLAPPING_UP, TRANSITION, NOSE_DIVE, DESCENDING],
+            IDLE,
+        )
+        self.animation_state[running] = new_state[running]
+
+        self.time_since_animation_change[running] += delta_time
+        advance = running & (self.time_since_animation_change >= config.bird_animation_time)
+        self.time_since_animation_change[advance] = 0
+        frame, state = self.bird_frame, self.animation_state
+        next_flapping = np.where(frame + 1 > BirdFrame.FLAPPING_END.value, BirdFrame.FLAPPING_START.value, frame + 1)
+        next_descending = np.where(
+            frame + 1 > BirdFrame.DESCENDING_END.value, BirdFrame.DESCENDING_START.value, frame + 1
+        )
+        next_descending = np.where(frame == BirdFrame.DESCENDING_END.value, frame, next_descending)
+        new_frame = np.select(
+            [state == FLAPPING_UP, state == TRANSITION, state == DESCENDING, state == NOSE_DIVE],
+            [next_flapping, BirdFrame.DESCENDING_START.value, next_descending, BirdFrame.NOSE_DIVE.value],
+            BirdFrame.FLAPPING_TOP.value,
+        )
+        self.bird_frame[advance] = new_frame[advance]
+
+    def _check_collisions(self) -> np.ndarray:
+        """Vectorized `GameManager._check_bird_collision` against the screen bounds and every pipe."""
+        config = self.config
+        hits = (self.bird_y - config.bird_radius <= 0) | (self.bird_y + config.bird_radius >= config.screen_height)
+        if not self.pipe_active.any():
+            return hits
+
+        # Bird rect as built by `BaseBird.get_rect` (pygame rounds float offsets half away from zero)
+        hitbox = self.hitboxes[self.bird_frame]
+        bird_left = (config.bird_start_x_pos + hitbox[:, 0])[:, None]
+        bird_right = bird_left + hitbox[:, 2, None]
+        bird_top = _round_half_away_from_zero(hitbox[:, 1] + self.bird_y)[:, None]
+        bird_bottom = bird_top + hitbox[:, 3, None]
+
+        # Pipe rects as built by `PipeBase.update_rects` (pygame truncates float positions)
+        pipe_left = np.trunc(self.pipe_x)
+        top_pipe_bottom = self.pipe_gap_center - self.pipe_gap_height // 2
+        bot_pipe_top = self.pipe_gap_center + self.pipe_gap_height // 2
+
+        overlaps_column = (bird_left < pipe_left + config.pipe_width) & (pipe_left < bird_right)
+        hits_top = (bird_top < top_pipe_bottom) & (bird_bottom > 0) & (top_pipe_bottom > 0)
+        hits_bottom = (
+            (bird_bottom > bot_pipe_top) & (bird_top < config.screen_height) & (bot_pipe_top < config.screen_height)
+        )
+        return hits | (self.pipe_active & overlaps_column & (hits_top | hits_bottom)).any(axis=1)
+
+    def _update_pipes(self, running: np.ndarray, delta_time: float):
+        """Vectorized `GameManager._update_pipes`: move, score, remove and spawn pipes."""
+        config = self.config
+        moving = self.pipe_active & running[:, None]
+        self.pipe_x -= np.where(moving, (self.pipe_speed * delta_time)[:, None], 0)
+
+        passed = moving & ~self.pipe_passed & (self.pipe_x + config.pipe_width < config.bird_start_x_pos)
+        self.score += passed.sum(axis=1)
+        self.pipe_passed |= passed
+        self.pipe_active &= ~(moving & (self.pipe_x + config.pipe_width < 0))
+
+        self.time_since_last_pipe[running] += delta_time * 1000
+        spawning = running & (self.time_since_last_pipe >= self.time_between_pipes)
+        if spawning.any():
+            self._spawn_pipes(spawning)
+            self.time_since_last_pipe[spawning] = 0
+
+    def _spawn_pipes(self, spawning: np.ndarray):
+        """Vectorized `GameManager._spawn_pipe` for every game in `spawning`."""
+        config = self.config
+        count = int(spawning.sum())
+
+        # Determine gap height based on pipe_gap_size_mode
+        min_gap_height = self.pipe_min_gap_height[spawning].astype(np.int64)
+        max_gap_height = self.pipe_max_gap_height[spawning].astype(np.int64)
+        if self.pipe_gap_size_mode == "large":
+            gap_height = max_gap_height
+        elif self.pipe_gap_size_mode == "small":
+            gap_height = min_gap_height
+        else:
+            gap_height = self._randint(min_gap_height, max_gap_height, count)
+
+        # Determine gap center
+        third = config.screen_height // 3
+        if self.pipe_gap_loc_mode == "alternating":
+            previous = self.previous_gap_center[spawning]
+            gap_center = np.where(previous == third, config.screen_height - third, third)
+            self.previous_gap_center[spawning] = gap_center
+        elif self.pipe_gap_loc_mode == "center":
+            gap_center = np.full(count, config.screen_height // 2)
+        elif self.pipe_gap_loc_mode == "top":
+            gap_center = np.full(count, third)
+        elif self.pipe_gap_loc_mode == "bottom":
+            gap_center = np.full(count, config.screen_height - third)
+        else:
+            gap_center = self._randint(gap_height // 2 + 50, config.screen_height - gap_height // 2 - 50, count)
+
+        # Determine time between pipes based on pipe_distance_mode
+        if self.pipe_distance_mode == "large":
+            self.time_between_pipes[spawning] = config.max_time_between_pipes
+        elif self.pipe_distance_mode == "random":
+            self.time_between_pipes[spawning] = self._randint(
+                config.min_time_between_pipes, config.max_time_between_pipes, count
+            )
+
+        free_slots = ~self.pipe_active[spawning]
+        if not free_slots.any(axis=1).all():
+            raise RuntimeError(f"More than {self.max_pipes} pipes on screen.")
+        rows = np.flatnonzero(spawning)
+        slots = free_slots.argmax(axis=1)
+        self.pipe_x[rows, slots] = config.screen_width
+        self.pipe_gap_center[rows, slots] = gap_center
+        self.pipe_gap_height[rows, slots] = gap_height
+        self.pipe_active[rows, slots] = True
+        self.pipe_passed[rows, slots] = False
+
+    def _randint(self, low, high, count: int) -> np.ndarray:
+        """Draw integers in [low, high] (inclusive, like `random.randint`), shared across games if configured."""
+        uniform = self.rng.random() if self.shared_course else self.rng.random(count)
+        values = low + np.floor(uniform * (np.asarray(high) - low + 1)).astype(np.int64)
+        return np.broadcast_to(values, (count,))
+
+    def _get_max_pipes(self) -> int:
+        """The most pipes that can be on screen at once: the slowest pipes spawned as often as possible."""
+        config = self.config
+        min_speed = config.initial_pipe_speed
+        if self.physics_ranges is not None and self.physics_ranges.initial_pipe_speed is not None:
+            min_speed = min(min_speed, self.physics_ranges.initial_pipe_speed[0])
+        min_spacing = min_speed * config.min_time_between_pipes / 1000
+        return math.ceil((config.screen_width + config.pipe_width) / min_spacing) + 1
+
+
+def _round_half_away_from_zero(values: np.ndarray) -> np.ndarray:
+    return np.sign(values) * np.floor(np.abs(values) + 0.5)
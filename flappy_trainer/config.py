@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+
 from dotenv import load_dotenv
 
 from flappy_trainer.utils import get_env_var_as_float, get_env_var_as_int, get_env_var_as_string, get_env_var_as_tuple
@@ -6,18 +8,89 @@ load_dotenv()
 
 DEBUG = True
 
+
+@dataclass(frozen=True, slots=True)
+class GameConfig:
+    """
+    The physics and geometry of a game. Games, birds, pipes and state encoders take one of these, so
+    differently configured games can run side by side in one process. `from_env` reads the environment.
+    """
+
+    # Screen and Border
+    screen_width: int
+    screen_height: int
+    border_thickness: int
+
+    # Game Management
+    start_level: int
+    start_score: int
+    score_per_level_up: int
+
+    # Pipe Physics
+    initial_pipe_speed: int
+    pipe_speed_increase_per_level_up: int
+    max_pipe_velocity: int
+    pipe_width: int
+    pipe_min_height: int
+    pipe_min_gap_height: int
+    pipe_max_gap_height: int
+    min_time_between_pipes: int
+    max_time_between_pipes: int
+
+    # Bird Physics
+    bird_start_x_pos: int
+    bird_start_y_pos: int
+    bird_radius: int
+    bird_gravity: float
+    bird_flap_force: float
+    bird_flap_decay_force: float
+    max_bird_velocity: int
+    bird_animation_time: float = 0.05
+
+    @classmethod
+    def from_env(cls) -> "GameConfig":
+        """Read the config from the environment (and `.env`). Throws EnvironmentError if a value is missing."""
+        return cls(
+            screen_width=get_env_var_as_int("SCREEN_WIDTH"),
+            screen_height=get_env_var_as_int("SCREEN_HEIGHT"),
+            border_thickness=get_env_var_as_int("BORDER_THICKNESS"),
+            start_level=get_env_var_as_int("START_LEVEL"),
+            start_score=get_env_var_as_int("START_SCORE"),
+            score_per_level_up=get_env_var_as_int("SCORE_PER_LEVEL_UP"),
+            initial_pipe_speed=get_env_var_as_int("PIPE_SPEED"),
+            pipe_speed_increase_per_level_up=get_env_var_as_int("PIPE_SPEED_INCREASE_PER_LEVEL_UP"),
+            max_pipe_velocity=get_env_var_as_int("MAX_PIPE_SPEED"),
+            pipe_width=get_env_var_as_int("PIPE_WIDTH"),
+            pipe_min_height=get_env_var_as_int("PIPE_MIN_HEIGHT"),
+            pipe_min_gap_height=get_env_var_as_int("PIPE_MIN_GAP_HEIGHT"),
+            pipe_max_gap_height=get_env_var_as_int("PIPE_MAX_GAP_HEIGHT"),
+            min_time_between_pipes=get_env_var_as_int("MIN_TIME_BETWEEN_PIPES"),
+            max_time_between_pipes=get_env_var_as_int("MAX_TIME_BETWEEN_PIPES"),
+            bird_start_x_pos=get_env_var_as_int("BIRD_START_X_POS"),
+            bird_start_y_pos=get_env_var_as_int("BIRD_START_Y_POS"),
+            bird_radius=get_env_var_as_int("BIRD_RADIUS"),
+            bird_gravity=get_env_var_as_float("BIRD_GRAVITY"),
+            bird_flap_force=get_env_var_as_int("BIRD_FLAP_FORCE"),
+            bird_flap_decay_force=get_env_var_as_float("BIRD_FLAP_DECAY_FORCE"),
+            max_bird_velocity=get_env_var_as_int("BIRD_MAX_Y_VELOCITY"),
+        )
+
+
+# The config of games that are not given one. The module constants below are kept for compatibility.
+DEFAULT_GAME_CONFIG = GameConfig.from_env()
+
 # Screen, Background, and Border
-SCREEN_HEIGHT = get_env_var_as_int("SCREEN_HEIGHT")
-SCREEN_WIDTH = get_env_var_as_int("SCREEN_WIDTH")
+SCREEN_HEIGHT = DEFAULT_GAME_CONFIG.screen_height
+SCREEN_WIDTH = DEFAULT_GAME_CONFIG.screen_width
 BACKGROUND_COLOR = get_env_var_as_tuple("BACKGROUND_COLOR")
-BORDER_THICKNESS = get_env_var_as_int("BORDER_THICKNESS")
+BORDER_THICKNESS = DEFAULT_GAME_CONFIG.border_thickness
 BORDER_COLOR = get_env_var_as_tuple("BORDER_COLOR")
 
 # Game Management
-START_LEVEL = get_env_var_as_int("START_LEVEL")
-START_SCORE = get_env_var_as_int("START_SCORE")
-SCORE_PER_LEVEL_UP = get_env_var_as_int("SCORE_PER_LEVEL_UP")
-PIPE_SPEED_INCREASE_PER_LEVEL_UP = get_env_var_as_int("PIPE_SPEED_INCREASE_PER_LEVEL_UP")
+START_LEVEL = DEFAULT_GAME_CONFIG.start_level
+START_SCORE = DEFAULT_GAME_CONFIG.start_score
+SCORE_PER_LEVEL_UP = DEFAULT_GAME_CONFIG.score_per_level_up
+PIPE_SPEED_INCREASE_PER_LEVEL_UP = DEFAULT_GAME_CONFIG.pipe_speed_increase_per_level_up
 
 # Pipe SpriteSheet
 PIPE_SPRITE_SHEET_PATH = get_env_var_as_string("PIPE_SPRITE_SHEET_PATH")
@@ -26,17 +99,16 @@ PIPE_SPRITE_SHEET_FRAME_HEIGHT = get_env_var_as_int("PIPE_SPRITE_SHEET_FRAME_HEI
 PIPE_SPRITE_SHEET_SCALE_FACTOR = get_env_var_as_float("PIPE_SPRITE_SHEET_SCALE_FACTOR")
 
 # Pipe Physics
-INITIAL_PIPE_SPEED = get_env_var_as_int("PIPE_SPEED")
-PIPE_SPEED_INCREASE_PER_LEVEL_UP = get_env_var_as_int("PIPE_SPEED_INCREASE_PER_LEVEL_UP")
-MAX_PIPE_VELOCITY = get_env_var_as_int("MAX_PIPE_SPEED")
-PIPE_WIDTH = get_env_var_as_int("PIPE_WIDTH")
-PIPE_MIN_HEIGHT = get_env_var_as_int("PIPE_MIN_HEIGHT")
-PIPE_MIN_GAP_HEIGHT = get_env_var_as_int("PIPE_MIN_GAP_HEIGHT")
-PIPE_MAX_GAP_HEIGHT = get_env_var_as_int("PIPE_MAX_GAP_HEIGHT")
+INITIAL_PIPE_SPEED = DEFAULT_GAME_CONFIG.initial_pipe_speed
+MAX_PIPE_VELOCITY = DEFAULT_GAME_CONFIG.max_pipe_velocity
+PIPE_WIDTH = DEFAULT_GAME_CONFIG.pipe_width
+PIPE_MIN_HEIGHT = DEFAULT_GAME_CONFIG.pipe_min_height
+PIPE_MIN_GAP_HEIGHT = DEFAULT_GAME_CONFIG.pipe_min_gap_height
+PIPE_MAX_GAP_HEIGHT = DEFAULT_GAME_CONFIG.pipe_max_gap_height
 PIPE_DEFAULT_GAP_HEIGHT = 150
 PIPE_DEFAULT_Y_POS = 150
-MIN_TIME_BETWEEN_PIPES = get_env_var_as_int("MIN_TIME_BETWEEN_PIPES")
-MAX_TIME_BETWEEN_PIPES = get_env_var_as_int("MAX_TIME_BETWEEN_PIPES")
+MIN_TIME_BETWEEN_PIPES = DEFAULT_GAME_CONFIG.min_time_between_pipes
+MAX_TIME_BETWEEN_PIPES = DEFAULT_GAME_CONFIG.max_time_between_pipes
 
 # Bird SpriteSheet
 BIRD_SPRITE_SHEET_PATH = get_env_var_as_string("BIRD_SPRITE_SHEET_PATH")
@@ -47,15 +119,15 @@ BIRD_SPRITE_SHEET_START_Y = get_env_var_as_int("BIRD_SPRITE_SHEET_START_Y")
 BIRD_SPRITE_SHEET_PADDING_X = get_env_var_as_int("BIRD_SPRITE_SHEET_PADDING_X")
 
 # Bird Physics
-BIRD_START_X_POS = get_env_var_as_int("BIRD_START_X_POS")
-BIRD_START_Y_POS = get_env_var_as_int("BIRD_START_Y_POS")
-BIRD_RADIUS = get_env_var_as_int("BIRD_RADIUS")
+BIRD_START_X_POS = DEFAULT_GAME_CONFIG.bird_start_x_pos
+BIRD_START_Y_POS = DEFAULT_GAME_CONFIG.bird_start_y_pos
+BIRD_RADIUS = DEFAULT_GAME_CONFIG.bird_radius
 BIRD_COLOR = get_env_var_as_tuple("BIRD_COLOR")
-BIRD_GRAVITY = get_env_var_as_float("BIRD_GRAVITY")
-BIRD_FLAP_FORCE = get_env_var_as_int("BIRD_FLAP_FORCE")
-BIRD_FLAP_DECAY_FORCE = get_env_var_as_float("BIRD_FLAP_DECAY_FORCE")
-MAX_BIRD_VELOCITY = get_env_var_as_int("BIRD_MAX_Y_VELOCITY")
-BIRD_ANIMATION_TIME = 0.05
+BIRD_GRAVITY = DEFAULT_GAME_CONFIG.bird_gravity
+BIRD_FLAP_FORCE = DEFAULT_GAME_CONFIG.bird_flap_force
+BIRD_FLAP_DECAY_FORCE = DEFAULT_GAME_CONFIG.bird_flap_decay_force
+MAX_BIRD_VELOCITY = DEFAULT_GAME_CONFIG.max_bird_velocity
+BIRD_ANIMATION_TIME = DEFAULT_GAME_CONFIG.bird_animation_time
 
 
 AGENT_MAX_MEMORY = get_env_var_as_int("AGENT_MAX_MEMORY")
@@ -8,8 +8,10 @@ this class to implement specific game mechanics and behaviors.
 
 Key Features:
 - Initializes and manages the game screen and basic configurations.
+- Optional headless mode that renders to a plain offscreen surface and never opens a window.
 - Supports start and pause menus.
 - Provides methods for rendering the game canvas and managing pipe timing.
+- Keeps a pre-rendered copy of the static background for partial redraws.
 - Abstract methods enforce implementation of game-specific logic in subclasses.
 """
 
@@ -17,30 +19,32 @@ from abc import ABC, abstractmethod
 
 import pygame
 
-from flappy_trainer.config import (
-    BACKGROUND_COLOR,
-    BORDER_COLOR,
-    BORDER_THICKNESS,
-    PIPE_SPEED_INCREASE_PER_LEVEL_UP,
-    SCORE_PER_LEVEL_UP,
-    SCREEN_HEIGHT,
-    SCREEN_WIDTH,
-)
+from flappy_trainer.config import BACKGROUND_COLOR, BORDER_COLOR, DEFAULT_GAME_CONFIG, GameConfig
 from flappy_trainer.game_menus.pause_menu import PauseMenu
 from flappy_trainer.game_menus.start_menu import StartMenu
 
 
 class BaseGameManager(ABC):
-    def __init__(self):
+    def __init__(self, config: GameConfig = DEFAULT_GAME_CONFIG, headless: bool = False):
+        self.config = config
+        self.headless = headless  # Render to an offscreen surface, never opening a window
+
         # Screen Setup
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        screen_size = (config.screen_width, config.screen_height)
+        if headless:
+            self.screen = pygame.Surface(screen_size)
+            self.background = pygame.Surface(screen_size)
+        else:
+            self.screen = pygame.display.set_mode(screen_size)
+            self.background = pygame.Surface(screen_size).convert()
+            pygame.display.set_caption("Flappy Trainer")
         self.screen.fill(BACKGROUND_COLOR)
+        self.draw_background(self.background, config)
         self.font = pygame.font.Font(None, 36)
-        pygame.display.set_caption("Flappy Trainer")
 
         # Game Parameters
-        self.score_per_level_up = SCORE_PER_LEVEL_UP
-        self.pipe_speed_increase_per_level_up = PIPE_SPEED_INCREASE_PER_LEVEL_UP
+        self.score_per_level_up = config.score_per_level_up
+        self.pipe_speed_increase_per_level_up = config.pipe_speed_increase_per_level_up
 
         # Timers and Game Clock
         self.pipe_timer = 0
@@ -53,23 +57,29 @@ class BaseGameManager(ABC):
 
     def draw_canvas(self):
         """Render the game canvas and draw the screen borders."""
+        self.screen.blit(self.background, (0, 0))
+
+    @staticmethod
+    def draw_background(surface: pygame.Surface, config: GameConfig = DEFAULT_GAME_CONFIG):
+        """Draw the static background: the fill color and the top and bottom borders."""
+        width, height = surface.get_size()
         # Fill the background
-        self.screen.fill(BACKGROUND_COLOR)
+        surface.fill(BACKGROUND_COLOR)
 
         # Draw top and bottom borders
         pygame.draw.rect(
-            self.screen,
+            surface,
             BORDER_COLOR,
-            pygame.Rect(0, 0, SCREEN_WIDTH, BORDER_THICKNESS),
+            pygame.Rect(0, 0, width, config.border_thickness),
         )
         pygame.draw.rect(
-            self.screen,
+            surface,
             BORDER_COLOR,
             pygame.Rect(
                 0,
-                SCREEN_HEIGHT - BORDER_THICKNESS,
-                SCREEN_WIDTH,
-                BORDER_THICKNESS,
+                height - config.border_thickness,
+                width,
+                config.border_thickness,
             ),
         )
 
@@ -0,0 +1,102 @@
+"""
+FixedTimestepLoop
+
+Paces the human game loop and decouples its physics from the frame rate. Every rendered frame adds the real
+time it took to an accumulator, and the game is stepped in fixed `step_time` increments (1/60 s, the step the
+AI trains with) for as long as the accumulator holds a whole step. The fraction of a step left over is the
+interpolation used to draw moving objects between their last two simulated positions.
+
+The loop also records how long every frame took, so frame pacing can be measured.
+
+Key Features:
+- Fixed-step physics that matches training, whatever the frame rate.
+- A cap on the steps per frame, so a long stall drops simulation time instead of spiraling.
+- Render interpolation between the last two physics steps.
+- Frame-time percentiles (p50/p99) and counts of dropped frames and dropped steps.
+"""
+
+from collections import deque
+from typing import Iterator
+
+import numpy as np
+import pygame
+
+
+class FixedTimestepLoop:
+    def __init__(
+        self,
+        step_time: float = 1 / 60,
+        target_fps: int = 60,
+        max_steps_per_frame: int = 5,
+        history_size: int = 3600,
+    ):
+        """
+        Args:
+            step_time: The seconds simulated by each physics step.
+            target_fps: The frame rate the loop is paced to.
+            max_steps_per_frame: The most physics steps one frame may run. Time beyond them is dropped.
+            history_size: The number of recent frame times kept for the pacing stats.
+        """
+        self.step_time = step_time
+        self.target_fps = target_fps
+        self.max_steps_per_frame = max_steps_per_frame
+        self.clock = pygame.time.Clock()
+        self.accumulator = 0.0
+        self.frame_times: deque[float] = deque(maxlen=history_size)
+        self.num_frames = 0
+        self.dropped_frames = 0  # Frames that took more than 1.5 target frame times
+        self.dropped_steps = 0  # Physics steps skipped because a frame ran out of steps
+
+    @property
+    def interpolation(self) -> float:
+        """How far (0-1) the current frame is between the last physics step and the next one."""
+        return min(self.accumulator / self.step_time, 1.0)
+
+    def tick(self) -> float:
+        """
+        Wait for the next frame, record its frame time and add it to the accumulator.
+
+        Returns:
+            float: The seconds since the previous frame.
+        """
+        frame_time = self.clock.tick(self.target_fps) / 1000
+        self.add_frame_time(frame_time)
+        return frame_time
+
+    def add_frame_time(self, frame_time: float):
+        """Record a frame that took `frame_time` seconds and add it to the accumulator."""
+        if self.num_frames:  # The first frame's time includes everything before the loop started
+            self.frame_times.append(frame_time)
+            if frame_time > 1.5 / self.target_fps:
+                self.dropped_frames += 1
+        self.num_frames += 1
+        self.accumulator += frame_time
+
+    def steps(self) -> Iterator[int]:
+        """Yield once for every whole physics step in the accumulator, consuming it."""
+        num_steps = 0
+        while self.accumulator >= self.step_time:
+            if num_steps == self.max_steps_per_frame:
+                dropped = int(self.accumulator // self.step_time)
+                self.dropped_steps += dropped
+                self.accumulator -= dropped * self.step_time
+                break
+            self.accumulator -= self.step_time
+            yield num_steps
+            num_steps += 1
+
+    def get_frame_time_percentile(self, percentile: float) -> float:
+        """The given percentile of the recent frame times, in seconds."""
+        if not self.frame_times:
+            return 0.0
+        return float(np.percentile(np.fromiter(self.frame_times, dtype=np.float64), percentile))
+
+    def get_stats(self) -> dict[str, float]:
+        """The frame pacing stats: p50 and p99 frame time in milliseconds, dropped frames and dropped steps."""
+        return {
+            "frames": self.num_frames,
+            "p50_frame_time_ms": self.get_frame_time_percentile(50) * 1000,
+            "p99_frame_time_ms": self.get_frame_time_percentile(99) * 1000,
+            "dropped_frames": self.dropped_frames,
+            "dropped_steps": self.dropped_steps,
+        }
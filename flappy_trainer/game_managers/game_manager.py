@@ -7,30 +7,27 @@ It extends the `BaseGameManager` to implement specific game logic for Flappy Bir
 Key Features:
 - Manages game states (Start Menu, Running, Paused, Game Over).
 - Handles user input and game object updates (bird, pipes, score, and level).
-- Implements collision detection and spawning of pipes.
+- Implements collision detection and spawning of pipes. Collisions are only tested against the pipes
+  overlapping the bird's column, with an optional pixel-perfect test against the bird's frame mask.
 - Draws game elements, including HUD and menus.
+- Optional dirty-rect rendering: only the areas that changed since the last frame are redrawn over the
+  cached background and pushed to the display.
+- Optional render interpolation between the last two updates, for fixed-timestep game loops.
+- Advances many frames in one call (e.g. a whole action interval) with the bird's closed-form trajectory
+  and swept collision checks, so nothing tunnels through a pipe or the screen bounds between frames.
 """
 
-from random import randint
+import math
+from random import Random, randint
 
 import pygame
 
-from flappy_trainer.config import (
-    INITIAL_PIPE_SPEED,
-    MAX_PIPE_VELOCITY,
-    MAX_TIME_BETWEEN_PIPES,
-    MIN_TIME_BETWEEN_PIPES,
-    PIPE_MAX_GAP_HEIGHT,
-    PIPE_MIN_GAP_HEIGHT,
-    PIPE_WIDTH,
-    SCREEN_HEIGHT,
-    START_LEVEL,
-    START_SCORE,
-)
+from flappy_trainer.config import DEFAULT_GAME_CONFIG, GameConfig
 from flappy_trainer.game_managers.base_game_manager import BaseGameManager
 from flappy_trainer.game_objects.bird.bird import Bird
+from flappy_trainer.game_objects.bird.bird_trajectory import BirdTrajectory
 from flappy_trainer.game_objects.pipe.pipe import Pipe
-from flappy_trainer.utils import GameState, PipeColor
+from flappy_trainer.utils import BirdFrame, CachedText, GameState, PipeColor
 
 
 class GameManager(BaseGameManager):
@@ -40,9 +37,13 @@ class GameManager(BaseGameManager):
         pipe_gap_size_mode: str = "random",  # Options: 'large', 'small', 'random'
         pipe_distance_mode: str = "random",  # Options: 'large', 'random'
         pipe_gap_loc_mode: str = "random",  # Options: 'top', 'bottom', 'center', 'alternating', 'random',
+        dirty_rect_rendering: bool = False,
+        config: GameConfig = DEFAULT_GAME_CONFIG,
+        pixel_perfect_collision: bool = False,
+        headless: bool = False,
     ):
         """Initialize the game manager with the initial state and menus."""
-        super().__init__()
+        super().__init__(config, headless)
         self.state = GameState.START_MENU
         self.bird = None
         self.pipes = []
@@ -51,25 +52,38 @@ class GameManager(BaseGameManager):
         self.pipe_distance_mode = pipe_distance_mode
         self.pipe_gap_loc_mode = pipe_gap_loc_mode
         self.previous_gap_center = None
+        self.rng: Random | None = None  # The game's own random generator, the global one when None
+        self.dirty_rect_rendering = dirty_rect_rendering
+        self.pixel_perfect_collision = pixel_perfect_collision  # Also test the bird's pixels, not just its rect
+        self.score_text = CachedText(self.font, "Score: {}", (255, 255, 255))
+        self.level_text = CachedText(self.font, "Level: {}", (255, 255, 255))
+        self._drawn_rects: list[pygame.Rect] | None = None  # Areas drawn last frame, None to redraw everything
 
-    def start_game(self):
-        """Reset and initialize game objects to start the game."""
+    def start_game(self, seed: int | None = None):
+        """
+        Reset and initialize game objects to start the game. A seed gives the game its own pipe course; without
+        one the game draws from the global random generator again.
+        """
         super().reset()
-        self.bird = Bird()
+        self.rng = Random(seed) if seed is not None else None
+        self.bird = Bird(self.config)
+        self.previous_bird_y_pos = self.bird.y_pos
         self.pipes = []
         self.state = GameState.RUNNING
-        self.level = START_LEVEL
-        self.score = START_SCORE
-        self.pipe_speed = INITIAL_PIPE_SPEED
+        self.level = self.config.start_level
+        self.score = self.config.start_score
+        self.pipe_speed = self.config.initial_pipe_speed
         self.next_level_score = self.score + self.score_per_level_up
         self.time_since_last_pipe = 0
 
         if self.pipe_distance_mode == "large":
-            self.time_between_pipes = MAX_TIME_BETWEEN_PIPES
+            self.time_between_pipes = self.config.max_time_between_pipes
         elif self.pipe_distance_mode == "random":
-            self.time_between_pipes = randint(MIN_TIME_BETWEEN_PIPES, MAX_TIME_BETWEEN_PIPES)
+            self.time_between_pipes = self._randint(
+                self.config.min_time_between_pipes, self.config.max_time_between_pipes
+            )
         else:
-            self.time_between_pipes = MIN_TIME_BETWEEN_PIPES
+            self.time_between_pipes = self.config.min_time_between_pipes
 
     def handle_event(self, event: pygame.event.Event):
         """Handle user input events based on the current game state."""
@@ -89,6 +103,7 @@ class GameManager(BaseGameManager):
         if self.state not in {GameState.RUNNING}:
             return
 
+        self.previous_bird_y_pos = self.bird.y_pos
         self.bird.update(delta_time)
         self._check_bird_collision()
         if self.is_pipes_active:
@@ -97,8 +112,55 @@ class GameManager(BaseGameManager):
         if self.score >= self.next_level_score:
             self._level_up()
 
-    def draw(self):
-        """Draw all game elements on the screen."""
+    def advance(self, duration: float, frame_time: float = 1 / 60) -> int:
+        """
+        Simulate `duration` seconds in one call, as if `update(frame_time)` were called once per frame. The bird
+        moves along its closed-form trajectory and collisions are swept over every frame in between, so a long
+        duration cannot skip past a pipe or the screen bounds. Pipes match per-frame updates exactly, the bird
+        up to float rounding.
+
+        Returns:
+            int: The frames simulated, fewer than `duration` holds if the bird dies.
+        """
+        num_frames = round(duration / frame_time)
+        simulated = 0
+        while simulated < num_frames and self.state == GameState.RUNNING:
+            # Split where a pipe spawns or passes the bird, so those only happen on the last frame of a span
+            span = num_frames - simulated
+            if self.is_pipes_active:
+                span = self._get_frames_until_pipe_event(frame_time, span)
+            trajectory = BirdTrajectory(self.bird, frame_time)
+            collision_frame = self._find_first_collision(trajectory, span, frame_time)
+            frames = span if collision_frame is None else collision_frame
+
+            self.previous_bird_y_pos = trajectory.get_y_pos(frames - 1)
+            trajectory.apply(self.bird, frames)
+            if collision_frame is not None:
+                self._game_over()
+            if self.is_pipes_active:
+                self._advance_pipes(frames, frame_time)
+            if self.score >= self.next_level_score:
+                self._level_up()
+            simulated += frames
+        return simulated
+
+    def draw(self, interpolation: float = 1.0):
+        """
+        Draw all game elements on the screen.
+
+        Args:
+            interpolation: How far (0-1) between their positions before and after the last update the bird
+                and pipes are drawn. Fixed-timestep loops pass the fraction of a step their frame is into.
+        """
+        if interpolation < 1 and self.state == GameState.RUNNING:
+            self._draw_interpolated(interpolation)
+            return
+
+        if self.dirty_rect_rendering and self.state == GameState.RUNNING:
+            self._draw_dirty_rects()
+            return
+
+        self._drawn_rects = None  # The next dirty-rect frame starts from a full redraw
         super().draw_canvas()
         if self.state in {GameState.START_MENU, GameState.GAME_OVER}:
             self.start_menu.draw(self.screen)
@@ -110,13 +172,54 @@ class GameManager(BaseGameManager):
                 pipe.draw(self.screen)
             self._draw_hud()
 
-        pygame.display.flip()
+        if not self.headless:
+            pygame.display.flip()
+
+    def _draw_interpolated(self, interpolation: float):
+        """Draw the bird and pipes part of the way back to their positions before the last update."""
+        lag = 1 - interpolation
+        bird_y_pos = self.bird.y_pos
+        pipe_x_positions = [pipe.x_pos for pipe in self.pipes]
+        self.bird.y_pos -= (bird_y_pos - self.previous_bird_y_pos) * lag
+        for pipe in self.pipes:
+            # From each pipe's own last move, not the current speed, which a level-up may just have changed
+            pipe.x_pos -= (pipe.x_pos - pipe.previous_x_pos) * lag
+        try:
+            self.draw()
+        finally:
+            # Restore the exact positions, so drawing never changes the simulation
+            self.bird.y_pos = bird_y_pos
+            for pipe, x_pos in zip(self.pipes, pipe_x_positions):
+                pipe.x_pos = x_pos
+
+    def _draw_dirty_rects(self):
+        """
+        Erase the areas drawn last frame with the cached background, draw the game again, and push only the
+        old and new areas of the bird, the pipe columns and the HUD to the display.
+        """
+        previous_rects = self._drawn_rects
+        if previous_rects is None:
+            self.screen.blit(self.background, (0, 0))
+        else:
+            for rect in previous_rects:
+                self.screen.blit(self.background, rect, rect)
+
+        drawn_rects = [self.bird.draw(self.screen)]
+        drawn_rects.extend(pipe.draw(self.screen) for pipe in self.pipes)
+        drawn_rects.extend(self._draw_hud())
+
+        if not self.headless:
+            if previous_rects is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(previous_rects + drawn_rects)
+        self._drawn_rects = drawn_rects
 
     def _update_pipes(self, delta_time: float):
         """Move pipes and spawn new ones based on time elapsed."""
         for pipe in self.pipes:
             pipe.update_position(self.pipe_speed * delta_time)
-            if not pipe.passed and (pipe.x_pos + PIPE_WIDTH) < self.bird.x_pos:
+            if not pipe.passed and (pipe.x_pos + self.config.pipe_width) < self.bird.x_pos:
                 self.score += 1
                 pipe.passed = True
 
@@ -132,17 +235,162 @@ class GameManager(BaseGameManager):
     def _check_bird_collision(self):
         """Check for collisions between the bird and obstacles."""
         # Check for collisions with screen boundaries
-        if self.bird.y_pos - self.bird.radius <= 0 or self.bird.y_pos + self.bird.radius >= SCREEN_HEIGHT:
+        if self.bird.y_pos - self.bird.radius <= 0 or self.bird.y_pos + self.bird.radius >= self.config.screen_height:
             self._game_over()
             return
 
-        # Check for collisions with pipes
+        # Check for collisions with the pipes overlapping the bird's column
         bird_rect = self.bird.get_rect()
-        for pipe in self.pipes:
-            if pipe.collides_with(bird_rect):
+        for pipe in self._get_pipes_in_column(bird_rect):
+            if pipe.collides_with(bird_rect) and (
+                not self.pixel_perfect_collision
+                or self.bird.overlaps_rect(pipe.top_pipe_rect, bird_rect)
+                or self.bird.overlaps_rect(pipe.bot_pipe_rect, bird_rect)
+            ):
                 self._game_over()
                 break
 
+    def _get_pipes_in_column(self, bird_rect: pygame.Rect) -> list[Pipe]:
+        """
+        Broad phase: the pipes whose x-range overlaps the bird's. Pipes are kept in spawn order, which is also
+        their order on screen, so the search stops at the first pipe right of the bird.
+        """
+        pipes = []
+        for pipe in self.pipes:
+            pipe_rect = pipe.top_pipe_rect
+            if pipe_rect.left >= bird_rect.right:
+                break
+            if pipe_rect.right > bird_rect.left:
+                pipes.append(pipe)
+        return pipes
+
+    def _get_frames_until_pipe_event(self, frame_time: float, max_frames: int) -> int:
+        """The frames (1 to `max_frames`) until the next pipe spawns or the nearest unpassed pipe passes the bird."""
+        frames, time_since_last_pipe = 0, self.time_since_last_pipe
+        while frames < max_frames:  # Accumulated frame by frame like `_update_pipes`
+            time_since_last_pipe += frame_time * 1000
+            frames += 1
+            if time_since_last_pipe >= self.time_between_pipes:
+                break
+
+        distance_per_frame = self.pipe_speed * frame_time
+        unpassed_pipes = (pipe for pipe in self.pipes if not pipe.passed)
+        pipe = next(unpassed_pipes, None)  # The nearest, pipes are in spawn order
+        if pipe is not None:
+            x_pos = pipe.x_pos
+            for frame in range(1, frames + 1):  # Moved frame by frame like `_update_pipes`, to pass on the same frame
+                x_pos -= distance_per_frame
+                if x_pos + self.config.pipe_width < self.bird.x_pos:
+                    return frame
+        return frames
+
+    def _find_first_collision(self, trajectory: BirdTrajectory, num_frames: int, frame_time: float) -> int | None:
+        """
+        Swept collision: the first of the next `num_frames` frames on which the bird hits the screen bounds or
+        a pipe (None if it hits nothing). On frame k the bird is at its trajectory's frame k and the pipes have
+        moved k - 1 times, as in `update`.
+        """
+        collision_frame = self._find_first_bounds_collision(trajectory, num_frames)
+        last_frame = num_frames if collision_frame is None else collision_frame - 1
+
+        bird_x = self.bird.x_pos
+        envelope = self.bird.hitboxes[0].unionall(self.bird.hitboxes[1:])  # Every frame's hitbox, frame-relative
+        distance_per_frame = self.pipe_speed * frame_time
+        pipe_width = self.config.pipe_width
+        for pipe in self.pipes:
+            # Frames the pipe's column can overlap the bird's, with a pixel of slack for the rects' rounding
+            x_pos = pipe.x_pos
+            if distance_per_frame > 0:
+                first = max(math.floor((x_pos - bird_x - envelope.right - 1) / distance_per_frame) + 1, 1)
+                last = min(
+                    math.ceil((x_pos + pipe_width - bird_x - envelope.left + 1) / distance_per_frame) + 1, last_frame
+                )
+            elif x_pos < bird_x + envelope.right + 1 and x_pos + pipe_width > bird_x + envelope.left - 1:
+                first, last = 1, last_frame
+            else:
+                continue
+            if first > last:
+                continue
+
+            # Skip the pipe if the bird stays inside the gap over all of those frames
+            lowest_y_pos, highest_y_pos = trajectory.get_y_range(first, last)
+            if (
+                lowest_y_pos + envelope.top - 1 >= pipe.top_pipe_rect.bottom
+                and highest_y_pos + envelope.bottom + 1 <= pipe.bot_pipe_rect.top
+            ):
+                continue
+
+            pipe_x_pos = x_pos
+            for _ in range(first - 1):  # Moved frame by frame like `_update_pipes`, to round the same way
+                pipe_x_pos -= distance_per_frame
+            for frame in range(first, last + 1):
+                top_pipe_rect = pygame.Rect(pipe_x_pos, 0, pipe_width, pipe.top_pipe_height)
+                bot_pipe_rect = pygame.Rect(pipe_x_pos, pipe.bot_pipe_rect.top, pipe_width, pipe.bot_pipe_height)
+                animation_frame = trajectory.get_animation_frame(frame)
+                bird_rect = self.bird.hitboxes[animation_frame.value].copy()
+                bird_rect.x += bird_x
+                bird_rect.y += trajectory.get_y_pos(frame)
+                if self._collides_with_pipe_rects(bird_rect, (top_pipe_rect, bot_pipe_rect), animation_frame):
+                    collision_frame = frame
+                    last_frame = frame - 1
+                    break
+                pipe_x_pos -= distance_per_frame
+        return collision_frame
+
+    def _find_first_bounds_collision(self, trajectory: BirdTrajectory, num_frames: int) -> int | None:
+        """The first of the next `num_frames` frames on which the bird touches the top or bottom of the screen."""
+        top_y_pos = self.bird.radius
+        bottom_y_pos = self.config.screen_height - self.bird.radius
+
+        def hits_top(frame: int) -> bool:
+            return trajectory.get_y_pos(frame) <= top_y_pos
+
+        def hits_bottom(frame: int) -> bool:
+            return trajectory.get_y_pos(frame) >= bottom_y_pos
+
+        # The bird rises until its turning frame and falls after it, so each check flips at most once per part
+        turning_frame = min(trajectory.turning_frame, num_frames)
+        if turning_frame >= 1:
+            if hits_bottom(1):
+                return 1
+            frame = _find_first_frame(hits_top, 1, turning_frame)
+            if frame is not None:
+                return frame
+        if turning_frame < num_frames:
+            if hits_top(turning_frame + 1):
+                return turning_frame + 1
+            return _find_first_frame(hits_bottom, turning_frame + 1, num_frames)
+        return None
+
+    def _collides_with_pipe_rects(
+        self, bird_rect: pygame.Rect, pipe_rects: tuple[pygame.Rect, pygame.Rect], frame: BirdFrame
+    ) -> bool:
+        """Whether the bird, drawn with `frame` at `bird_rect`, hits either rect of a pipe."""
+        return any(
+            bird_rect.colliderect(pipe_rect)
+            and (not self.pixel_perfect_collision or self.bird.overlaps_rect(pipe_rect, bird_rect, frame))
+            for pipe_rect in pipe_rects
+        )
+
+    def _advance_pipes(self, num_frames: int, frame_time: float):
+        """`_update_pipes` for `num_frames` frames in which pipes spawn and pass the bird only on the last one."""
+        distance_per_frame = self.pipe_speed * frame_time
+        for pipe in self.pipes:
+            for _ in range(num_frames):  # Frame by frame like `_update_pipes`, so positions match it exactly
+                pipe.previous_x_pos = pipe.x_pos
+                pipe.x_pos -= distance_per_frame
+            pipe.update_rects()
+            if not pipe.passed and (pipe.x_pos + self.config.pipe_width) < self.bird.x_pos:
+                self.score += 1
+                pipe.passed = True
+        self.pipes = [pipe for pipe in self.pipes if not pipe.is_off_screen()]
+
+        for _ in range(num_frames):
+            self.time_since_last_pipe += frame_time * 1000
+        if self.time_since_last_pipe >= self.time_between_pipes:
+            self._spawn_pipe()
+            self.time_since_last_pipe = 0
+
     def _game_over(self):
         """Handle game-over logic."""
         self.bird.die()
@@ -151,52 +399,69 @@ class GameManager(BaseGameManager):
     def _level_up(self):
         """Increase level and adjust game difficulty."""
         self.level += 1
-        self.pipe_speed = min(self.pipe_speed + self.pipe_speed_increase_per_level_up, MAX_PIPE_VELOCITY)
+        self.pipe_speed = min(self.pipe_speed + self.pipe_speed_increase_per_level_up, self.config.max_pipe_velocity)
         self.next_level_score += self.score_per_level_up
 
-    def _draw_hud(self):
-        """Draw the HUD with score and level information."""
-        score_text = self.font.render(f"Score: {self.score}", True, (255, 255, 255))
-        level_text = self.font.render(f"Level: {self.level}", True, (255, 255, 255))
-        self.screen.blit(score_text, (10, 10))
-        self.screen.blit(level_text, (10, 50))
+    def _draw_hud(self) -> list[pygame.Rect]:
+        """Draw the HUD with score and level information and return the areas drawn."""
+        score_text = self.score_text.render(self.score)
+        level_text = self.level_text.render(self.level)
+        return [self.screen.blit(score_text, (10, 10)), self.screen.blit(level_text, (10, 50))]
+
+    def _randint(self, low: int, high: int) -> int:
+        return self.rng.randint(low, high) if self.rng else randint(low, high)
 
     def _spawn_pipe(self):
         """Spawn a new pipe and add it to the list of pipes."""
         # Determine gap height based on pipe_gap_size_mode
         if self.pipe_gap_size_mode == "large":
-            gap_height = PIPE_MAX_GAP_HEIGHT
+            gap_height = self.config.pipe_max_gap_height
         elif self.pipe_gap_size_mode == "small":
-            gap_height = PIPE_MIN_GAP_HEIGHT
+            gap_height = self.config.pipe_min_gap_height
         else:
-            gap_height = randint(PIPE_MIN_GAP_HEIGHT, PIPE_MAX_GAP_HEIGHT)
+            gap_height = self._randint(self.config.pipe_min_gap_height, self.config.pipe_max_gap_height)
 
         # Determine gap center
         if self.pipe_gap_loc_mode == "alternating":
             if not hasattr(self, "previous_gap_center") or self.previous_gap_center is None:
-                self.previous_gap_center = SCREEN_HEIGHT // 3
+                self.previous_gap_center = self.config.screen_height // 3
             else:
                 self.previous_gap_center = (
-                    SCREEN_HEIGHT - SCREEN_HEIGHT // 3
-                    if self.previous_gap_center == SCREEN_HEIGHT // 3
-                    else SCREEN_HEIGHT // 3
+                    self.config.screen_height - self.config.screen_height // 3
+                    if self.previous_gap_center == self.config.screen_height // 3
+                    else self.config.screen_height // 3
                 )
             gap_center = self.previous_gap_center
         elif self.pipe_gap_loc_mode == "center":
-            gap_center = SCREEN_HEIGHT // 2
+            gap_center = self.config.screen_height // 2
         elif self.pipe_gap_loc_mode == "top":
-            gap_center = SCREEN_HEIGHT // 3
+            gap_center = self.config.screen_height // 3
         elif self.pipe_gap_loc_mode == "bottom":
-            gap_center = SCREEN_HEIGHT - SCREEN_HEIGHT // 3
+            gap_center = self.config.screen_height - self.config.screen_height // 3
         else:
             min_center = gap_height // 2 + 50
-            max_center = SCREEN_HEIGHT - gap_height // 2 - 50
-            gap_center = randint(min_center, max_center)
+            max_center = self.config.screen_height - gap_height // 2 - 50
+            gap_center = self._randint(min_center, max_center)
 
         # Determine time between pipes based on pipe_distance_mode
         if self.pipe_distance_mode == "large":
-            self.time_between_pipes = MAX_TIME_BETWEEN_PIPES
+            self.time_between_pipes = self.config.max_time_between_pipes
         elif self.pipe_distance_mode == "random":
-            self.time_between_pipes = randint(MIN_TIME_BETWEEN_PIPES, MAX_TIME_BETWEEN_PIPES)
-        pipe = Pipe(PipeColor.GREEN, gap_center=gap_center, gap_height=gap_height)
+            self.time_between_pipes = self._randint(
+                self.config.min_time_between_pipes, self.config.max_time_between_pipes
+            )
+        pipe = Pipe(PipeColor.GREEN, gap_center=gap_center, gap_height=gap_height, config=self.config)
         self.pipes.append(pipe)
+
+
+def _find_first_frame(predicate, first: int, last: int) -> int | None:
+    """Binary search for the first frame in `first`-`last` that meets `predicate`, which stays met once it is."""
+    if first > last or not predicate(last):
+        return None
+    while first < last:
+        middle = (first + last) // 2
+        if predicate(middle):
+            last = middle
+        else:
+            first = middle + 1
+    return first
@@ -9,10 +9,10 @@ class StartMenu:
         self.background_color = get_env_var_as_tuple("MENU_BACKGROUND_COLOR")
         self.text_color = get_env_var_as_tuple("MENU_TEXT_COLOR")
         self.font = pygame.font.Font(None, 40)
+        self.text = self.font.render("Press SPACE to Start", True, self.text_color)
 
     def draw(self, screen: pygame.Surface):
         """Draw the start menu onto the screen."""
         screen.fill(self.background_color)
-        text = self.font.render("Press SPACE to Start", True, self.text_color)
-        text_rect = text.get_rect(center=(screen.get_width() // 2, screen.get_height() // 2))
-        screen.blit(text, text_rect)
+        text_rect = self.text.get_rect(center=(screen.get_width() // 2, screen.get_height() // 2))
+        screen.blit(self.text, text_rect)
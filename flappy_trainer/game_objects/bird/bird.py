@@ -11,12 +11,14 @@ Key Features:
 - Manages animation states and frame updates for visual feedback.
 - Provides collision representation for game mechanics.
 - Supports resetting bird state for a new game.
+- Advances many frames in one call with the closed-form `BirdTrajectory`.
 """
 
 import pygame
 
-from flappy_trainer.config import BIRD_START_X_POS, BIRD_START_Y_POS, DEBUG
+from flappy_trainer.config import DEBUG, DEFAULT_GAME_CONFIG, GameConfig
 from flappy_trainer.game_objects.bird.bird_base import BaseBird
+from flappy_trainer.game_objects.bird.bird_trajectory import BirdTrajectory
 from flappy_trainer.utils import BirdFrame, BirdState
 
 
@@ -24,8 +26,8 @@ class Bird(BaseBird):
     FLAPPING_UP_THRESHOLD = -5  # Velocity threshold for transitioning to flapping-up animation
     NOSE_DIVE_THRESHOLD = 6  # Velocity threshold for transitioning to nose-dive animation
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, config: GameConfig = DEFAULT_GAME_CONFIG):
+        super().__init__(config)
         self.y_velocity = 0
         self.is_alive = True
 
@@ -36,6 +38,10 @@ class Bird(BaseBird):
         self._update_animation_state()
         super().update_bird_frame(delta_time)
 
+    def advance(self, num_frames: int, frame_time: float = 1 / 60):
+        """Advance `num_frames` frames at once, as if `update(frame_time)` were called for each of them."""
+        BirdTrajectory(self, frame_time).apply(self, num_frames)
+
     def flap(self):
         """Make the bird flap upwards, adjusting its velocity and animation state."""
         self.y_velocity = -self.flap_force
@@ -45,21 +51,22 @@ class Bird(BaseBird):
         """End the game by marking the bird as no longer alive."""
         self.is_alive = False
 
-    def draw(self, screen: pygame.Surface):
-        """Render the bird's current sprite on the screen."""
+    def draw(self, screen: pygame.Surface, debug: bool = DEBUG) -> pygame.Rect:
+        """Render the bird's current sprite on the screen and return the area drawn. `debug` adds its hitbox."""
         # Draw the bird's sprite
         current_image = self.sprite_sheet.get_frame(self.current_frame)
-        screen.blit(current_image, (self.x_pos, self.y_pos))
+        drawn_rect = screen.blit(current_image, (self.x_pos, self.y_pos))
 
         # Draw the collision rectangle
-        if DEBUG:
+        if debug:
             hit_rect = self.get_rect()
-            pygame.draw.rect(screen, (255, 0, 0), hit_rect, 2)
+            drawn_rect.union_ip(pygame.draw.rect(screen, (255, 0, 0), hit_rect, 2))
+        return drawn_rect
 
     def reset(self):
         """Reset the bird's position, velocity, and state for a new game."""
-        self.x_pos = BIRD_START_X_POS
-        self.y_pos = BIRD_START_Y_POS
+        self.x_pos = self.config.bird_start_x_pos
+        self.y_pos = self.config.bird_start_y_pos
         self.y_velocity = 0
         self.is_alive = True
         self.current_frame = BirdFrame.FLAPPING_TOP
@@ -8,6 +8,7 @@ implementations, like `Bird`, should extend this class and provide additional lo
 Key Features:
 - Manages bird position, physics (gravity and flap), and animation states.
 - Handles frame updates based on animation state and time elapsed.
+- Collision rects from precomputed frame hitboxes, and a pixel-perfect test against rects.
 - Designed to be extended by specific bird implementations.
 """
 
@@ -15,22 +16,18 @@ from abc import ABC, abstractmethod
 
 import pygame
 
-from flappy_trainer.config import (
-    BIRD_ANIMATION_TIME,
-    BIRD_COLOR,
-    BIRD_FLAP_DECAY_FORCE,
-    BIRD_FLAP_FORCE,
-    BIRD_GRAVITY,
-    BIRD_RADIUS,
-    BIRD_START_X_POS,
-    BIRD_START_Y_POS,
+from flappy_trainer.config import BIRD_COLOR, DEBUG, DEFAULT_GAME_CONFIG, GameConfig
+from flappy_trainer.game_objects.bird.bird_spritesheet import (
+    BirdSpriteSheet,
+    load_frame_hitboxes,
+    load_frame_pixel_counts,
 )
-from flappy_trainer.game_objects.bird.bird_spritesheet import BirdSpriteSheet
 from flappy_trainer.utils import BirdFrame, BirdState
 
 
 class BaseBird(ABC):
-    def __init__(self) -> None:
+    def __init__(self, config: GameConfig = DEFAULT_GAME_CONFIG) -> None:
+        self.config = config
         self._initialize_position()
         self._initialize_physics()
         self._initialize_animation()
@@ -45,14 +42,34 @@ class BaseBird(ABC):
 
     def get_rect(self) -> pygame.Rect:
         """Get the rectangle representing the bird for collision detection."""
-        current_frame_image = self.sprite_sheet.get_frame(self.current_frame)
-        mask = pygame.mask.from_surface(current_frame_image)
-        bounding_rects = mask.get_bounding_rects()
-        bounding_rect = bounding_rects[0]
+        bounding_rect = self.hitboxes[self.current_frame.value].copy()
         bounding_rect.x += self.x_pos
         bounding_rect.y += self.y_pos
         return bounding_rect
 
+    def overlaps_rect(
+        self, rect: pygame.Rect, bird_rect: pygame.Rect | None = None, frame: BirdFrame | None = None
+    ) -> bool:
+        """
+        Pixel-perfect test: whether an opaque pixel of the current frame's hitbox lies inside `rect`.
+
+        Args:
+            rect: The rectangle to test, e.g. a pipe.
+            bird_rect: The bird's current `get_rect()`, if already built.
+            frame: The animation frame to test in place of the current one, with the matching `bird_rect`.
+        """
+        bird_rect = self.get_rect() if bird_rect is None else bird_rect
+        overlap = bird_rect.clip(rect)
+        if not overlap:
+            return False
+        frame = self.current_frame if frame is None else frame
+        hitbox = self.hitboxes[frame.value]
+        left = overlap.left - bird_rect.left + hitbox.left  # In the frame's pixels
+        top = overlap.top - bird_rect.top + hitbox.top
+        right, bottom = left + overlap.width, top + overlap.height
+        counts = self.pixel_counts[frame.value]
+        return counts[bottom, right] - counts[top, right] - counts[bottom, left] + counts[top, left] > 0
+
     @abstractmethod
     def update(self, delta_time: float) -> None:
         """Update the bird's state based on game logic."""
@@ -69,22 +86,22 @@ class BaseBird(ABC):
         pass
 
     @abstractmethod
-    def draw(self, screen) -> None:
-        """Render the bird to the screen."""
+    def draw(self, screen, debug: bool = DEBUG) -> None:
+        """Render the bird to the screen, with debug overlays if `debug`."""
         pass
 
     def _initialize_position(self) -> None:
         """Set initial position-related properties."""
-        self.x_pos = BIRD_START_X_POS
-        self.y_pos = BIRD_START_Y_POS
-        self.radius = BIRD_RADIUS
+        self.x_pos = self.config.bird_start_x_pos
+        self.y_pos = self.config.bird_start_y_pos
+        self.radius = self.config.bird_radius
         self.color = BIRD_COLOR
 
     def _initialize_physics(self) -> None:
         """Set initial physics-related properties."""
-        self.gravity = BIRD_GRAVITY
-        self.flap_force = BIRD_FLAP_FORCE
-        self.flap_decay = BIRD_FLAP_DECAY_FORCE
+        self.gravity = self.config.bird_gravity
+        self.flap_force = self.config.bird_flap_force
+        self.flap_decay = self.config.bird_flap_decay_force
 
     def _initialize_animation(self) -> None:
         """Set initial animation-related properties."""
@@ -92,8 +109,10 @@ class BaseBird(ABC):
         self.previous_state = BirdState.NONE
         self.animation_state = BirdState.IDLE
         self.current_frame = BirdFrame.FLAPPING_TOP
-        self.animation_time = BIRD_ANIMATION_TIME  # Time between frames in seconds
+        self.animation_time = self.config.bird_animation_time  # Time between frames in seconds
         self.time_since_animation_change = 0
+        self.hitboxes = load_frame_hitboxes()
+        self.pixel_counts = load_frame_pixel_counts()
 
     def _update_animation_frame(self) -> None:
         """Update the current frame based on the animation state."""
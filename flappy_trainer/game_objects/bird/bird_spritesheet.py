@@ -9,8 +9,13 @@ Key Features:
 - Loads and extracts frames from a sprite sheet.
 - Provides methods to retrieve specific frames or cycle through animation frames.
 - Handles configurable sprite sheet properties like padding and frame dimensions.
+- Loads the collision masks of the frames once per process, with the hitbox and a table of opaque pixel
+  counts for each, so collisions never build a mask while playing.
 """
 
+import functools
+
+import numpy as np
 import pygame
 
 from flappy_trainer.config import (
@@ -20,12 +25,12 @@ from flappy_trainer.config import (
     BIRD_SPRITE_SHEET_START_Y,
     BIRD_SPRITE_SHEET_TOTAL_FRAMES,
 )
-from flappy_trainer.utils import BirdFrame
+from flappy_trainer.utils import BirdFrame, load_image
 
 
 class BirdSpriteSheet:
     def __init__(self) -> None:
-        self.sprite_sheet = pygame.image.load(BIRD_SPRITE_SHEET_PATH).convert_alpha()
+        self.sprite_sheet = load_image(BIRD_SPRITE_SHEET_PATH)
         self.frames: list[pygame.Surface] = self._load_frames()
 
     def get_frame(self, frame: BirdFrame) -> pygame.Surface:
@@ -54,11 +59,49 @@ class BirdSpriteSheet:
 
     def _extract_frame(self, index: int) -> pygame.Surface:
         """Extract an individual frame from the sprite sheet."""
-        x = index * (BIRD_SPRITE_SHEET_FRAME_HEIGHT + BIRD_SPRITE_SHEET_PADDING_X) + BIRD_SPRITE_SHEET_PADDING_X
-        frame_rect = pygame.Rect(
-            x,
-            BIRD_SPRITE_SHEET_START_Y,
-            BIRD_SPRITE_SHEET_FRAME_HEIGHT,
-            BIRD_SPRITE_SHEET_FRAME_HEIGHT,
-        )
-        return self.sprite_sheet.subsurface(frame_rect).copy()
+        return self.sprite_sheet.subsurface(get_frame_rect(index)).copy()
+
+
+def get_frame_rect(index: int) -> pygame.Rect:
+    """Get the area of the sprite sheet holding the frame at `index`."""
+    x = index * (BIRD_SPRITE_SHEET_FRAME_HEIGHT + BIRD_SPRITE_SHEET_PADDING_X) + BIRD_SPRITE_SHEET_PADDING_X
+    return pygame.Rect(
+        x,
+        BIRD_SPRITE_SHEET_START_Y,
+        BIRD_SPRITE_SHEET_FRAME_HEIGHT,
+        BIRD_SPRITE_SHEET_FRAME_HEIGHT,
+    )
+
+
+@functools.cache
+def load_frame_masks() -> tuple[pygame.mask.Mask, ...]:
+    """
+    Get the collision mask of every frame. Loaded once per process; the masks must not be modified.
+
+    The sprite sheet is loaded without converting it for the display, so this works headless
+    and before a window exists (e.g. for vectorized simulation).
+    """
+    sprite_sheet = pygame.image.load(BIRD_SPRITE_SHEET_PATH)
+    return tuple(
+        pygame.mask.from_surface(sprite_sheet.subsurface(get_frame_rect(index)))
+        for index in range(BIRD_SPRITE_SHEET_TOTAL_FRAMES)
+    )
+
+
+def load_frame_hitboxes() -> list[pygame.Rect]:
+    """Get the collision rectangle of every frame, relative to the frame's top-left corner."""
+    return [mask.get_bounding_rects()[0] for mask in load_frame_masks()]
+
+
+@functools.cache
+def load_frame_pixel_counts() -> tuple[np.ndarray, ...]:
+    """
+    Get a summed-area table of the opaque pixels of every frame's mask: entry [y, x] counts the opaque
+    pixels above and left of (x, y), so the pixels in any rectangle are counted with four lookups.
+    """
+    tables = []
+    for mask in load_frame_masks():
+        width, height = mask.get_size()
+        opaque = np.array([[mask.get_at((x, y)) for x in range(width)] for y in range(height)], dtype=np.int32)
+        tables.append(np.pad(opaque.cumsum(axis=0).cumsum(axis=1), ((1, 0), (1, 0))))
+    return tuple(tables)
@@ -0,0 +1,172 @@
+"""
+BirdTrajectory
+
+The bird's motion over the next frames in closed form. `Bird.update` applies flap decay (while the bird is
+flapping up) and gravity to the velocity, then adds the velocity to the height, once per frame. Flap decay
+makes the velocity a geometric sequence until it rises past the flapping-up threshold; after that it grows
+linearly. Both have closed-form sums, so the bird's height, velocity and animation frame after any number of
+frames are found without stepping through them.
+
+Velocity only ever increases from frame to frame, so the height falls and then rises. The lowest and highest
+points over a span of frames are therefore at its ends or at the turning frame, which lets swept collision
+checks bound a whole span at once.
+
+Key Features:
+- Height and velocity after k frames in O(1), matching k calls of `Bird.update` up to float rounding.
+- Animation frame after k frames from only the frames the animation advances on.
+- Height range over any span of frames, for swept collision detection.
+- Applies the state after k frames to a bird in one call.
+"""
+
+import copy
+import math
+
+from flappy_trainer.utils import BirdFrame, BirdState
+
+
+class BirdTrajectory:
+    def __init__(self, bird, frame_time: float = 1 / 60):
+        """
+        Args:
+            bird: The bird whose motion from its current state is described.
+            frame_time: The seconds of every frame, the `delta_time` of each `Bird.update`.
+        """
+        self.bird = bird
+        self.frame_time = frame_time
+        self.y_pos = bird.y_pos
+        self.y_velocity = bird.y_velocity
+        self.decay = bird.flap_decay
+        self.acceleration = bird.gravity * frame_time
+        self.threshold = bird.FLAPPING_UP_THRESHOLD
+
+        # Velocity after the first frame, the only one whose decay depends on the current animation state
+        first_velocity = (
+            bird.y_velocity * self.decay if bird.animation_state == BirdState.FLAPPING_UP else bird.y_velocity
+        )
+        self.first_velocity = first_velocity + self.acceleration
+        if self.decay < 1:
+            self.limit_velocity = self.acceleration / (1 - self.decay)  # The fixed point of decay and gravity
+        self.num_decaying = self._get_num_decaying()
+        self.decay_end_velocity = self.get_velocity(self.num_decaying + 1)
+        self.decay_end_y_pos = self.get_y_pos(self.num_decaying + 1)
+        self.turning_frame = self._get_turning_frame()
+        self._animation_frames: list[tuple[int, BirdFrame]] = []  # (Frame number, animation frame) per advance
+        self._animation_horizon = 0  # Frames the animation advances are known up to
+        self._animation_bird = copy.copy(bird)  # Scratch copy advanced through the animation frames
+
+    def get_velocity(self, frame: int) -> float:
+        """The bird's velocity after `frame` frames."""
+        if frame <= 1:
+            return self.y_velocity if frame == 0 else self.first_velocity
+        if frame <= self.num_decaying + 1:
+            return self._get_decaying_velocity(frame)
+        return self.decay_end_velocity + (frame - self.num_decaying - 1) * self.acceleration
+
+    def get_y_pos(self, frame: int) -> float:
+        """The bird's height after `frame` frames."""
+        if frame <= 1:
+            return self.y_pos if frame == 0 else self.y_pos + self.first_velocity
+        if frame <= self.num_decaying + 1:
+            geometric_sum = (1 - self.decay**frame) / (1 - self.decay)
+            return (
+                self.y_pos + frame * self.limit_velocity + (self.first_velocity - self.limit_velocity) * geometric_sum
+            )
+        steps = frame - self.num_decaying - 1
+        return self.decay_end_y_pos + steps * self.decay_end_velocity + self.acceleration * steps * (steps + 1) / 2
+
+    def get_y_range(self, first_frame: int, last_frame: int) -> tuple[float, float]:
+        """The lowest and highest heights (min and max y) of the bird over the frames `first_frame`-`last_frame`."""
+        lowest = min(max(self.turning_frame, first_frame), last_frame)
+        return self.get_y_pos(lowest), max(self.get_y_pos(first_frame), self.get_y_pos(last_frame))
+
+    def get_animation_frame(self, frame: int) -> BirdFrame:
+        """The bird's animation frame after `frame` frames."""
+        self._extend_animation(frame)
+        current_frame = self.bird.current_frame
+        for advance_frame, animation_frame in self._animation_frames:
+            if advance_frame > frame:
+                break
+            current_frame = animation_frame
+        return current_frame
+
+    def apply(self, bird, num_frames: int):
+        """Set `bird` to its state after `num_frames` frames, as if `update(frame_time)` had been called for each."""
+        if num_frames <= 0:
+            return
+        velocity = self.get_velocity(num_frames)
+        bird.y_pos = self.get_y_pos(num_frames)
+        bird.y_velocity = velocity
+        bird.animation_state = self._get_animation_state(velocity)
+        bird.current_frame = self.get_animation_frame(num_frames)
+
+        last_advance = max((frame for frame, _ in self._animation_frames if frame <= num_frames), default=0)
+        time_since_animation_change = 0 if last_advance else bird.time_since_animation_change
+        for _ in range(num_frames - last_advance):
+            time_since_animation_change += self.frame_time
+        bird.time_since_animation_change = time_since_animation_change
+
+    def _get_num_decaying(self) -> int:
+        """The number of frames, from the first, that end below the flapping-up threshold and so decay the next."""
+        if self.decay >= 1 or self.first_velocity >= self.threshold:
+            return 0
+        ratio = (self.threshold - self.limit_velocity) / (self.first_velocity - self.limit_velocity)
+        num_decaying = max(math.ceil(math.log(ratio) / math.log(self.decay)), 1)
+        velocity = self._get_decaying_velocity
+        while num_decaying > 1 and velocity(num_decaying) >= self.threshold:  # Correct float rounding
+            num_decaying -= 1
+        while velocity(num_decaying + 1) < self.threshold:
+            num_decaying += 1
+        return num_decaying
+
+    def _get_decaying_velocity(self, frame: int) -> float:
+        """The velocity after `frame` frames if every frame since the first decayed it."""
+        return self.limit_velocity + self.decay ** (frame - 1) * (self.first_velocity - self.limit_velocity)
+
+    def _get_turning_frame(self) -> int:
+        """The last frame the bird moves up on (negative velocity), 0 if it does not."""
+        if self.first_velocity >= 0:
+            return 0
+        if self.decay_end_velocity >= 0:  # Turns while decaying
+            frame = 1
+            while self.get_velocity(frame + 1) < 0:
+                frame += 1
+            return frame
+        return self.num_decaying + 1 + math.ceil(-self.decay_end_velocity / self.acceleration) - 1
+
+    def _get_animation_state(self, velocity: float) -> BirdState:
+        """The animation state `Bird._update_animation_state` picks for a velocity."""
+        if velocity < self.threshold:
+            return BirdState.FLAPPING_UP
+        if velocity < 0:
+            return BirdState.TRANSITION
+        if velocity > self.bird.NOSE_DIVE_THRESHOLD:
+            return BirdState.NOSE_DIVE
+        if velocity > 0:
+            return BirdState.DESCENDING
+        return BirdState.IDLE
+
+    def _extend_animation(self, frame: int):
+        """Find the animation frame of every advance of the animation up to `frame`."""
+        if frame <= self._animation_horizon:
+            return
+        bird = self._animation_bird
+        if self._animation_frames:
+            advance_frame = self._animation_frames[-1][0] + self._get_frames_between_advances(0.0)
+        else:
+            advance_frame = self._get_frames_between_advances(self.bird.time_since_animation_change)
+        while advance_frame <= frame:
+            if advance_frame > self._animation_horizon:
+                bird.animation_state = self._get_animation_state(self.get_velocity(advance_frame))
+                bird._update_animation_frame()
+                self._animation_frames.append((advance_frame, bird.current_frame))
+            advance_frame += self._get_frames_between_advances(0.0)
+        self._animation_horizon = frame
+
+    def _get_frames_between_advances(self, time_since_animation_change: float) -> int:
+        """The frames until the animation next advances, adding `frame_time` per frame like `update_bird_frame`."""
+        frames = 0
+        while True:
+            frames += 1
+            time_since_animation_change += self.frame_time
+            if time_since_animation_change >= self.bird.animation_time:
+                return frames
@@ -7,7 +7,7 @@ which handles shared functionality like drawing and updating collision boundarie
 
 Key Features:
 - Dynamically generates gap size and position if not provided.
-- Tracks whether the pipe has been passed by the bird.
+- Tracks whether the pipe has been passed by the bird, and where it was before its last move.
 - Provides public methods for collision detection, position updates, and rendering.
 """
 
@@ -15,33 +15,36 @@ from random import randint
 
 import pygame
 
-from flappy_trainer.config import (
-    PIPE_MAX_GAP_HEIGHT,
-    PIPE_MIN_GAP_HEIGHT,
-    PIPE_MIN_HEIGHT,
-    PIPE_WIDTH,
-    SCREEN_HEIGHT,
-    SCREEN_WIDTH,
-)
+from flappy_trainer.config import DEBUG, DEFAULT_GAME_CONFIG, GameConfig
 from flappy_trainer.game_objects.pipe.pipe_base import PipeBase
 from flappy_trainer.utils import PipeColor
 
 
 class Pipe(PipeBase):
-    def __init__(self, pipe_color: PipeColor, x_pos=None, gap_center=None, gap_height=None):
-        self._assert_correct_parameters(pipe_color, x_pos, gap_center, gap_height)
-        height_of_gap = gap_height if gap_height is not None else randint(PIPE_MIN_GAP_HEIGHT, PIPE_MAX_GAP_HEIGHT)
+    def __init__(
+        self,
+        pipe_color: PipeColor,
+        x_pos=None,
+        gap_center=None,
+        gap_height=None,
+        config: GameConfig = DEFAULT_GAME_CONFIG,
+    ):
+        self._assert_correct_parameters(pipe_color, x_pos, gap_center, gap_height, config)
+        height_of_gap = (
+            gap_height if gap_height is not None else randint(config.pipe_min_gap_height, config.pipe_max_gap_height)
+        )
         location_of_gap = (
             gap_center
             if gap_center is not None
             else randint(
-                PIPE_MIN_HEIGHT + (height_of_gap // 2),
-                SCREEN_HEIGHT - PIPE_MIN_HEIGHT - (height_of_gap // 2),
+                config.pipe_min_height + (height_of_gap // 2),
+                config.screen_height - config.pipe_min_height - (height_of_gap // 2),
             )
         )
-        x_location = x_pos if x_pos is not None else SCREEN_WIDTH
-        super().__init__(pipe_color, x_location, location_of_gap, height_of_gap)
+        x_location = x_pos if x_pos is not None else config.screen_width
+        super().__init__(pipe_color, x_location, location_of_gap, height_of_gap, config)
         self.passed = False
+        self.previous_x_pos = self.x_pos  # Where the pipe was before its last move, for interpolated drawing
 
     def collides_with(self, bird_rect: pygame.Rect) -> bool:
         """Check if the pipe collides with the bird's rectangle."""
@@ -49,33 +52,41 @@ class Pipe(PipeBase):
 
     def is_off_screen(self) -> bool:
         """Check if the pipe has moved off the left side of the screen."""
-        return self.x_pos + PIPE_WIDTH < 0
+        return self.x_pos + self.config.pipe_width < 0
 
     def update_position(self, distance: int) -> None:
         """Move the pipe left by the specified distance (px) and update its boundaries."""
+        self.previous_x_pos = self.x_pos
         self.x_pos -= distance
         self.update_rects()
 
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draw the pipe (both top and bottom) onto the screen."""
-        self.draw_pipe(screen, is_top=True)
-        self.draw_pipe(screen, is_top=False)
+    def draw(self, screen: pygame.Surface, debug: bool = DEBUG) -> pygame.Rect:
+        """
+        Draw the pipe (both top and bottom) onto the screen and return the column it covers. `debug` adds its
+        collision rects and gap.
+        """
+        self.draw_pipe(screen, is_top=True, debug=debug)
+        self.draw_pipe(screen, is_top=False, debug=debug)
+        column = pygame.Rect(int(self.x_pos) - 1, 0, self.config.pipe_width + 2, self.config.screen_height)
+        return column.clip(screen.get_rect())
 
     @staticmethod
-    def _assert_correct_parameters(pipe_color: PipeColor, x_pos: int, gap_center: int, gap_height: int):
+    def _assert_correct_parameters(
+        pipe_color: PipeColor, x_pos: int, gap_center: int, gap_height: int, config: GameConfig = DEFAULT_GAME_CONFIG
+    ):
         """Validate the pipe parameters."""
         if not isinstance(pipe_color, PipeColor):
             raise AssertionError("Invalid pipe color. Must be PipeColor.RED or PipeColor.GREEN.")
         if gap_height:
             assert (
-                PIPE_MIN_GAP_HEIGHT <= gap_height <= PIPE_MAX_GAP_HEIGHT
-            ), f"Gap height must be {PIPE_MIN_GAP_HEIGHT}-{PIPE_MAX_GAP_HEIGHT}."
+                config.pipe_min_gap_height <= gap_height <= config.pipe_max_gap_height
+            ), f"Gap height must be {config.pipe_min_gap_height}-{config.pipe_max_gap_height}."
         if gap_center and gap_height:
             half_gap = gap_height // 2
-            min_center = PIPE_MIN_HEIGHT + half_gap
-            max_center = SCREEN_HEIGHT - PIPE_MIN_HEIGHT - half_gap
+            min_center = config.pipe_min_height + half_gap
+            max_center = config.screen_height - config.pipe_min_height - half_gap
             assert (
                 min_center <= gap_center <= max_center
             ), f"Gap center must be {min_center}-{max_center}. Got: {gap_center}."
         if x_pos:
-            assert 0 <= x_pos <= SCREEN_WIDTH, "Invalid x pos."
+            assert 0 <= x_pos <= config.screen_width, "Invalid x pos."
@@ -15,13 +15,21 @@ from abc import ABC, abstractmethod
 
 import pygame
 
-from flappy_trainer.config import DEBUG, PIPE_WIDTH, SCREEN_HEIGHT
+from flappy_trainer.config import DEBUG, DEFAULT_GAME_CONFIG, GameConfig
 from flappy_trainer.game_objects.pipe.pipe_spritesheet import PipeSpriteSheet
 from flappy_trainer.utils import PipeColor
 
 
 class PipeBase(ABC):
-    def __init__(self, pipe_color: PipeColor, x_pos: int, gap_center: int, gap_height: int):
+    def __init__(
+        self,
+        pipe_color: PipeColor,
+        x_pos: int,
+        gap_center: int,
+        gap_height: int,
+        config: GameConfig = DEFAULT_GAME_CONFIG,
+    ):
+        self.config = config
         self.spritesheet = PipeSpriteSheet()
         self.color = pipe_color
         self.x_pos = x_pos
@@ -31,26 +39,29 @@ class PipeBase(ABC):
         self.update_rects()
 
     @abstractmethod
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface, debug: bool = DEBUG) -> None:
         """Abstract method to enforce rendering logic in child classes."""
         pass
 
     def update_rects(self) -> None:
         """Update the collision rectangles based on x-position."""
-        self.top_pipe_rect = pygame.Rect(self.x_pos, 0, PIPE_WIDTH, self.top_pipe_height)
+        pipe_width = self.config.pipe_width
+        self.top_pipe_rect = pygame.Rect(self.x_pos, 0, pipe_width, self.top_pipe_height)
         self.bot_pipe_rect = pygame.Rect(
-            self.x_pos, self.gap_center + (self.gap_height // 2), PIPE_WIDTH, self.bot_pipe_height
+            self.x_pos, self.gap_center + (self.gap_height // 2), pipe_width, self.bot_pipe_height
         )
 
-    def draw_pipe(self, screen: pygame.Surface, is_top: bool) -> None:
+    def draw_pipe(self, screen: pygame.Surface, is_top: bool, debug: bool = DEBUG) -> None:
         """
         Draw a pipe (top or bottom) by tiling its segments vertically.
 
         Args:
             screen (pygame.Surface): The display surface to draw the pipe on.
             is_top (bool): Whether this is the top pipe (True) or bottom pipe (False).
+            debug (bool): Whether to also draw the collision rect and the gap.
         """
         # Get the pipe sprite and segment height
+        pipe_width, screen_height = self.config.pipe_width, self.config.screen_height
         pipe_frame = self.spritesheet.get_pipe_frame(self.color, is_top)
         segment_height = pipe_frame.get_height()
 
@@ -59,30 +70,28 @@ class PipeBase(ABC):
             current_y = self.top_pipe_height
             while current_y > 0:
                 part_height = min(segment_height, current_y)
-                source_rect = (0, pipe_frame.get_height() - part_height, PIPE_WIDTH, part_height)
-                pipe_segment = pipe_frame.subsurface(source_rect)
-                screen.blit(pipe_segment, (self.x_pos, current_y - part_height))
+                source_rect = (0, pipe_frame.get_height() - part_height, pipe_width, part_height)
+                screen.blit(pipe_frame, (self.x_pos, current_y - part_height), source_rect)
                 current_y -= part_height
-                if DEBUG:
+                if debug:
                     pygame.draw.rect(screen, (255, 0, 0), self.top_pipe_rect, 2)
         else:
             # Draw the bottom pipe starting at its top and moving downwards
-            current_y = SCREEN_HEIGHT - self.bot_pipe_height
-            while current_y < SCREEN_HEIGHT:
-                part_height = min(segment_height, SCREEN_HEIGHT - current_y)
-                source_rect = (0, 0, PIPE_WIDTH, part_height)
-                pipe_segment = pipe_frame.subsurface(source_rect)
-                screen.blit(pipe_segment, (self.x_pos, current_y))
+            current_y = screen_height - self.bot_pipe_height
+            while current_y < screen_height:
+                part_height = min(segment_height, screen_height - current_y)
+                source_rect = (0, 0, pipe_width, part_height)
+                screen.blit(pipe_frame, (self.x_pos, current_y), source_rect)
                 current_y += part_height
-                if DEBUG:
+                if debug:
                     pygame.draw.rect(screen, (255, 0, 0), self.bot_pipe_rect, 2)
 
-        if DEBUG:
+        if debug:
             self._draw_gap(screen)
 
     def _draw_gap(self, screen: pygame.Surface):
         """Visualizes the gap in the pipes, used for debugging."""
-        gap_center_x = self.x_pos + (PIPE_WIDTH // 2)
+        gap_center_x = self.x_pos + (self.config.pipe_width // 2)
         gap_top_y = self.gap_center - (self.gap_height // 2)
         gap_bottom_y = self.gap_center + (self.gap_height // 2)
         pygame.draw.circle(screen, (0, 255, 0), (gap_center_x, self.gap_center), 5)
@@ -92,5 +101,5 @@ class PipeBase(ABC):
         """Generate px heights for the pipes using screen height and gap location."""
         half_gap = self.gap_height // 2
         top_pipe_height = self.gap_center - half_gap
-        bot_pipe_height = SCREEN_HEIGHT - (self.gap_center + half_gap)
+        bot_pipe_height = self.config.screen_height - (self.gap_center + half_gap)
         return top_pipe_height, bot_pipe_height
@@ -9,7 +9,7 @@ including flipping frames based on their position (top or bottom).
 Key Features:
 - Loads sprite sheet from the specified file path.
 - Extracts and scales frames for red and green pipes.
-- Provides methods to fetch pipe frames based on color and position.
+- Provides methods to fetch pipe frames based on color and position, flipped and run-length encoded once.
 - Handles configuration dynamically via environment variables.
 """
 
@@ -21,13 +21,13 @@ from flappy_trainer.config import (
     PIPE_SPRITE_SHEET_PATH,
     PIPE_SPRITE_SHEET_SCALE_FACTOR,
 )
-from flappy_trainer.utils import PipeColor
+from flappy_trainer.utils import PipeColor, load_image
 
 
 class PipeSpriteSheet:
     def __init__(self) -> None:
         """Initialize the pipe sprite sheet, load frames, and apply scaling."""
-        self.sprite_sheet = pygame.image.load(PIPE_SPRITE_SHEET_PATH).convert_alpha()
+        self.sprite_sheet = load_image(PIPE_SPRITE_SHEET_PATH)
         self._extract_and_scale_frames()
 
     def get_pipe_frame(self, color: PipeColor, is_top: bool) -> pygame.Surface:
@@ -41,8 +41,9 @@ class PipeSpriteSheet:
         Returns:
             pygame.Surface: The requested pipe frame, flipped if necessary.
         """
-        frame = self._get_frame_by_color(color)
-        return self._flip_frame_if_needed(frame, color, is_top)
+        if not isinstance(color, PipeColor):
+            raise ValueError(f"Invalid pipe color specified: '{color}'. Must be 'red' or 'green'.")
+        return self.frames[(color, is_top)]
 
     def _extract_and_scale_frames(self) -> None:
         """Extract frames for red and green pipes from the sprite sheet, and scale them."""
@@ -51,6 +52,17 @@ class PipeSpriteSheet:
         self.red_pipe_frame = self._scale_frame(self.red_pipe_frame)
         self.green_pipe_frame = self._scale_frame(self.green_pipe_frame)
 
+        # Flipped once here rather than on every draw. The pipes' pixels are either opaque or fully transparent,
+        # so run-length encoding them makes blits several times faster; blit them with an area, as subsurfaces
+        # of an encoded surface are slow.
+        self.frames = {
+            (color, is_top): self._flip_frame_if_needed(self._get_frame_by_color(color), color, is_top)
+            for color in PipeColor
+            for is_top in (True, False)
+        }
+        for frame in self.frames.values():
+            frame.set_alpha(255, pygame.RLEACCEL)
+
     def _extract_frame(self, x_offset: int) -> pygame.Surface:
         """Extract a pipe frame from the sprite sheet given an x-coordinate offset."""
         frame_rect = pygame.Rect(x_offset, 0, PIPE_SPRITE_SHEET_FRAME_WIDTH, PIPE_SPRITE_SHEET_FRAME_HEIGHT)
@@ -1,31 +1,78 @@
+import argparse
+import random
 import sys
 
 import pygame
 
+from flappy_trainer.ai.demonstrations import DemonstrationRecorder
+from flappy_trainer.game_managers.fixed_timestep_loop import FixedTimestepLoop
 from flappy_trainer.game_managers.game_manager import GameManager
+from flappy_trainer.utils import GameState
+
+parser = argparse.ArgumentParser(description="Play Flappy Trainer.")
+parser.add_argument("--record", metavar="PATH", help="Record your games to a demonstration log for the AI.")
+parser.add_argument("--seed", type=int, help="Seed for the pipe course, random when not given.")
+args = parser.parse_args()
+seed = args.seed if args.seed is not None else random.randrange(2**31)
+random.seed(seed)
 
 try:
     pygame.init()
     game_manager = GameManager(
-        is_pipes=True, pipe_gap_size_mode="random", pipe_distance_mode="random", pipe_gap_loc_mode="random"
+        is_pipes=True,
+        pipe_gap_size_mode="random",
+        pipe_distance_mode="random",
+        pipe_gap_loc_mode="random",
+        dirty_rect_rendering=True,
     )
-    clock = pygame.time.Clock()
+    game_loop = FixedTimestepLoop(step_time=1 / 60, target_fps=60)
 except EnvironmentError as e:
     print(f"Error in .env: {e}")
     pygame.quit()
     sys.exit(1)
 
-while True:
-    delta_time = clock.tick(60) / 1000.0
+recorder = DemonstrationRecorder(args.record, seed) if args.record else None
+
+
+def quit_game():
+    if recorder:
+        recorder.close()
+        print(f"Demonstrations saved to {args.record}")
+    stats = game_loop.get_stats()
+    print(
+        f"Frame pacing over {stats['frames']} frames: p50 {stats['p50_frame_time_ms']:.1f} ms, "
+        f"p99 {stats['p99_frame_time_ms']:.1f} ms, {stats['dropped_frames']} dropped frames, "
+        f"{stats['dropped_steps']} dropped physics steps"
+    )
+    pygame.quit()
+    sys.exit()
 
+
+# Input is applied at the next physics step, which always advances the game by the training step of 1/60 s
+pending_events = []
+while True:
+    game_loop.tick()
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
-            pygame.quit()
-            sys.exit()
-        game_manager.handle_event(event)
+            quit_game()
+        pending_events.append(event)
+
+    for _ in game_loop.steps():
+        previous_state = game_manager.state
+
+        # Record the game before the player's input, and whether they flapped
+        if recorder and previous_state is GameState.RUNNING:
+            flap = any(event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE for event in pending_events)
+            recorder.record_frame(game_manager, flap, game_loop.step_time)
+
+        for event in pending_events:
+            game_manager.handle_event(event)
+        pending_events.clear()
+
+        if recorder and previous_state in {GameState.START_MENU, GameState.GAME_OVER}:
+            if game_manager.state is GameState.RUNNING:
+                recorder.start_episode()
 
-    game_manager.update(delta_time)
-    game_manager.draw()
+        game_manager.update(game_loop.step_time)
 
-    # Cap the frame rate
-    game_manager.clock.tick(60)
+    game_manager.draw(game_loop.interpolation)
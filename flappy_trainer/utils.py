@@ -1,6 +1,8 @@
 import os
 from enum import Enum, auto
 
+import pygame
+
 
 class GameState(Enum):
     START_MENU = auto()
@@ -37,6 +39,42 @@ class PipeColor(Enum):
     RED = "RED"
 
 
+class CachedText:
+    """A line of text that is rendered again only when the value shown in it changes."""
+
+    def __init__(self, font: pygame.font.Font, template: str, color: tuple[int, int, int]):
+        """
+        Args:
+            font: The font to render with.
+            template: The text, with a `{}` where the value goes.
+            color: The text color.
+        """
+        self.font = font
+        self.template = template
+        self.color = color
+        self.value = None
+        self.surface: pygame.Surface | None = None
+
+    def render(self, value) -> pygame.Surface:
+        """Return the text surface for a value, rendering it only if the value changed."""
+        if self.surface is None or value != self.value:
+            self.value = value
+            self.surface = self.font.render(self.template.format(value), True, self.color)
+        return self.surface
+
+
+def load_image(path: str) -> pygame.Surface:
+    """
+    Load an image with per-pixel alpha, converted for fast blits: to the display's pixel format when a display
+    exists, otherwise to that of 32-bit offscreen surfaces, such as a headless game's screen and the pixel
+    observer's surface.
+    """
+    image = pygame.image.load(path)
+    if pygame.display.get_surface() is not None:
+        return image.convert_alpha()
+    return image.convert(pygame.Surface((1, 1), pygame.SRCALPHA, 32))
+
+
 def get_env_var_as_int(var_name):
     """Retrieve an env variable as an integer. Throws Env Error if not available."""
     value = os.getenv(var_name)
@@ -1,6 +1,18 @@
+import sys
+
+import numpy as np
 import pygame
 
-from flappy_trainer.ai.ai_utils import get_curr_pipe_velocity, get_nearest_pipe_details
+from flappy_trainer.ai.ai_utils import (
+    TRANSITION_DTYPE,
+    Action,
+    Knowledge,
+    get_curr_pipe_velocity,
+    get_current_state,
+    get_nearest_pipe_details,
+    knowledge_to_records,
+)
+from flappy_trainer.ai.environment_state import EnvironmentState
 from flappy_trainer.config import INITIAL_PIPE_SPEED, PIPE_SPEED_INCREASE_PER_LEVEL_UP, SCREEN_HEIGHT, SCREEN_WIDTH
 from flappy_trainer.game_managers.game_manager import GameManager
 
@@ -32,6 +44,39 @@ class TestAIUtils:
         details = get_nearest_pipe_details(self.game_manager)
         assert details == (SCREEN_WIDTH, SCREEN_HEIGHT // 2, SCREEN_HEIGHT // 4)
 
+    def test_knowledge_as_tuple(self):
+        """Test that `Knowledge.as_tuple` returns its transition."""
+        state = get_current_state(self.game_manager)
+        assert Knowledge(state, Action.FLAP, 1, None).as_tuple() == (state, Action.FLAP, 1, None)
+
+    def test_knowledge_to_records(self):
+        """Test that knowledge converts to structured records, with zeroed next states when done."""
+        state = get_current_state(self.game_manager)
+        batch = [Knowledge(state, Action.FLAP, 0.5, state, 3), Knowledge(state, Action.NO_FLAP, -1, None)]
+        records = knowledge_to_records(batch)
+
+        assert records.dtype == TRANSITION_DTYPE
+        np.testing.assert_allclose(records["state"][0], state.to_numpy_array(), atol=2e-3)
+        np.testing.assert_array_equal(records["state"][0], records["next_state"][0])
+        assert records["action"].tolist() == [Action.FLAP.value, Action.NO_FLAP.value]
+        assert records["reward"].tolist() == [0.5, -1]
+        assert records["done"].tolist() == [False, True]
+        assert records["n_steps"].tolist() == [3, 1]
+        assert not records["next_state"][1].any()
+
+    def test_memory_per_transition(self):
+        """Report the memory of one transition as objects and as a structured record."""
+        state = get_current_state(self.game_manager)
+        knowledge = Knowledge(state, Action.FLAP, 1.0, get_current_state(self.game_manager))
+        assert not hasattr(state, "__dict__") and not hasattr(knowledge, "__dict__")
+
+        # Knowledge plus its two states, excluding values shared with other objects (small ints, enums)
+        object_bytes = sys.getsizeof(knowledge) + 2 * sys.getsizeof(state)
+        record_bytes = TRANSITION_DTYPE.itemsize
+        print(f"Memory per transition: {object_bytes} bytes as slotted objects, {record_bytes} bytes as a record")
+        assert object_bytes < 400
+        assert record_bytes == 2 * 4 * EnvironmentState.get_num_features() + 1 + 4 + 1 + 1
+
     # TO_DO: FIX THIS
     # def test_get_nearest_pipe_details_with_pipes(self):
     #     """Test `get_nearest_pipe_details` with pipes present."""
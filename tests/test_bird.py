@@ -1,3 +1,5 @@
+import copy
+
 import pygame
 import pytest
 
@@ -129,9 +131,36 @@ class TestBird:
         bounding_rect.y += self.y_pos
         return bounding_rect
 
+    def test_get_rect_matches_frame_mask(self):
+        """Test that the precomputed hitboxes give the bounding rect of every frame's mask."""
+        self.bird.y_pos += 0.5
+        for frame in BirdFrame:
+            self.bird.current_frame = frame
+            expected = pygame.mask.from_surface(self.bird.sprite_sheet.get_frame(frame)).get_bounding_rects()[0]
+            expected.x += self.bird.x_pos
+            expected.y += self.bird.y_pos
+            assert self.bird.get_rect() == expected
+
     def test_animation_frame_updates(self):
         """Test that the bird's animation frame updates correctly."""
         initial_frame = self.bird.current_frame
         self.bird.animation_state = BirdState.FLAPPING_UP
         self.bird.update_bird_frame(BIRD_ANIMATION_TIME)
         assert self.bird.current_frame != initial_frame
+
+    @pytest.mark.parametrize("y_velocity, is_flapping", [(0, False), (-7, True), (-3, True), (4, False), (-7, False)])
+    def test_advance_matches_updates(self, y_velocity, is_flapping):
+        """Test that advancing many frames at once matches updating frame by frame."""
+        self.bird.y_velocity = y_velocity
+        self.bird.animation_state = BirdState.FLAPPING_UP if is_flapping else BirdState.IDLE
+        self.bird.time_since_animation_change = 0.03
+        stepped = copy.copy(self.bird)
+        for num_frames in (1, 7, 40):
+            for _ in range(num_frames):
+                stepped.update(1 / 60)
+            self.bird.advance(num_frames)
+            assert self.bird.y_pos == pytest.approx(stepped.y_pos)
+            assert self.bird.y_velocity == pytest.approx(stepped.y_velocity)
+            assert self.bird.animation_state == stepped.animation_state
+            assert self.bird.current_frame == stepped.current_frame
+            assert self.bird.time_since_animation_change == pytest.approx(stepped.time_since_animation_change)
@@ -0,0 +1,52 @@
+import pygame
+
+from flappy_trainer.ai.curriculum_scheduler import DEFAULT_STAGES, CurriculumScheduler
+from flappy_trainer.game_managers.game_manager import GameManager
+
+
+class TestCurriculumScheduler:
+    def setup_method(self):
+        """Set up the test environment."""
+        pygame.init()
+        self.scheduler = CurriculumScheduler(advance_threshold=100, fallback_threshold=20, window=5, patience=10)
+
+    def teardown_method(self):
+        """Clean up the test environment."""
+        pygame.quit()
+
+    def test_default_stages_get_harder(self):
+        """Test that training starts without pipes and ends on the random full game."""
+        assert self.scheduler.current_stage.is_pipes is False
+        full_game = DEFAULT_STAGES[-1].create_game_manager()
+        assert isinstance(full_game, GameManager)
+        assert full_game.is_pipes_active is True
+        assert (full_game.pipe_gap_size_mode, full_game.pipe_distance_mode, full_game.pipe_gap_loc_mode) == (
+            "random",
+            "random",
+            "random",
+        )
+
+    def test_advances_when_rolling_mean_crosses_threshold(self):
+        """Test that the stage changes only once a full window averages above the threshold."""
+        changes = [self.scheduler.record(frames) for frames in (500, 500, 500, 500)]
+        assert not any(changes)
+
+        assert self.scheduler.record(0) is True  # Mean of 2000 / 5 = 400
+        assert self.scheduler.stage_index == 1
+        assert self.scheduler.rolling_mean is None
+
+    def test_stays_on_final_stage(self):
+        """Test that a good score on the last stage does not move past it."""
+        self.scheduler.stage_index = len(DEFAULT_STAGES) - 1
+        assert not any(self.scheduler.record(3000) for _ in range(20))
+        assert self.scheduler.is_final_stage
+
+    def test_falls_back_on_regression(self):
+        """Test that failing a stage past the patience goes back one stage, but never below the first."""
+        self.scheduler.stage_index = 2
+        changes = [self.scheduler.record(10) for _ in range(10)]
+        assert changes == [False] * 9 + [True]
+        assert self.scheduler.stage_index == 1
+
+        self.scheduler.stage_index = 0
+        assert not any(self.scheduler.record(10) for _ in range(20))
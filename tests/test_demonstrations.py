@@ -0,0 +1,89 @@
+import os
+import tempfile
+
+import numpy as np
+import pygame
+
+from flappy_trainer.ai.ai_utils import Action, get_current_state
+from flappy_trainer.ai.demonstrations import (
+    FRAME_DTYPE,
+    DemonstrationRecorder,
+    demonstrations_to_actions,
+    load_demonstrations,
+    pretrain_agent,
+)
+from flappy_trainer.game_managers.game_manager import GameManager
+
+
+class RecordingModel:
+    def fit(self, states, targets, **kwargs):
+        self.states, self.targets, self.kwargs = states, targets, kwargs
+
+
+class RecordingAgent:
+    def __init__(self):
+        self.discount_factor = 0.9
+        self.model = RecordingModel()
+
+
+def create_frames(episodes: list[int], flaps: list[int]) -> np.ndarray:
+    frames = np.zeros(len(episodes), dtype=FRAME_DTYPE)
+    frames["episode"] = episodes
+    frames["flap"] = flaps
+    frames["features"][:, 0] = np.arange(len(episodes))
+    return frames
+
+
+class TestDemonstrations:
+    def setup_method(self):
+        """Set up the test environment."""
+        pygame.init()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "session.demo")
+
+    def teardown_method(self):
+        """Clean up the test environment."""
+        self.temp_dir.cleanup()
+        pygame.quit()
+
+    def test_record_and_load(self):
+        """Test that recorded frames, inputs and features are read back from the log."""
+        game_manager = GameManager()
+        game_manager.start_game()
+        expected_features = []
+        with DemonstrationRecorder(self.path, seed=1234, block_size=4) as recorder:
+            for episode in range(2):
+                recorder.start_episode()
+                for frame in range(5):
+                    expected_features.append(get_current_state(game_manager).to_numpy_array())
+                    recorder.record_frame(game_manager, flap=frame == 2, delta_time=1 / 60)
+                    game_manager.update(1 / 60)
+
+        seed, frames = load_demonstrations(self.path)
+        assert seed == 1234
+        assert frames["episode"].tolist() == [1] * 5 + [2] * 5
+        assert frames["frame"].tolist() == list(range(5)) * 2
+        assert frames["flap"].tolist() == [0, 0, 1, 0, 0] * 2
+        np.testing.assert_allclose(frames["features"], expected_features, atol=2e-3)
+        assert os.path.getsize(self.path) == 16 + 10 * FRAME_DTYPE.itemsize
+
+    def test_flaps_become_decision_tick_actions(self):
+        """Test that a state's action is FLAP when the player flaps within the next tick of its episode."""
+        frames = create_frames(episodes=[1, 1, 1, 1, 2, 2, 2], flaps=[0, 0, 1, 0, 0, 0, 1])
+        states, actions = demonstrations_to_actions(frames, action_tick=2)
+
+        assert states.shape == (7, 9)
+        flap, no_flap = Action.FLAP.value, Action.NO_FLAP.value
+        assert actions.tolist() == [no_flap, flap, flap, no_flap, no_flap, flap, flap]
+
+    def test_pretrain_fits_balanced_q_targets(self):
+        """Test that pretraining fits the demonstrated action above the other, balancing rare flaps."""
+        agent = RecordingAgent()
+        frames = create_frames(episodes=[1] * 8, flaps=[0, 0, 0, 0, 0, 0, 0, 1])
+        pretrain_agent(agent, frames, action_tick=1, epochs=3)
+
+        np.testing.assert_allclose(agent.model.targets[0], [9, 10])
+        np.testing.assert_allclose(agent.model.targets[7], [10, 9])
+        weights = agent.model.kwargs["sample_weight"]
+        assert weights[7] * 1 == weights[0] * 7  # Flap and no-flap classes carry equal total weight
+        assert agent.model.kwargs["epochs"] == 3
@@ -0,0 +1,116 @@
+import os
+import random
+import tempfile
+
+import numpy as np
+import pygame
+import pytest
+
+from flappy_trainer import config
+from flappy_trainer.ai import episode_replay
+from flappy_trainer.ai.ai_utils import Action, get_nearest_pipe_details
+from flappy_trainer.ai.episode_replay import (
+    EpisodePlayer,
+    EpisodeRecorder,
+    EpisodeRecording,
+    get_config_hash,
+    is_decision_frame,
+)
+from flappy_trainer.config import SCREEN_HEIGHT
+from flappy_trainer.game_managers.game_manager import GameManager
+from flappy_trainer.utils import GameState
+
+
+def play_recorded_episode(game_manager: GameManager, seed: int, max_frames: int = 1200):
+    """Play an episode the way the AITrainer does, returning its recording and every bird height."""
+    policy = random.Random(seed)
+    recorder = EpisodeRecorder(game_manager, action_tick=15)
+    recorder.start(seed)
+    heights = [game_manager.bird.y_pos]
+    current_frame = 0
+    while game_manager.state is GameState.RUNNING and current_frame < max_frames:
+        game_manager.update(1 / 60)
+        current_frame += 1
+        if game_manager.state is GameState.RUNNING and is_decision_frame(current_frame, 15):
+            # Mostly flap when below the next gap, so the bird gets through a few pipes
+            _, gap_center, _ = get_nearest_pipe_details(game_manager)
+            is_below_gap = game_manager.bird.y_pos > (gap_center or SCREEN_HEIGHT // 2)
+            action = Action.FLAP if is_below_gap ^ (policy.random() < 0.1) else Action.NO_FLAP
+            if action == Action.FLAP:
+                game_manager.bird.flap()
+            recorder.record_decision(action)
+        heights.append(game_manager.bird.y_pos)
+    return recorder.finish(current_frame), heights
+
+
+class TestEpisodeReplay:
+    def setup_method(self):
+        """Set up the test environment."""
+        pygame.init()
+        self.game_manager = GameManager(True, "large", "random", "random")
+        self.recording, self.heights = play_recorded_episode(self.game_manager, seed=5)
+
+    def teardown_method(self):
+        """Clean up the test environment."""
+        pygame.quit()
+
+    def test_recording_round_trips_in_a_few_bytes(self):
+        """Test that a recording serializes to a small header plus one bit per decision."""
+        data = self.recording.to_bytes()
+        assert len(data) < 100
+        loaded = EpisodeRecording.from_bytes(data)
+
+        assert loaded.seed == 5
+        assert loaded.num_frames == self.recording.num_frames
+        np.testing.assert_array_equal(loaded.actions, self.recording.actions)
+        assert (loaded.pipe_gap_size_mode, loaded.pipe_distance_mode) == ("large", "random")
+
+    def test_replay_is_frame_exact(self):
+        """Test that re-simulating a recording reproduces the episode frame for frame."""
+        player = EpisodePlayer(self.recording)
+        replayed_heights = [player.game_manager.bird.y_pos]
+        while not player.is_finished:
+            player.step()
+            replayed_heights.append(player.game_manager.bird.y_pos)
+
+        assert replayed_heights == self.heights
+        assert player.game_manager.score == self.game_manager.score > 0
+        assert player.game_manager.state == self.game_manager.state
+
+    def test_seek_matches_linear_play(self):
+        """Test that seeking backwards and forwards through snapshots lands on the same game."""
+        player = EpisodePlayer(self.recording, snapshot_interval=30)
+        player.play()
+        last_frame = player.frame
+
+        for frame in (last_frame // 2, 5, last_frame - 1, 61):
+            game_manager = player.seek(frame)
+            assert player.frame == frame
+            assert game_manager.bird.y_pos == self.heights[frame]
+
+    def test_rejects_other_config(self):
+        """Test that a recording made under a different game config is not replayed."""
+        self.recording.config_hash = b"\0" * 8
+        with pytest.raises(ValueError, match="different game config"):
+            EpisodePlayer(self.recording)
+
+    def test_config_hash_ignores_unrelated_settings(self):
+        """Test that only settings that change how an episode plays out change the config hash."""
+        original_hash = get_config_hash()
+        original_debug, original_memory = config.DEBUG, config.AGENT_MAX_MEMORY
+        original_hitboxes = episode_replay.load_frame_hitboxes
+        try:
+            config.DEBUG, config.AGENT_MAX_MEMORY = not original_debug, original_memory + 1
+            assert get_config_hash() == original_hash
+            episode_replay.load_frame_hitboxes = lambda: [hitbox.inflate(2, 2) for hitbox in original_hitboxes()]
+            assert get_config_hash() != original_hash
+        finally:
+            config.DEBUG, config.AGENT_MAX_MEMORY = original_debug, original_memory
+            episode_replay.load_frame_hitboxes = original_hitboxes
+
+    def test_save_and_load(self):
+        """Test that recordings are stored as files."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "episode.ftep")
+            self.recording.save(path)
+            assert EpisodeRecording.load(path).num_frames == self.recording.num_frames
@@ -0,0 +1,95 @@
+import pygame
+import pytest
+
+from flappy_trainer.game_managers.fixed_timestep_loop import FixedTimestepLoop
+from flappy_trainer.game_managers.game_manager import GameManager
+
+
+class TestFixedTimestepLoop:
+    def setup_method(self):
+        """Set up the test environment."""
+        pygame.init()
+        self.game_loop = FixedTimestepLoop(step_time=0.01, target_fps=100, max_steps_per_frame=5)
+        self.game_loop.add_frame_time(0.0)  # The first frame is not counted in the stats
+
+    def teardown_method(self):
+        """Clean up the test environment."""
+        pygame.quit()
+
+    def test_steps_consume_whole_steps(self):
+        """Test that a frame runs one physics step per whole step time and keeps the remainder."""
+        self.game_loop.add_frame_time(0.025)
+        assert len(list(self.game_loop.steps())) == 2
+        assert self.game_loop.accumulator == pytest.approx(0.005)
+        assert self.game_loop.interpolation == pytest.approx(0.5)
+
+        self.game_loop.add_frame_time(0.006)
+        assert len(list(self.game_loop.steps())) == 1
+        assert self.game_loop.accumulator == pytest.approx(0.001)
+
+    def test_short_frames_accumulate(self):
+        """Test that frames shorter than a step run no steps until a whole step has accumulated."""
+        self.game_loop.add_frame_time(0.004)
+        assert list(self.game_loop.steps()) == []
+        self.game_loop.add_frame_time(0.007)
+        assert len(list(self.game_loop.steps())) == 1
+
+    def test_long_frame_drops_steps(self):
+        """Test that a stalled frame runs at most max_steps_per_frame steps and drops the rest."""
+        self.game_loop.add_frame_time(0.0805)
+        assert len(list(self.game_loop.steps())) == 5
+        assert self.game_loop.dropped_steps == 3
+        assert self.game_loop.accumulator < self.game_loop.step_time
+        assert self.game_loop.dropped_frames == 1
+
+    def test_frame_time_stats(self):
+        """Test the frame time percentiles and the dropped frame count."""
+        for _ in range(98):
+            self.game_loop.add_frame_time(0.01)
+        self.game_loop.add_frame_time(0.05)
+        self.game_loop.add_frame_time(0.05)
+        stats = self.game_loop.get_stats()
+        assert stats["frames"] == 101
+        assert stats["p50_frame_time_ms"] == pytest.approx(10)
+        assert stats["p99_frame_time_ms"] == pytest.approx(50)
+        assert stats["dropped_frames"] == 2
+
+    def test_simulated_time_matches_real_time(self):
+        """Test that uneven frames simulate the same number of fixed steps as the real time that passed."""
+        total_steps = 0
+        for frame_time in [0.013, 0.007, 0.021, 0.009, 0.010, 0.040] * 10:
+            self.game_loop.add_frame_time(frame_time)
+            total_steps += len(list(self.game_loop.steps()))
+        assert total_steps * self.game_loop.step_time + self.game_loop.accumulator == pytest.approx(1.0)
+        assert self.game_loop.dropped_steps == 0
+
+    def test_interpolated_draw_does_not_change_the_game(self):
+        """Test that drawing between two steps leaves the simulated positions exactly as they were."""
+        game_manager = GameManager()
+        game_manager.start_game(seed=1)
+        for _ in range(200):
+            game_manager.update(self.game_loop.step_time)
+        bird_y_pos = game_manager.bird.y_pos
+        pipe_x_positions = [pipe.x_pos for pipe in game_manager.pipes]
+        game_manager.draw(interpolation=0.3)
+        assert game_manager.bird.y_pos == bird_y_pos
+        assert [pipe.x_pos for pipe in game_manager.pipes] == pipe_x_positions
+
+    def test_interpolated_pipes_do_not_jump_on_level_up(self):
+        """Test that pipes are drawn between their last two positions even when the last step leveled up."""
+        game_manager = GameManager(headless=True)
+        game_manager.start_game(seed=1)
+        game_manager.time_between_pipes = 0  # A pipe on every step
+        for _ in range(3):
+            game_manager.update(self.game_loop.step_time)
+        previous_x_positions = [pipe.previous_x_pos for pipe in game_manager.pipes]
+        x_positions = [pipe.x_pos for pipe in game_manager.pipes]
+        game_manager._level_up()
+
+        drawn_x_positions = []
+        for pipe in game_manager.pipes:
+            draw = pipe.draw
+            pipe.draw = lambda screen, draw=draw, pipe=pipe: drawn_x_positions.append(pipe.x_pos) or draw(screen)
+        game_manager.draw(interpolation=0.25)
+        expected = [previous + (x_pos - previous) * 0.25 for previous, x_pos in zip(previous_x_positions, x_positions)]
+        assert drawn_x_positions == pytest.approx(expected)
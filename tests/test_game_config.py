@@ -0,0 +1,164 @@
+import dataclasses
+
+import numpy as np
+import pygame
+import pytest
+
+from flappy_trainer.ai.ai_trainer import AITrainer
+from flappy_trainer.ai.ai_utils import (
+    Action,
+    Knowledge,
+    get_curr_pipe_velocity,
+    get_current_state,
+    get_nearest_pipe_details,
+    knowledge_to_records,
+)
+from flappy_trainer.ai.environment_state import EnvironmentState
+from flappy_trainer.ai.episode_replay import get_config_hash
+from flappy_trainer.ai.state_encoder import StateEncoder
+from flappy_trainer.ai.tabular_q_agent import TabularQAgent
+from flappy_trainer.ai.vectorized_environment import PhysicsRanges, VectorizedEnvironment
+from flappy_trainer.config import BIRD_GRAVITY, DEFAULT_GAME_CONFIG, SCREEN_HEIGHT, GameConfig
+from flappy_trainer.game_managers.game_manager import GameManager
+from flappy_trainer.game_objects.bird.bird import Bird
+from flappy_trainer.game_objects.pipe.pipe import Pipe
+from flappy_trainer.utils import PipeColor
+
+
+class TestGameConfig:
+    def setup_method(self):
+        """Set up the test environment before each test."""
+        pygame.init()
+        self.game_manager = GameManager()
+        self.game_manager.start_game()
+        self.config = dataclasses.replace(
+            DEFAULT_GAME_CONFIG,
+            bird_gravity=DEFAULT_GAME_CONFIG.bird_gravity * 2,
+            initial_pipe_speed=DEFAULT_GAME_CONFIG.initial_pipe_speed + 100,
+            pipe_width=DEFAULT_GAME_CONFIG.pipe_width + 20,
+        )
+
+    def teardown_method(self):
+        """Clean up the test environment after each test."""
+        pygame.quit()
+
+    def test_default_config_is_read_from_env(self):
+        """Test that the default config is the one read from the environment and backs the module constants."""
+        assert GameConfig.from_env() == DEFAULT_GAME_CONFIG
+        assert DEFAULT_GAME_CONFIG.bird_gravity == BIRD_GRAVITY
+        assert DEFAULT_GAME_CONFIG.screen_height == SCREEN_HEIGHT
+
+    def test_config_is_frozen(self):
+        """Test that a config cannot be changed after it is created."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            self.config.bird_gravity = 0
+
+    def test_bird_and_pipe_use_config(self):
+        """Test that birds and pipes take their physics and geometry from the given config."""
+        bird = Bird(self.config)
+        assert bird.gravity == self.config.bird_gravity
+        assert Bird().gravity == DEFAULT_GAME_CONFIG.bird_gravity
+
+        pipe = Pipe(PipeColor.GREEN, gap_center=300, gap_height=150, config=self.config)
+        assert pipe.top_pipe_rect.width == self.config.pipe_width
+
+    def test_differently_configured_games_side_by_side(self):
+        """Test that two games with different configs run in one process without affecting each other."""
+        default_game = self.game_manager
+        custom_game = GameManager(config=self.config)
+        default_game.start_game(seed=1)
+        custom_game.start_game(seed=1)
+        for _ in range(10):
+            default_game.update(1 / 60)
+            custom_game.update(1 / 60)
+
+        assert custom_game.bird.y_velocity == pytest.approx(2 * default_game.bird.y_velocity)
+        assert get_curr_pipe_velocity(custom_game) == get_curr_pipe_velocity(default_game) + 100
+
+        custom_game.pipes = [Pipe(PipeColor.GREEN, x_pos=400, gap_center=300, gap_height=150, config=self.config)]
+        distance, _, _ = get_nearest_pipe_details(custom_game)
+        assert distance == 400 + self.config.pipe_width - custom_game.bird.x_pos
+
+    def test_state_encoder_uses_game_config(self):
+        """Test that features are normalized by the config of the encoded game."""
+        game_manager = GameManager(config=self.config)
+        game_manager.start_game()
+        features = StateEncoder.encode(game_manager, StateEncoder.allocate()[0])
+        expected_speed = get_curr_pipe_velocity(game_manager) / self.config.max_pipe_velocity
+        assert features[2] == pytest.approx(expected_speed)
+        assert features[2] != pytest.approx(StateEncoder.encode(self.game_manager, features.copy())[2])
+
+    def test_vectorized_environment_uses_config(self):
+        """Test that the vectorized games step with the physics of their config."""
+        default_env = VectorizedEnvironment(2, is_pipes=False, seed=0)
+        custom_env = VectorizedEnvironment(2, is_pipes=False, seed=0, config=self.config)
+        default_env.step()
+        custom_env.step()
+        np.testing.assert_allclose(custom_env.bird_velocity, 2 * default_env.bird_velocity)
+
+    def test_config_hash_depends_on_config(self):
+        """Test that recordings made under different configs have different config hashes."""
+        assert get_config_hash() == get_config_hash(DEFAULT_GAME_CONFIG)
+        assert get_config_hash(self.config) != get_config_hash()
+
+    def test_states_are_encoded_with_their_game_config(self):
+        """Test that states taken from a game keep its config, and are encoded like the game itself."""
+        config = dataclasses.replace(
+            DEFAULT_GAME_CONFIG,
+            screen_width=DEFAULT_GAME_CONFIG.screen_width * 2,
+            screen_height=DEFAULT_GAME_CONFIG.screen_height + 100,
+        )
+        game_manager = GameManager(config=config)
+        game_manager.start_game()
+        state = get_current_state(game_manager)  # No pipes yet, so the pipe features are the defaults
+        assert state.config is config
+
+        expected = StateEncoder.encode(game_manager, StateEncoder.allocate()[0])
+        np.testing.assert_allclose(StateEncoder.encode_state(state, StateEncoder.allocate()[0]), expected, rtol=1e-6)
+        np.testing.assert_allclose(state.to_numpy_array(), expected, atol=2e-3)
+        records = knowledge_to_records([Knowledge(state, Action.FLAP, 1, state)])
+        np.testing.assert_allclose(records["state"][0], expected, rtol=1e-6)
+        np.testing.assert_allclose(records["next_state"][0], expected, rtol=1e-6)
+
+    def test_tabular_agent_bins_positions_by_state_config(self):
+        """Test that the tabular agent bins the same relative position in any screen size into the same row."""
+        config = dataclasses.replace(
+            DEFAULT_GAME_CONFIG,
+            screen_width=DEFAULT_GAME_CONFIG.screen_width * 2,
+            screen_height=DEFAULT_GAME_CONFIG.screen_height * 2,
+        )
+        agent = TabularQAgent()
+        default_state = EnvironmentState(True, 100, 0, 300, next_pipe_distance=200, next_pipe_gap_pos=100)
+        scaled_state = EnvironmentState(True, 200, 0, 300, next_pipe_distance=400, next_pipe_gap_pos=200, config=config)
+        unscaled_state = EnvironmentState(True, 200, 0, 300, next_pipe_distance=400, next_pipe_gap_pos=200)
+        assert agent.get_state_index(scaled_state) == agent.get_state_index(default_state)
+        assert agent.get_state_index(unscaled_state) != agent.get_state_index(default_state)
+
+    def test_trainer_plays_games_with_its_config(self):
+        """Test that the AI trainer's agent decides on states of games with the trainer's config."""
+        agent = TabularQAgent()
+        configs = []
+        choose_action = agent.choose_action
+        agent.choose_action = lambda state: configs.append(state.config) or choose_action(state)
+
+        trainer = AITrainer(agent=agent, config=self.config)
+        trainer.evaluate(1, max_frames_per_episode=30)
+        assert configs and all(config is self.config for config in configs)
+
+    def test_trainer_draws_physics_every_episode(self):
+        """Test that a trainer with physics ranges trains every episode on its own physics drawn from them."""
+        ranges = PhysicsRanges.around(self.config, spread=0.2)
+        agent = TabularQAgent()
+        configs = []
+        choose_action = agent.choose_action
+        agent.choose_action = lambda state: configs.append(state.config) or choose_action(state)
+
+        trainer = AITrainer(agent=agent, config=self.config, physics_ranges=ranges)
+        trainer.train_gravity("", num_episodes=3)
+        episode_configs = list(dict.fromkeys(configs))
+        assert len(episode_configs) == 3
+        assert trainer.config is self.config
+        for config in episode_configs:
+            assert ranges.bird_gravity[0] <= config.bird_gravity <= ranges.bird_gravity[1]
+            assert config.pipe_min_gap_height <= config.pipe_max_gap_height
+            assert config.pipe_width == self.config.pipe_width
@@ -1,6 +1,10 @@
+import dataclasses
+
 import pygame
+import pytest
 
 from flappy_trainer.config import (
+    DEFAULT_GAME_CONFIG,
     INITIAL_PIPE_SPEED,
     PIPE_DEFAULT_GAP_HEIGHT,
     PIPE_DEFAULT_Y_POS,
@@ -8,11 +12,12 @@ from flappy_trainer.config import (
     SCREEN_HEIGHT,
     START_LEVEL,
     START_SCORE,
+    GameConfig,
 )
 from flappy_trainer.game_managers.game_manager import GameManager
 from flappy_trainer.game_objects.bird.bird import Bird
 from flappy_trainer.game_objects.pipe.pipe import Pipe
-from flappy_trainer.utils import GameState
+from flappy_trainer.utils import GameState, PipeColor
 
 
 class TestGameManager:
@@ -49,6 +54,18 @@ class TestGameManager:
         assert self.game_manager.score == START_SCORE
         assert len(self.game_manager.pipes) == 0
 
+    def test_seed_applies_to_one_game(self):
+        """Test that a seeded game replays its pipe course and a later unseeded game does not reuse the seed."""
+        courses = []
+        for seed in (7, 7, None):
+            self.game_manager.start_game(seed)
+            assert (self.game_manager.rng is None) == (seed is None)
+            for _ in range(5):
+                self.game_manager._spawn_pipe()
+            courses.append([pipe.gap_center for pipe in self.game_manager.pipes])
+        assert courses[0] == courses[1]
+        assert self.game_manager.rng is None
+
     def test_handle_event_space_key(self):
         """Test handling the space key during different game states."""
         self.game_manager.state = GameState.START_MENU
@@ -146,6 +163,110 @@ class TestGameManager:
         self.game_manager.draw()
         assert self.game_manager.state == GameState.GAME_OVER
 
+    def test_broad_phase_only_tests_pipes_in_bird_column(self):
+        """Test that only the pipes overlapping the bird's column are tested for collisions."""
+        bird_x = self.game_manager.bird.x_pos
+        for x_pos in (bird_x - 2 * PIPE_WIDTH, bird_x, bird_x + 3 * PIPE_WIDTH, bird_x + 6 * PIPE_WIDTH):
+            pipe = Pipe(PipeColor.GREEN, gap_center=300, gap_height=200)
+            pipe.x_pos = x_pos
+            pipe.update_rects()
+            self.game_manager.pipes.append(pipe)
+        tested = []
+        for pipe in self.game_manager.pipes:
+            pipe.collides_with = lambda bird_rect, pipe=pipe: tested.append(pipe) or False
+
+        self.game_manager._check_bird_collision()
+        assert tested == [self.game_manager.pipes[1]]
+        assert self.game_manager.state == GameState.RUNNING
+
+    def test_pixel_perfect_collision(self):
+        """Test that the pixel-perfect narrow phase ignores transparent corners of the bird's rect."""
+        bird = self.game_manager.bird
+        bird_rect = bird.get_rect()
+        corner = pygame.Rect(bird_rect.left, bird_rect.top, 1, 1)  # Transparent in every frame
+        assert bird_rect.colliderect(corner)
+        assert not bird.overlaps_rect(corner)
+        assert bird.overlaps_rect(bird_rect)
+
+        pipe = Pipe(PipeColor.GREEN, gap_center=300, gap_height=200)
+        pipe.x_pos = bird_rect.left - PIPE_WIDTH + 1
+        pipe.update_rects()
+        pipe.top_pipe_rect.bottom = bird_rect.top + 1
+        pipe.bot_pipe_rect.top = SCREEN_HEIGHT
+        self.game_manager.pipes = [pipe]
+        self.game_manager.pixel_perfect_collision = True
+        self.game_manager._check_bird_collision()
+        assert self.game_manager.state == GameState.RUNNING
+
+        self.game_manager.pixel_perfect_collision = False
+        self.game_manager._check_bird_collision()
+        assert self.game_manager.state == GameState.GAME_OVER
+
+    @pytest.mark.parametrize(
+        "config",
+        [
+            DEFAULT_GAME_CONFIG,
+            dataclasses.replace(DEFAULT_GAME_CONFIG, initial_pipe_speed=500, score_per_level_up=1),
+        ],
+    )
+    def test_advance_matches_updates(self, config: GameConfig):
+        """
+        Test that advancing an action interval matches updating once per frame, pipes and scoring included,
+        also with fast pipes that level up on every point.
+        """
+        stepped = GameManager(pipe_gap_loc_mode="center", config=config)
+        advanced = GameManager(pipe_gap_loc_mode="center", config=config)
+        stepped.start_game(seed=3)
+        advanced.start_game(seed=3)
+        for _ in range(40):
+            for game_manager in (stepped, advanced):
+                if game_manager.bird.y_pos > game_manager.config.screen_height / 2:
+                    game_manager.bird.flap()
+            for _ in range(15):
+                stepped.update(1 / 60)
+            frames = advanced.advance(15 / 60)
+            assert advanced.state == stepped.state
+            if stepped.state != GameState.RUNNING:
+                break
+            assert frames == 15
+            assert advanced.bird.y_pos == pytest.approx(stepped.bird.y_pos)
+            assert advanced.score == stepped.score
+            assert advanced.pipe_speed == stepped.pipe_speed
+            assert [pipe.x_pos for pipe in advanced.pipes] == [pipe.x_pos for pipe in stepped.pipes]
+
+    def test_advance_does_not_tunnel_through_pipes(self):
+        """Test that a long advance detects a pipe that a single update of the same duration skips past."""
+        stepped = GameManager()
+        stepped.start_game()
+        for game_manager in (stepped, self.game_manager):
+            game_manager.time_between_pipes = float("inf")
+            pipe = Pipe(PipeColor.GREEN, gap_center=SCREEN_HEIGHT - 110, gap_height=120)
+            pipe.x_pos = game_manager.bird.get_rect().right + 1
+            pipe.update_rects()
+            game_manager.pipes = [pipe]
+
+        stepped.update(0.5)
+        assert stepped.pipes[0].top_pipe_rect.right < stepped.bird.get_rect().left
+        assert stepped.state == GameState.RUNNING
+
+        frames = self.game_manager.advance(0.5)
+        assert frames < 30
+        assert self.game_manager.state == GameState.GAME_OVER
+
+    def test_advance_stops_at_bounds(self):
+        """Test that advancing stops on the frame the bird leaves the screen."""
+        self.game_manager.is_pipes_active = False
+        stepped = GameManager(is_pipes=False)
+        stepped.start_game()
+        stepped_frames = 0
+        while stepped.state == GameState.RUNNING:
+            stepped.update(1 / 60)
+            stepped_frames += 1
+
+        assert self.game_manager.advance(10.0) == stepped_frames
+        assert self.game_manager.state == GameState.GAME_OVER
+        assert self.game_manager.bird.y_pos == pytest.approx(stepped.bird.y_pos)
+
     def test_level_up(self):
         """Test that the game levels up and increases difficulty."""
         self.game_manager.score = self.game_manager.next_level_score - 1
@@ -172,3 +293,85 @@ class TestGameManager:
         self.game_manager._spawn_pipe()
         self.game_manager._spawn_pipe()
         assert all(pipe.gap_height == 150 for pipe in self.game_manager.pipes)
+
+    def test_draw_returns_drawn_areas(self):
+        """Test that the bird and pipes report the screen areas they draw."""
+        self.game_manager._spawn_pipe()
+        self.game_manager.pipes[0].x_pos = 400
+        self.game_manager.pipes[0].update_rects()
+        bird_rect = self.game_manager.bird.draw(self.game_manager.screen)
+        pipe_rect = self.game_manager.pipes[0].draw(self.game_manager.screen)
+        assert bird_rect.contains(self.game_manager.bird.get_rect())
+        assert pipe_rect.height == SCREEN_HEIGHT
+        assert pipe_rect.width >= PIPE_WIDTH
+
+    def test_dirty_rect_rendering_matches_full_redraw(self):
+        """Test that dirty-rect frames leave the screen exactly as a full redraw would."""
+        self.game_manager.dirty_rect_rendering = True
+        for frame in range(120):
+            if frame % 20 == 0:
+                self.game_manager.bird.flap()
+            self.game_manager.update(1 / 60)
+            self.game_manager.draw()
+        assert self.game_manager.state == GameState.RUNNING
+        dirty_frame = self.game_manager.screen.copy()
+
+        self.game_manager.dirty_rect_rendering = False
+        self.game_manager.draw()
+        assert pygame.image.tobytes(dirty_frame, "RGB") == pygame.image.tobytes(self.game_manager.screen, "RGB")
+
+    def test_dirty_rect_rendering_updates_changed_areas(self):
+        """Test that only the previous and current areas are pushed to the display after the first frame."""
+        self.game_manager.dirty_rect_rendering = True
+        self.game_manager._spawn_pipe()
+        self.game_manager.draw()  # The first frame redraws the whole screen
+        previous_rects = self.game_manager._drawn_rects
+
+        updated = []
+        original_update = pygame.display.update
+        pygame.display.update = updated.append
+        try:
+            self.game_manager.update(1 / 60)
+            self.game_manager.draw()
+        finally:
+            pygame.display.update = original_update
+
+        assert len(updated) == 1
+        rects = updated[0]
+        assert rects == previous_rects + self.game_manager._drawn_rects
+        assert len(self.game_manager._drawn_rects) == 3 + len(self.game_manager.pipes)  # Bird, pipes, two HUD lines
+        assert sum(rect.width * rect.height for rect in rects) < self.game_manager.screen.get_width() * SCREEN_HEIGHT
+
+    def test_dirty_rect_rendering_redraws_after_menu(self):
+        """Test that returning from a menu redraws the whole screen before dirty-rect frames resume."""
+        self.game_manager.dirty_rect_rendering = True
+        self.game_manager.draw()
+        self.game_manager.state = GameState.PAUSED
+        self.game_manager.draw()
+        assert self.game_manager._drawn_rects is None
+        self.game_manager.state = GameState.RUNNING
+        self.game_manager.draw()
+        assert self.game_manager._drawn_rects is not None
+
+    def test_hud_text_rendered_only_on_change(self):
+        """Test that HUD text is re-rendered only when the score or level changes."""
+        self.game_manager.draw()
+        score_surface = self.game_manager.score_text.surface
+        level_surface = self.game_manager.level_text.surface
+        self.game_manager.draw()
+        assert self.game_manager.score_text.surface is score_surface
+        assert self.game_manager.level_text.surface is level_surface
+
+        self.game_manager.score += 1
+        self.game_manager.draw()
+        assert self.game_manager.score_text.surface is not score_surface
+        assert self.game_manager.score_text.value == self.game_manager.score
+        assert self.game_manager.level_text.surface is level_surface
+
+    def test_draw_canvas_matches_background(self):
+        """Test that the canvas is drawn from the pre-rendered background."""
+        self.game_manager.screen.fill((1, 2, 3))
+        self.game_manager.draw_canvas()
+        assert pygame.image.tobytes(self.game_manager.screen, "RGB") == pygame.image.tobytes(
+            self.game_manager.background, "RGB"
+        )
@@ -0,0 +1,99 @@
+import csv
+import os
+import tempfile
+
+import pytest
+
+from flappy_trainer.ai.hyperparameter_sweep import (
+    DEFAULT_PARAMS,
+    RESULT_COLUMNS,
+    _partition_cpus,
+    expand_spec,
+    run_sweep,
+)
+
+
+class TestHyperparameterSweep:
+    def test_grid_spec_expands_every_combination_per_seed(self):
+        """Test that a grid spec produces the cross product of its values for every seed."""
+        spec = {"method": "grid", "seeds": [0, 1], "params": {"action_tick": [10, 15], "batch_size": [32, 64, 128]}}
+        runs = expand_spec(spec)
+
+        assert len(runs) == 2 * 3 * 2
+        assert [run["run_id"] for run in runs] == list(range(len(runs)))
+        combinations = {(run["params"]["action_tick"], run["params"]["batch_size"], run["seed"]) for run in runs}
+        assert len(combinations) == len(runs)
+
+    def test_unspecified_params_use_defaults(self):
+        """Test that every run carries the full set of hyperparameters."""
+        runs = expand_spec({"params": {"n_steps": [3]}})
+        assert runs[0]["params"] == {**DEFAULT_PARAMS, "n_steps": 3}
+
+    def test_random_spec_samples_within_ranges(self):
+        """Test that random search draws choices from lists and values inside ranges, reproducibly."""
+        spec = {
+            "method": "random",
+            "num_samples": 20,
+            "params": {
+                "batch_size": [32, 64],
+                "init_explore_rate": {"low": 0.3, "high": 0.7},
+                "episodes_per_curricula": {"low": 100, "high": 600},
+            },
+        }
+        runs = expand_spec(spec)
+
+        assert len(runs) == 20
+        for run in runs:
+            assert run["params"]["batch_size"] in (32, 64)
+            assert 0.3 <= run["params"]["init_explore_rate"] <= 0.7
+            assert isinstance(run["params"]["episodes_per_curricula"], int)
+            assert 100 <= run["params"]["episodes_per_curricula"] <= 600
+        assert runs == expand_spec(spec)
+
+    def test_invalid_specs(self):
+        """Test that unknown hyperparameters and methods are rejected."""
+        with pytest.raises(ValueError, match="Unknown hyperparameters"):
+            expand_spec({"params": {"learning_rate": [0.1]}})
+        with pytest.raises(ValueError, match="Invalid search method"):
+            expand_spec({"method": "bayesian"})
+        with pytest.raises(ValueError, match="needs a list"):
+            expand_spec({"method": "grid", "params": {"init_explore_rate": {"low": 0.1, "high": 0.5}}})
+
+    def test_partition_cpus_gives_disjoint_sets(self):
+        """Test that workers are pinned to disjoint CPUs, or left unpinned when there are too few."""
+        num_cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+        cpu_sets = _partition_cpus(num_cpus, 1)
+        assert all(len(cpu_set) == 1 for cpu_set in cpu_sets)
+        assert len(set().union(*cpu_sets)) == num_cpus
+        assert _partition_cpus(num_cpus + 1, 1) == [set() for _ in range(num_cpus + 1)]
+
+    def test_sweep_writes_results_and_errors(self):
+        """Test that a tiny sweep writes one CSV row per run, recording the error of a failing run."""
+        spec = {
+            "target_score": 0,
+            "eval_episodes": 1,
+            "params": {
+                "gravity_episodes": [1],
+                "num_curricula": [1],
+                "episodes_per_curricula": [1],
+                "action_tick": [15, 0],  # An action tick of 0 fails on the first frame
+            },
+        }
+        runs = expand_spec(spec)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "results.csv")
+            rows = run_sweep(runs, path, workers=1)
+            with open(path, newline="") as file:
+                reader = csv.DictReader(file)
+                assert reader.fieldnames == RESULT_COLUMNS
+                table = {int(row["run_id"]): row for row in reader}
+
+        assert len(rows) == len(table) == 2
+        finished, failed = table[0], table[1]
+        assert finished["error"] == ""
+        assert int(finished["action_tick"]) == 15
+        assert float(finished["train_seconds"]) > 0
+        assert float(finished["time_to_score"]) >= 0
+        assert float(finished["eval_score_mean"]) >= 0
+        assert "ZeroDivisionError" in failed["error"]
+        assert failed["eval_score_mean"] == ""
@@ -0,0 +1,185 @@
+import os
+import socket
+import tempfile
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from flappy_trainer.ai.ai_utils import Action
+from flappy_trainer.ai.environment_state import EnvironmentState
+from flappy_trainer.ai.inference_server import (
+    SET_WEIGHTS,
+    InferenceClient,
+    InferenceServer,
+    NumpyPolicy,
+    load_weights,
+)
+from flappy_trainer.ai.neuroevolution_trainer import LAYER_SIZES
+from flappy_trainer.ai.state_encoder import StateEncoder
+
+NUM_FEATURES = EnvironmentState.get_num_features()
+
+
+def create_weights(seed: int) -> list[np.ndarray]:
+    rng = np.random.default_rng(seed)
+    weights = []
+    for fan_in, fan_out in zip(LAYER_SIZES, LAYER_SIZES[1:]):
+        weights.extend([rng.normal(0, 0.5, (fan_in, fan_out)), rng.normal(0, 0.5, fan_out)])
+    return [layer.astype(np.float32) for layer in weights]
+
+
+class RecordingPolicy(NumpyPolicy):
+    def __init__(self, weights: list[np.ndarray]):
+        super().__init__(weights)
+        self.batch_sizes = []
+
+    def predict(self, observations: np.ndarray) -> np.ndarray:
+        self.batch_sizes.append(len(observations))
+        return super().predict(observations)
+
+
+class TestInferenceServer:
+    def setup_method(self):
+        """Set up the test environment."""
+        self.weights = create_weights(0)
+        self.policy = RecordingPolicy(self.weights)
+        self.observations = np.random.default_rng(1).random((64, NUM_FEATURES), dtype=np.float32)
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def teardown_method(self):
+        """Clean up the test environment."""
+        self.temp_dir.cleanup()
+
+    def expected_actions(self, weights: list[np.ndarray]) -> np.ndarray:
+        q_values = NumpyPolicy(weights).predict(self.observations)
+        return np.where(q_values[:, 0] > q_values[:, 1], Action.FLAP.value, Action.NO_FLAP.value)
+
+    def test_pipe_client_gets_policy_actions(self):
+        """Test that a pipe client gets the greedy actions of the served policy."""
+        with InferenceServer(self.policy) as server:
+            client = InferenceClient(server.connect_pipe())
+            np.testing.assert_array_equal(
+                client.predict_actions(self.observations), self.expected_actions(self.weights)
+            )
+
+            state = EnvironmentState(bird_is_alive=True, bird_vert_pos=300, bird_vert_velocity=-4, pipe_velocity=300)
+            q_values = self.policy.predict(StateEncoder.encode_state(state, StateEncoder.allocate(1)[0])[None])[0]
+            assert client.choose_action(state) == (Action.FLAP if q_values[0] > q_values[1] else Action.NO_FLAP)
+
+    def test_socket_clients(self):
+        """Test that clients connect over the server's Unix socket."""
+        address = os.path.join(self.temp_dir.name, "inference.sock")
+        with InferenceServer(self.policy, address):
+            client = InferenceClient.connect(address)
+            np.testing.assert_array_equal(
+                client.predict_actions(self.observations), self.expected_actions(self.weights)
+            )
+            client.close()
+        assert not os.path.exists(address)
+
+    def test_restarts_on_socket_left_by_crash(self):
+        """Test that a server starts on the socket file a crashed server left, and restarts after stopping."""
+        address = os.path.join(self.temp_dir.name, "inference.sock")
+        crashed = socket.socket(socket.AF_UNIX)
+        crashed.bind(address)
+        crashed.listen()
+        crashed.close()  # Like a killed server: the socket file stays, nobody listens on it
+        assert os.path.exists(address)
+
+        for _ in range(2):
+            with InferenceServer(self.policy, address):
+                client = InferenceClient.connect(address)
+                actions = client.predict_actions(self.observations)
+                client.close()
+            np.testing.assert_array_equal(actions, self.expected_actions(self.weights))
+
+    def test_live_socket_is_not_removed(self):
+        """Test that starting a second server on the address of a running one fails instead of taking it over."""
+        address = os.path.join(self.temp_dir.name, "inference.sock")
+        with InferenceServer(self.policy, address):
+            with pytest.raises(OSError):
+                InferenceServer(self.policy, address)
+            client = InferenceClient.connect(address)
+            actions = client.predict_actions(self.observations)
+            client.close()
+        np.testing.assert_array_equal(actions, self.expected_actions(self.weights))
+
+    def test_concurrent_requests_are_batched(self):
+        """Test that requests arriving within the latency deadline are answered by one forward pass."""
+        expected = self.expected_actions(self.weights)
+        results = {}
+        with InferenceServer(self.policy, max_batch_size=len(self.observations), max_latency=5.0) as server:
+            clients = [InferenceClient(server.connect_pipe()) for _ in self.observations]
+
+            def request(index: int):
+                results[index] = clients[index].predict_actions(self.observations[index : index + 1])[0]
+
+            threads = [threading.Thread(target=request, args=(index,)) for index in range(len(clients))]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert self.policy.batch_sizes == [len(self.observations)]
+        assert [results[index] for index in range(len(clients))] == expected.tolist()
+
+    def test_lone_request_waits_at_most_max_latency(self):
+        """Test that a batch that does not fill up is run once its deadline passes."""
+        with InferenceServer(self.policy, max_batch_size=10_000, max_latency=0.05) as server:
+            client = InferenceClient(server.connect_pipe())
+            start_time = time.perf_counter()
+            client.predict_actions(self.observations[:1])
+            assert time.perf_counter() - start_time < 1.0
+        assert self.policy.batch_sizes == [1]
+
+    def test_hot_swap_weights(self):
+        """Test that weights swapped by a client answer every request sent after the swap."""
+        new_weights = create_weights(1)
+        assert not np.array_equal(self.expected_actions(new_weights), self.expected_actions(self.weights))
+
+        with InferenceServer(self.policy) as server:
+            player, trainer = InferenceClient(server.connect_pipe()), InferenceClient(server.connect_pipe())
+            player.predict_actions(self.observations)
+            trainer.set_weights(new_weights)
+            np.testing.assert_array_equal(player.predict_actions(self.observations), self.expected_actions(new_weights))
+
+            server.set_weights(self.weights)
+            deadline = time.monotonic() + 5
+            actions = player.predict_actions(self.observations)
+            while not np.array_equal(actions, self.expected_actions(self.weights)) and time.monotonic() < deadline:
+                actions = player.predict_actions(self.observations)
+            np.testing.assert_array_equal(actions, self.expected_actions(self.weights))
+
+    def test_bad_weights_are_rejected(self):
+        """Test that a swap to weights that cannot be loaded or do not fit is rejected and the server keeps serving."""
+        expected = self.expected_actions(self.weights)
+        with InferenceServer(self.policy) as server:
+            trainer, player = InferenceClient(server.connect_pipe()), InferenceClient(server.connect_pipe())
+            with pytest.raises(RuntimeError):
+                trainer._request(SET_WEIGHTS + b"garbage")
+            with pytest.raises(RuntimeError):
+                trainer.set_weights(self.weights[:-2])
+            with pytest.raises(RuntimeError):
+                trainer.set_weights([layer.T for layer in self.weights])
+            np.testing.assert_array_equal(player.predict_actions(self.observations), expected)
+
+            server.set_weights(self.weights[:2])
+            np.testing.assert_array_equal(trainer.predict_actions(self.observations), expected)
+            np.testing.assert_array_equal(player.predict_actions(self.observations), expected)
+
+    def test_invalid_request_raises(self):
+        """Test that a request of partial observations is answered with an error, and the client can go on."""
+        with InferenceServer(self.policy) as server:
+            client = InferenceClient(server.connect_pipe())
+            with pytest.raises(RuntimeError):
+                client.predict_actions(self.observations[0, :3])
+            assert len(client.predict_actions(self.observations[:2])) == 2
+
+    def test_load_weights_from_archive(self):
+        """Test that weights saved as a NumPy archive load in order."""
+        path = os.path.join(self.temp_dir.name, "weights.npz")
+        np.savez(path, *self.weights)
+        for loaded, weights in zip(load_weights(path), self.weights):
+            np.testing.assert_array_equal(loaded, weights)
@@ -0,0 +1,74 @@
+import numpy as np
+import pygame
+import pytest
+
+from flappy_trainer.ai.neuroevolution_trainer import LAYER_SIZES, NeuroevolutionTrainer
+from flappy_trainer.ai.vectorized_environment import PHYSICS_PARAMETERS, PhysicsRanges, VectorizedEnvironment
+
+
+class TestNeuroevolutionTrainer:
+    def setup_method(self):
+        """Set up the test environment."""
+        pygame.init()
+        self.trainer = NeuroevolutionTrainer(population_size=20, elite_fraction=0.1, seed=0)
+
+    def teardown_method(self):
+        """Clean up the test environment."""
+        pygame.quit()
+
+    def test_predict_matches_single_network(self):
+        """Test that the batched forward pass gives each member's own Q-values."""
+        observations = np.random.default_rng(0).random((20, LAYER_SIZES[0]), dtype=np.float32)
+        q_values = self.trainer.predict(observations)
+        assert q_values.shape == (20, 2)
+
+        weights = self.trainer._get_member_weights(7)
+        hidden = observations[7]
+        for i in range(0, len(weights), 2):
+            hidden = hidden @ weights[i] + weights[i + 1]
+            if i < len(weights) - 2:
+                hidden = np.maximum(hidden, 0)
+        np.testing.assert_allclose(q_values[7], hidden, rtol=1e-5)
+
+    def test_next_generation_keeps_elites(self):
+        """Test that the fittest members survive unchanged at the front of the next generation."""
+        fitness = np.arange(20)
+        elite_weights = [self.trainer._get_member_weights(member) for member in (19, 18)]
+        self.trainer._next_generation(fitness)
+
+        for member, expected in enumerate(elite_weights):
+            for actual, weights in zip(self.trainer._get_member_weights(member), expected):
+                np.testing.assert_array_equal(actual, weights)
+
+    def test_evaluate_population(self):
+        """Test that a generation is played to the end and scored by frames survived."""
+        env = VectorizedEnvironment(20, shared_course=True, seed=0)
+        fitness = self.trainer.evaluate_population(env, max_frames=200)
+
+        assert fitness.shape == (20,)
+        assert np.all((fitness > 0) & (fitness <= 200))
+
+    def test_train_tracks_best_network(self):
+        """Test that training returns the weights of the best network it evaluated."""
+        best_weights = self.trainer.train(2, max_frames_per_episode=200)
+
+        assert self.trainer.best_fitness > 0
+        assert [weights.shape for weights in best_weights[::2]] == list(zip(LAYER_SIZES, LAYER_SIZES[1:]))
+
+    def test_train_with_observed_physics(self):
+        """Test that networks that observe their randomized physics take them as extra inputs and train."""
+        trainer = NeuroevolutionTrainer(
+            population_size=20,
+            elite_fraction=0.1,
+            seed=0,
+            physics_ranges=PhysicsRanges.around(spread=0.2),
+            observe_physics=True,
+        )
+        best_weights = trainer.train(2, max_frames_per_episode=200)
+
+        assert trainer.best_fitness > 0
+        assert best_weights[0].shape == (LAYER_SIZES[0] + len(PHYSICS_PARAMETERS), LAYER_SIZES[1])
+        with pytest.raises(ValueError):
+            trainer.evaluate_population(VectorizedEnvironment(20, shared_course=True, seed=0), max_frames=10)
+        with pytest.raises(ValueError):
+            trainer.save_model("unused.keras")
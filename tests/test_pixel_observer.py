@@ -0,0 +1,115 @@
+import numpy as np
+import pygame
+
+from flappy_trainer.ai.pixel_observer import PixelObserver
+from flappy_trainer.config import SCREEN_HEIGHT, SCREEN_WIDTH
+from flappy_trainer.game_managers.game_manager import GameManager
+from flappy_trainer.game_objects.pipe.pipe import Pipe
+from flappy_trainer.utils import BirdFrame, PipeColor
+
+
+class TestPixelObserver:
+    def setup_method(self):
+        """Set up the test environment."""
+        pygame.init()
+        self.game_manager = GameManager(pipe_distance_mode="large", headless=True)
+        self.game_manager.start_game(seed=2)
+        self.observer = PixelObserver(self.game_manager, downsample=8, stack_size=4)
+        self.frame = 0
+
+    def teardown_method(self):
+        """Clean up the test environment."""
+        pygame.quit()
+
+    def play(self, num_frames: int):
+        for _ in range(num_frames):
+            if self.frame % 20 == 0:
+                self.game_manager.bird.flap()
+            self.game_manager.update(1 / 60)
+            self.frame += 1
+            self.observer.observe()
+
+    def test_observation_shape(self):
+        """Test that observations are stacks of downsampled uint8 frames."""
+        observation = self.observer.reset()
+        assert observation.shape == (4, -(-SCREEN_HEIGHT // 8), -(-SCREEN_WIDTH // 8))
+        assert observation.dtype == np.uint8
+        assert self.observer.shape == observation.shape
+
+    def test_grayscale_matches_reference(self):
+        """Test that the in-place grayscale and downsample match a straightforward NumPy version."""
+        self.observer.reset()
+        self.play(120)
+        pixels = pygame.surfarray.array3d(self.observer.surface)[::8, ::8].astype(np.uint32)
+        expected = ((pixels[..., 0] * 77 + pixels[..., 1] * 150 + pixels[..., 2] * 29) >> 8).astype(np.uint8).T
+        np.testing.assert_array_equal(self.observer.get_observation()[-1], expected)
+
+    def test_frames_stacked_oldest_first(self):
+        """Test that reset fills the stack with one frame and new frames are pushed onto the end."""
+        observation = self.observer.reset()
+        assert all(np.array_equal(frame, observation[0]) for frame in observation)
+
+        history = []
+        for _ in range(6):
+            self.play(1)
+            history.append(self.observer.get_observation()[-1].copy())
+        observation = self.observer.get_observation()
+        for frame, expected in zip(observation, history[-4:]):
+            np.testing.assert_array_equal(frame, expected)
+        assert self.game_manager.bird.is_alive
+        assert not np.array_equal(observation[0], observation[-1])
+
+    def test_offscreen_render_matches_full_redraw(self):
+        """Test that erasing only last frame's areas renders the same picture as redrawing everything."""
+        self.observer.reset()
+        self.play(200)
+        assert self.game_manager.pipes
+        partial = pygame.image.tobytes(self.observer.surface, "RGB")
+        self.observer._drawn_rects = None
+        self.observer.render()
+        assert pygame.image.tobytes(self.observer.surface, "RGB") == partial
+
+    def test_does_not_draw_to_display(self):
+        """Test that observing leaves the display surface untouched."""
+        screen = self.game_manager.screen
+        screen.fill((1, 2, 3))
+        self.observer.reset()
+        self.play(10)
+        assert screen.get_at((SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))[:3] == (1, 2, 3)
+
+    def test_headless_game_opens_no_window(self):
+        """Test that a headless game and its observer play and render without creating a display surface."""
+        self.observer.reset()
+        self.play(10)
+        self.game_manager.draw()
+        self.game_manager.dirty_rect_rendering = True
+        self.game_manager.draw()
+        assert pygame.display.get_surface() is None
+        assert self.game_manager.screen.get_size() == (SCREEN_WIDTH, SCREEN_HEIGHT)
+
+    def test_observations_have_no_debug_overlays(self):
+        """
+        Test that observations never show collision rects or gaps: drawing the opaque pipes again over a frame
+        leaves it as it was, drawing them with their debug overlays does not.
+        """
+        self.observer.reset()
+        self.play(200)
+        assert self.game_manager.pipes
+        rendered = pygame.image.tobytes(self.observer.surface, "RGB")
+
+        surface = self.observer.surface.copy()
+        for pipe in self.game_manager.pipes:
+            pipe.draw(surface, debug=False)
+        assert pygame.image.tobytes(surface, "RGB") == rendered
+        for pipe in self.game_manager.pipes:
+            pipe.draw(surface, debug=True)
+        assert pygame.image.tobytes(surface, "RGB") != rendered
+
+    def test_headless_sprites_match_surface_format(self):
+        """Test that sprites loaded without a display are converted to the observation surface's pixel format."""
+        masks = self.observer.surface.get_masks()[:3]
+        frames = [self.game_manager.bird.sprite_sheet.get_frame(BirdFrame.FLAPPING_TOP)]
+        frames.extend(Pipe(PipeColor.GREEN).spritesheet.frames.values())
+        for frame in frames:
+            assert frame.get_masks()[:3] == masks
+            assert frame.get_flags() & pygame.SRCALPHA
@@ -0,0 +1,102 @@
+from dataclasses import replace
+
+import numpy as np
+import pygame
+
+from flappy_trainer.ai.neuroevolution_trainer import NeuroevolutionTrainer
+from flappy_trainer.ai.population_renderer import PopulationRenderer
+from flappy_trainer.ai.vectorized_environment import VectorizedEnvironment
+from flappy_trainer.config import DEFAULT_GAME_CONFIG, SCREEN_HEIGHT, SCREEN_WIDTH
+
+
+class TestPopulationRenderer:
+    def setup_method(self):
+        """Set up the test environment."""
+        pygame.init()
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.renderer = PopulationRenderer(self.screen, fps=None)
+        self.env = VectorizedEnvironment(50, shared_course=True, seed=0)
+
+    def teardown_method(self):
+        """Clean up the test environment."""
+        pygame.quit()
+
+    def run_frames(self, num_frames: int, groups: np.ndarray | None = None):
+        flap_rng = np.random.default_rng(1)
+        for _ in range(num_frames):
+            self.env.step(flap_rng.random(self.env.num_envs) < 0.05)
+            self.renderer.draw(self.env, groups)
+
+    def test_frames_cached_per_color(self):
+        """Test that one translucent copy of every bird frame is made per color, once."""
+        num_frames = len(self.renderer.group_frames[0])
+        assert len(self.renderer.group_frames) == len(self.renderer.score_frames) == 8
+        assert all(len(frames) == num_frames for frames in self.renderer.score_frames)
+        alphas = pygame.surfarray.pixels_alpha(self.renderer.group_frames[0][0])
+        assert 0 < alphas.max() <= 96
+        del alphas
+
+    def test_draws_living_birds_in_one_batch(self):
+        """Test that all living birds are drawn with a single blits call."""
+        calls = []
+        screen = self.renderer.screen
+
+        class RecordingScreen:
+            def __getattr__(self, name):
+                return getattr(screen, name)
+
+            def blits(self, sequence, doreturn=True):
+                calls.append(list(sequence))
+                return screen.blits(calls[-1], doreturn)
+
+        self.renderer.screen = RecordingScreen()
+        self.run_frames(1)
+        assert len(calls) == 1
+        assert len(calls[0]) == self.env.alive.sum()
+
+    def test_draws_shared_pipe_course(self):
+        """Test that the pipes of the course are drawn, reusing a Pipe until its slot spawns a new pipe."""
+        self.run_frames(200)
+        active_slots = set(np.flatnonzero(self.env.pipe_active[np.flatnonzero(self.env.alive)[0]]).tolist())
+        assert active_slots
+        assert active_slots <= set(self.renderer.pipes)
+        pipe = self.renderer.pipes[min(active_slots)]
+        self.run_frames(1)
+        assert self.renderer.pipes[min(active_slots)] is pipe
+
+    def test_colors_by_groups(self):
+        """Test that drawing colored by groups changes the picture compared to coloring by score."""
+        self.run_frames(30)
+        by_score = pygame.image.tobytes(self.screen, "RGB")
+        self.renderer.draw(self.env, np.arange(self.env.num_envs))
+        assert pygame.image.tobytes(self.screen, "RGB") != by_score
+
+    def test_window_sized_from_config(self):
+        """Test that a renderer without a screen opens a window the size of the configured screen."""
+        config = replace(DEFAULT_GAME_CONFIG, screen_width=SCREEN_WIDTH + 40, screen_height=SCREEN_HEIGHT + 60)
+        renderer = PopulationRenderer(fps=None, config=config)
+        assert renderer.screen.get_size() == (config.screen_width, config.screen_height)
+        assert renderer.background.get_size() == (config.screen_width, config.screen_height)
+        renderer.draw(VectorizedEnvironment(5, shared_course=True, seed=0, config=config))
+
+    def test_draws_offscreen_without_display(self):
+        """Test that the renderer draws onto an offscreen surface when no display mode is set."""
+        pygame.display.quit()
+        pygame.display.init()
+        assert pygame.display.get_surface() is None
+        screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        renderer = PopulationRenderer(screen, fps=None)
+        self.env.step(np.zeros(self.env.num_envs, dtype=bool))
+        renderer.draw(self.env)
+        assert screen.get_at((0, SCREEN_HEIGHT // 2)) != pygame.Color(0, 0, 0)
+
+    def test_neuroevolution_renders_generation(self):
+        """Test that the neuroevolution trainer draws a generation colored by lineage."""
+        trainer = NeuroevolutionTrainer(population_size=20, elite_fraction=0.1, seed=0)
+        env = VectorizedEnvironment(20, shared_course=True, seed=0)
+        drawn = []
+        self.renderer.draw = lambda env, groups: drawn.append(groups)
+        fitness = trainer.evaluate_population(env, max_frames=30, renderer=self.renderer)
+        assert len(drawn) == min(30, fitness.max())
+        trainer._next_generation(fitness)
+        assert set(trainer.lineages.tolist()) <= set(range(trainer.num_elites))
@@ -0,0 +1,93 @@
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from flappy_trainer.ai.ai_utils import Action, Knowledge
+from flappy_trainer.ai.environment_state import EnvironmentState
+from flappy_trainer.ai.replay_dataset import (
+    MANIFEST_FILE_NAME,
+    ReplayDataset,
+    ReplayDatasetWriter,
+    export_knowledge,
+    train_on_dataset,
+)
+
+
+def create_knowledge(index: int) -> Knowledge:
+    state = EnvironmentState(bird_is_alive=True, bird_vert_pos=index, bird_vert_velocity=0, pipe_velocity=300)
+    if index % 10 == 9:
+        return Knowledge(state, Action.FLAP, -1, None)
+    next_state = EnvironmentState(bird_is_alive=True, bird_vert_pos=index + 1, bird_vert_velocity=0, pipe_velocity=300)
+    return Knowledge(state, Action.NO_FLAP, 1, next_state)
+
+
+class RecordingAgent:
+    def __init__(self):
+        self.batches = []
+
+    def learn_from_batch(self, states, actions, rewards, next_states, dones, n_steps):
+        self.batches.append(len(states))
+
+
+class TestReplayDataset:
+    def setup_method(self):
+        """Set up the test environment."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.temp_dir.name, "dataset")
+        self.knowledge = [create_knowledge(i) for i in range(250)]
+        export_knowledge(self.knowledge, self.directory, chunk_size=100)
+
+    def teardown_method(self):
+        """Clean up the test environment."""
+        self.temp_dir.cleanup()
+
+    def test_export_writes_chunks_and_manifest(self):
+        """Test that the export is split into chunks listed in the manifest."""
+        with open(os.path.join(self.directory, MANIFEST_FILE_NAME)) as file:
+            manifest = json.load(file)
+
+        assert manifest["num_transitions"] == 250
+        assert [chunk["size"] for chunk in manifest["chunks"]] == [100, 100, 50]
+        assert manifest["fields"]["obs"] == "<f4"
+        assert os.path.exists(os.path.join(self.directory, "chunk-00002-next_obs.npy"))
+
+    def test_load_is_memory_mapped(self):
+        """Test that the chunks are memory maps holding the exported transitions."""
+        dataset = ReplayDataset(self.directory)
+
+        assert len(dataset) == 250
+        chunk = dataset.chunks[1]
+        assert isinstance(chunk["obs"], np.memmap)
+        np.testing.assert_allclose(chunk["obs"][5], self.knowledge[105].pre_state.to_numpy_array(), atol=2e-3)
+        assert chunk["done"][9] and chunk["next_obs"][9].sum() == 0
+        assert chunk["action"][9] == Action.FLAP.value
+        assert chunk["reward"][:9].tolist() == [1] * 9
+
+    def test_minibatches_visit_every_transition_once(self):
+        """Test that one pass of shuffled minibatches covers the dataset exactly once."""
+        dataset = ReplayDataset(self.directory)
+        batches = list(dataset.iter_minibatches(32, seed=0))
+
+        assert all(len(batch["obs"]) <= 32 for batch in batches)
+        positions = np.concatenate([batch["obs"][:, 0] for batch in batches])
+        assert len(positions) == 250
+        expected = np.array([knowledge.pre_state.to_numpy_array()[0] for knowledge in self.knowledge])
+        np.testing.assert_allclose(np.sort(positions), np.sort(expected), atol=2e-3)
+
+    def test_writer_appends_in_chunks(self):
+        """Test that a writer fed in pieces writes the same chunks."""
+        directory = os.path.join(self.temp_dir.name, "pieces")
+        with ReplayDatasetWriter(directory, chunk_size=100) as writer:
+            for start in range(0, 250, 30):
+                writer.add(self.knowledge[start : start + 30])
+
+        assert len(ReplayDataset(directory)) == 250
+        assert [chunk["size"] for chunk in writer.chunks] == [100, 100, 50]
+
+    def test_train_on_dataset(self):
+        """Test that offline training fits the agent on every minibatch of every epoch."""
+        agent = RecordingAgent()
+        train_on_dataset(agent, ReplayDataset(self.directory), batch_size=64, epochs=2, seed=0)
+        assert sum(agent.batches) == 2 * 250
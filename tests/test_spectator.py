@@ -0,0 +1,85 @@
+import pygame
+
+from flappy_trainer.ai.ai_utils import Action, get_nearest_pipe_details
+from flappy_trainer.ai.spectator import UNTHROTTLED, Spectator
+from flappy_trainer.config import SCREEN_HEIGHT
+from flappy_trainer.game_managers.game_manager import GameManager
+
+
+class GapFollowingAgent:
+    """Flaps when the bird is below the next gap."""
+
+    def __init__(self, game_manager: GameManager):
+        self.game_manager = game_manager
+
+    def choose_action(self, state) -> Action:
+        _, gap_center, _ = get_nearest_pipe_details(self.game_manager)
+        is_below_gap = self.game_manager.bird.y_pos > (gap_center or SCREEN_HEIGHT // 2)
+        return Action.FLAP if is_below_gap else Action.NO_FLAP
+
+
+class NeverFlapAgent:
+    def choose_action(self, state) -> Action:
+        return Action.NO_FLAP
+
+
+class TestSpectator:
+    def setup_method(self):
+        """Set up the test environment."""
+        pygame.init()
+        self.game_manager = GameManager()
+        self.draws = 0
+        draw = self.game_manager.draw
+
+        def counting_draw():
+            self.draws += 1
+            draw()
+
+        self.game_manager.draw = counting_draw
+
+    def teardown_method(self):
+        """Clean up the test environment."""
+        pygame.quit()
+
+    def test_speed_hotkeys(self):
+        """Test that the number keys switch between 1x, 4x, 16x and unthrottled speed."""
+        spectator = Spectator(NeverFlapAgent(), self.game_manager)
+        for key, speed in [(pygame.K_2, 4), (pygame.K_3, 16), (pygame.K_4, UNTHROTTLED), (pygame.K_1, 1)]:
+            spectator.handle_event(pygame.event.Event(pygame.KEYDOWN, key=key))
+            assert spectator.speed == speed
+
+    def test_skip_and_stop_controls(self):
+        """Test that N skips to the next death and ESC stops watching."""
+        spectator = Spectator(NeverFlapAgent(), self.game_manager)
+        spectator.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_n))
+        assert spectator.is_skipping
+        spectator.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE))
+        assert not spectator.is_watching
+
+    def test_renders_every_kth_frame(self):
+        """Test that at 4x speed only every fourth frame is drawn, plus the death frame."""
+        spectator = Spectator(NeverFlapAgent(), self.game_manager, death_hold=0)
+        spectator.speed = 4
+        frames = spectator.watch_episode()
+        assert self.draws == (frames - 1) // 4 + 1
+
+    def test_skip_to_death_draws_only_the_death(self):
+        """Test that skipping simulates the episode without drawing until the bird dies."""
+        spectator = Spectator(GapFollowingAgent(self.game_manager), self.game_manager, death_hold=0)
+        spectator.speed = UNTHROTTLED
+        spectator.is_skipping = True
+        frames = spectator.watch_episode()
+        assert frames > 0
+        assert self.draws == 1
+        assert not spectator.is_skipping
+
+    def test_simulation_is_independent_of_speed(self):
+        """Test that an episode lasts the same number of frames at every speed."""
+        results = []
+        for speed, is_skipping in [(16, False), (UNTHROTTLED, False), (UNTHROTTLED, True)]:
+            spectator = Spectator(GapFollowingAgent(self.game_manager), self.game_manager, death_hold=0)
+            spectator.speed = speed
+            spectator.is_skipping = is_skipping
+            self.game_manager.previous_gap_center = None
+            results.append(spectator.watch_episode(seed=3))
+        assert results[0] == results[1] == results[2]
@@ -0,0 +1,67 @@
+import numpy as np
+import pygame
+
+from flappy_trainer.ai.ai_utils import get_current_state
+from flappy_trainer.ai.state_encoder import StateEncoder
+from flappy_trainer.game_managers.game_manager import GameManager
+from flappy_trainer.game_objects.pipe.pipe import Pipe
+from flappy_trainer.utils import PipeColor
+
+
+class TestStateEncoder:
+    def setup_method(self):
+        """Set up the test environment."""
+        pygame.init()
+        self.game_manager = GameManager()
+        self.game_manager.start_game()
+        self.buffer = StateEncoder.allocate(3)
+
+    def teardown_method(self):
+        """Clean up the test environment."""
+        pygame.quit()
+
+    def assert_matches_environment_state(self, game_manager: GameManager, features: np.ndarray):
+        expected = get_current_state(game_manager).to_numpy_array()
+        np.testing.assert_allclose(features, expected, atol=2e-3)  # EnvironmentState rounds to float16
+
+    def test_encode_without_pipes(self):
+        """Test that a game without pipes encodes the default pipe features."""
+        features = StateEncoder.encode(self.game_manager, self.buffer[1])
+
+        assert features.base is self.buffer
+        self.assert_matches_environment_state(self.game_manager, features)
+        assert not self.buffer[0].any() and not self.buffer[2].any()
+
+    def test_encode_with_pipes(self):
+        """Test that the nearest unpassed pipes are encoded in order, skipping passed pipes."""
+        passed = Pipe(PipeColor.GREEN, x_pos=20, gap_center=300, gap_height=150)
+        passed.passed = True
+        self.game_manager.pipes = [
+            passed,
+            Pipe(PipeColor.GREEN, x_pos=300, gap_center=250, gap_height=200),
+            Pipe(PipeColor.GREEN, x_pos=600, gap_center=350, gap_height=130),
+            Pipe(PipeColor.GREEN, x_pos=790, gap_center=300, gap_height=150),
+        ]
+        self.assert_matches_environment_state(self.game_manager, StateEncoder.encode(self.game_manager, self.buffer[0]))
+
+        self.game_manager.pipes = self.game_manager.pipes[:2]
+        self.assert_matches_environment_state(self.game_manager, StateEncoder.encode(self.game_manager, self.buffer[0]))
+
+    def test_encode_many(self):
+        """Test that the bulk variant writes one row per game."""
+        game_managers = [GameManager() for _ in range(3)]
+        for i, game_manager in enumerate(game_managers):
+            game_manager.start_game()
+            game_manager.bird.y_pos = 100 * (i + 1)
+        StateEncoder.encode_many(game_managers, self.buffer)
+
+        for game_manager, row in zip(game_managers, self.buffer):
+            self.assert_matches_environment_state(game_manager, row)
+
+    def test_encode_states(self):
+        """Test that stored EnvironmentStates encode to their own features."""
+        states = [get_current_state(self.game_manager) for _ in range(3)]
+        StateEncoder.encode_states(states, self.buffer)
+
+        for state, row in zip(states, self.buffer):
+            np.testing.assert_allclose(row, state.to_numpy_array(), atol=2e-3)
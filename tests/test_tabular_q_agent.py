@@ -0,0 +1,65 @@
+import os
+import tempfile
+
+import numpy as np
+
+from flappy_trainer.ai.ai_utils import Action, Knowledge
+from flappy_trainer.ai.environment_state import EnvironmentState
+from flappy_trainer.ai.tabular_q_agent import TabularQAgent, get_features
+
+
+def create_state(bird_vert_pos: int, bird_vert_velocity: int = 0, bird_is_alive: bool = True) -> EnvironmentState:
+    return EnvironmentState(
+        bird_is_alive=bird_is_alive,
+        bird_vert_pos=bird_vert_pos,
+        bird_vert_velocity=bird_vert_velocity,
+        pipe_velocity=300,
+        next_pipe_distance=400,
+        next_pipe_gap_pos=300,
+        next_pipe_gap_height=150,
+    )
+
+
+class TestTabularQAgent:
+    def setup_method(self):
+        """Set up the test environment."""
+        self.agent = TabularQAgent(learning_rate=0.5)
+        self.agent.set_exploration_rate(0.0)
+
+    def test_single_and_bulk_indices_agree(self):
+        """Test that the fast single-state lookup and the vectorized lookup find the same rows."""
+        states = [create_state(pos, vel) for pos in (-20, 0, 150, 299, 300, 610) for vel in (-30, -7, 0, 5, 40)]
+        indices = self.agent.get_state_indices(np.array([get_features(state) for state in states]))
+
+        assert [self.agent.get_state_index(state) for state in states] == indices.tolist()
+        assert np.all((indices >= 0) & (indices < len(self.agent.q_table)))
+
+    def test_replay_moves_q_values_towards_targets(self):
+        """Test that replay learns to avoid an action that leads to death."""
+        state = create_state(100)
+        for _ in range(8):
+            self.agent.remember(Knowledge(state, Action.FLAP, -1, None))
+            self.agent.remember(Knowledge(state, Action.NO_FLAP, 1, create_state(120)))
+        for _ in range(10):
+            self.agent.replay(16)
+
+        q_values = self.agent.q_table[self.agent.get_state_index(state)]
+        assert q_values[0] < -0.9
+        assert q_values[1] > 0.9
+        assert self.agent.choose_action(state) == Action.NO_FLAP
+
+    def test_replay_waits_for_enough_memories(self):
+        """Test that replay does nothing until memory holds a full batch."""
+        self.agent.remember(Knowledge(create_state(100), Action.FLAP, -1, None))
+        self.agent.replay(2)
+        assert not self.agent.q_table.any()
+
+    def test_save_and_load(self):
+        """Test that the Q-table round trips through a .npy file."""
+        self.agent.q_table[42] = [1.5, -2.0]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "q_table.npy")
+            self.agent.save(path)
+            loaded = TabularQAgent(path)
+
+        np.testing.assert_array_equal(loaded.q_table, self.agent.q_table)
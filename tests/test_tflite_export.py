@@ -0,0 +1,142 @@
+import os
+import sys
+import tempfile
+from unittest.mock import patch
+
+import numpy as np
+from tensorflow.keras.layers import Dense, Input
+from tensorflow.keras.models import Sequential
+
+from flappy_trainer.ai.ai_utils import Action, Knowledge
+from flappy_trainer.ai.demonstrations import FRAME_DTYPE, HEADER, MAGIC, VERSION
+from flappy_trainer.ai.environment_state import EnvironmentState
+from flappy_trainer.ai.reinforcement_learning_agent import ReinforcementLearningAgent
+from flappy_trainer.ai.replay_dataset import export_knowledge
+from flappy_trainer.ai.state_encoder import NUM_FEATURES, StateEncoder
+from flappy_trainer.ai.tflite_export import (
+    TFLitePolicy,
+    convert_model,
+    export_model,
+    get_action_agreement,
+    load_recorded_states,
+    main,
+    split_states,
+)
+
+
+def create_mixed_precision_model() -> Sequential:
+    """The agent's network as it is trained, under the `mixed_float16` policy."""
+    return Sequential(
+        [
+            Input((NUM_FEATURES,)),
+            Dense(128, activation="relu", dtype="mixed_float16"),
+            Dense(64, activation="relu", dtype="mixed_float16"),
+            Dense(32, activation="relu", dtype="mixed_float16"),
+            Dense(2, activation="linear", dtype="float32"),
+        ]
+    )
+
+
+class TestTFLiteExport:
+    def setup_method(self):
+        """Set up the test environment."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.model = create_mixed_precision_model()
+        self.model_path = os.path.join(self.temp_dir.name, "model.keras")
+        self.model.save(self.model_path)
+        self.states = np.random.default_rng(0).random((600, NUM_FEATURES), dtype=np.float32)
+
+    def teardown_method(self):
+        """Clean up the test environment."""
+        self.temp_dir.cleanup()
+
+    def test_float_export_matches_keras(self):
+        """Test that the float export of a mixed-precision model gives its Q-values and actions."""
+        policy = TFLitePolicy(model_content=convert_model(self.model))
+        q_values = policy.predict(self.states)
+        expected = self.model.predict(self.states, verbose=0)
+
+        np.testing.assert_allclose(q_values, expected, atol=1e-2)
+        assert get_action_agreement(q_values, expected) > 0.95
+        np.testing.assert_allclose(policy.predict(self.states[:1]), q_values[:1], atol=1e-5)
+
+    def test_int8_export_is_calibrated(self):
+        """Test that the int8 export is smaller than the float export and mostly agrees with the Keras model."""
+        float_content = convert_model(self.model)
+        int8_content = convert_model(self.model, calibration_states=self.states[:100])
+        q_values = TFLitePolicy(model_content=int8_content).predict(self.states[100:])
+
+        assert len(int8_content) < len(float_content)
+        assert get_action_agreement(q_values, self.model.predict(self.states[100:], verbose=0)) > 0.9
+
+    def test_export_model_writes_models_and_report(self):
+        """Test that exporting writes both models and reports every policy against the Keras model."""
+        rows = export_model(self.model_path, self.states[:100], self.states[100:], quantize_int8=True)
+
+        assert [row["policy"] for row in rows] == [
+            self.model_path,
+            os.path.join(self.temp_dir.name, "model.tflite"),
+            os.path.join(self.temp_dir.name, "model.int8.tflite"),
+        ]
+        assert rows[0]["agreement"] == 1.0
+        for row in rows:
+            assert os.path.exists(row["policy"])
+            assert row["decision_us"] > 0 and row["batch_us"] > 0
+
+    def test_agent_decides_with_interpreter(self):
+        """Test that an agent given a TFLite model decides with the interpreter."""
+        tflite_path = os.path.join(self.temp_dir.name, "model.tflite")
+        with open(tflite_path, "wb") as file:
+            file.write(convert_model(self.model))
+        agent = ReinforcementLearningAgent(self.model_path, tflite_model_path=tflite_path)
+        agent.set_exploration_rate(0.0)
+
+        state = EnvironmentState(bird_is_alive=True, bird_vert_pos=300, bird_vert_velocity=-4, pipe_velocity=300)
+        q_values = TFLitePolicy(tflite_path).predict(
+            StateEncoder.encode_state(state, StateEncoder.allocate(1)[0])[None]
+        )
+        expected = Action.FLAP if q_values[0, 0] > q_values[0, 1] else Action.NO_FLAP
+        assert agent.choose_action(state) == expected
+
+    def test_agreement_breaks_ties_like_agent(self):
+        """Test that tied Q-values count as the agent's NO_FLAP, not as FLAP."""
+        tied = np.array([[1.0, 1.0], [2.0, 1.0]], dtype=np.float32)
+        assert get_action_agreement(tied, np.array([[0.0, 1.0], [2.0, 1.0]], dtype=np.float32)) == 1.0
+        assert get_action_agreement(tied, np.array([[1.0, 0.0], [2.0, 1.0]], dtype=np.float32)) == 0.5
+
+    def test_float_export_without_calibration_states(self):
+        """Test that a float-only export needs no calibration states and validates on every state."""
+        path = os.path.join(self.temp_dir.name, "few.demo")
+        frames = np.zeros(20, dtype=FRAME_DTYPE)
+        frames["features"] = self.states[:20]
+        with open(path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, VERSION, NUM_FEATURES, 0))
+            frames.tofile(file)
+
+        argv = ["tflite_export", self.model_path, "--states", path, "--output-dir", self.temp_dir.name]
+        with patch.object(sys, "argv", argv), patch("flappy_trainer.ai.tflite_export.export_model") as export:
+            export.return_value = []
+            main()
+        _, calibration_states, validation_states, quantize_int8, _ = export.call_args.args
+        assert calibration_states is None and not quantize_int8
+        assert len(validation_states) == 20
+
+    def test_load_and_split_recorded_states(self):
+        """Test that states are read from demonstration logs and replay datasets and split without overlap."""
+        frames = np.zeros(50, dtype=FRAME_DTYPE)
+        frames["features"] = self.states[:50]
+        demo_path = os.path.join(self.temp_dir.name, "session.demo")
+        with open(demo_path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, VERSION, NUM_FEATURES, 0))
+            frames.tofile(file)
+        dataset_path = os.path.join(self.temp_dir.name, "dataset")
+        state = EnvironmentState(bird_is_alive=True, bird_vert_pos=300, bird_vert_velocity=0, pipe_velocity=300)
+        export_knowledge([Knowledge(state, Action.FLAP, 1, state)] * 30, dataset_path, chunk_size=20)
+
+        states = load_recorded_states([demo_path, dataset_path])
+        assert states.shape == (80, NUM_FEATURES)
+        np.testing.assert_array_equal(states[:50], self.states[:50])
+
+        calibration, validation = split_states(states[:50], num_calibration=10, seed=0)
+        assert len(calibration) == 10 and len(validation) == 40
+        assert sorted(map(tuple, np.concatenate([calibration, validation]))) == sorted(map(tuple, self.states[:50]))
@@ -0,0 +1,77 @@
+from flappy_trainer.ai.ai_utils import Action
+from flappy_trainer.ai.environment_state import EnvironmentState
+from flappy_trainer.ai.transition_builder import TransitionBuilder
+
+
+def create_state(bird_vert_pos: int) -> EnvironmentState:
+    return EnvironmentState(bird_is_alive=True, bird_vert_pos=bird_vert_pos, bird_vert_velocity=0, pipe_velocity=300)
+
+
+class TestTransitionBuilder:
+    def setup_method(self):
+        """Set up the test environment before each test."""
+        self.builder = TransitionBuilder()
+        self.states = [create_state(pos) for pos in (100, 200, 300, 400)]
+
+    def test_first_decision_emits_nothing(self):
+        """Test that a decision is held until its horizon elapses."""
+        assert self.builder.add_decision(self.states[0], Action.FLAP) == []
+        assert len(self.builder.pending) == 1
+
+    def test_each_transition_emitted_once(self):
+        """Test that every decision produces exactly one transition bootstrapped on the next state."""
+        emitted = []
+        for state in self.states:
+            emitted.extend(self.builder.add_decision(state, Action.NO_FLAP))
+
+        assert len(emitted) == len(self.states) - 1
+        for knowledge, pre_state, post_state in zip(emitted, self.states, self.states[1:]):
+            assert knowledge.pre_state is pre_state
+            assert knowledge.post_state is post_state
+            assert knowledge.reward == 1
+
+    def test_game_over_emits_terminal_transition(self):
+        """Test that the decision that led to death is emitted once as a terminal transition."""
+        self.builder.add_decision(self.states[0], Action.NO_FLAP)
+        self.builder.add_decision(self.states[1], Action.FLAP)
+        terminal = self.builder.end_episode(is_game_over=True)
+
+        assert len(terminal) == 1
+        assert terminal[0].pre_state is self.states[1]
+        assert terminal[0].action == Action.FLAP
+        assert terminal[0].reward == -1
+        assert terminal[0].post_state is None
+        assert self.builder.end_episode(is_game_over=True) == []
+
+    def test_truncated_episode_drops_pending(self):
+        """Test that an episode cut short without dying emits no terminal transitions."""
+        self.builder.add_decision(self.states[0], Action.FLAP)
+        assert self.builder.end_episode(is_game_over=False) == []
+        assert len(self.builder.pending) == 0
+
+    def test_n_step_returns(self):
+        """Test that n-step transitions carry the discounted return and the state n decisions later."""
+        builder = TransitionBuilder(n_steps=3, discount_factor=0.5)
+        emitted = []
+        for state in self.states:
+            emitted.extend(builder.add_decision(state, Action.NO_FLAP))
+
+        assert len(emitted) == 1
+        assert emitted[0].pre_state is self.states[0]
+        assert emitted[0].post_state is self.states[3]
+        assert emitted[0].reward == 1 + 0.5 + 0.25
+        assert emitted[0].n_steps == 3
+
+    def test_n_step_terminal_returns(self):
+        """Test that decisions pending at death get truncated returns ending in the death penalty."""
+        builder = TransitionBuilder(n_steps=3, discount_factor=0.5)
+        builder.add_decision(self.states[0], Action.NO_FLAP)
+        builder.add_decision(self.states[1], Action.FLAP)
+        terminal = builder.end_episode(is_game_over=True)
+
+        assert [knowledge.pre_state for knowledge in terminal] == self.states[:2]
+        assert terminal[0].reward == 1 - 0.5
+        assert terminal[0].n_steps == 2
+        assert terminal[1].reward == -1
+        assert terminal[1].n_steps == 1
+        assert all(knowledge.post_state is None for knowledge in terminal)
@@ -0,0 +1,121 @@
+import random
+
+import numpy as np
+import pygame
+import pytest
+
+from flappy_trainer.ai.ai_utils import get_current_state
+from flappy_trainer.ai.environment_state import EnvironmentState
+from flappy_trainer.ai.vectorized_environment import PHYSICS_PARAMETERS, PhysicsRanges, VectorizedEnvironment
+from flappy_trainer.config import BIRD_START_Y_POS, DEFAULT_GAME_CONFIG
+from flappy_trainer.game_managers.game_manager import GameManager
+from flappy_trainer.utils import GameState
+
+MODES = ("large", "large", "alternating")  # Deterministic pipe modes, so both simulators build the same course
+
+
+class TestVectorizedEnvironment:
+    def setup_method(self):
+        """Set up the test environment."""
+        pygame.init()
+        self.env = VectorizedEnvironment(4, True, *MODES, seed=0)
+        self.env.reset()
+
+    def teardown_method(self):
+        """Clean up the test environment."""
+        pygame.quit()
+
+    def test_matches_game_manager(self):
+        """Test that every game follows GameManager frame for frame under the same flaps."""
+        rng = random.Random(0)
+        flaps = [[rng.random() < 0.08 for _ in range(4)] for _ in range(600)]
+        game_managers = [GameManager(True, *MODES) for _ in range(4)]
+        for game_manager in game_managers:
+            game_manager.start_game()
+
+        for frame_flaps in flaps:
+            for game_manager, flap in zip(game_managers, frame_flaps):
+                if game_manager.state is GameState.RUNNING:
+                    if flap:
+                        game_manager.bird.flap()
+                    game_manager.update(1 / 60)
+            self.env.step(np.array(frame_flaps))
+
+            for i, game_manager in enumerate(game_managers):
+                assert self.env.alive[i] == (game_manager.state is GameState.RUNNING)
+                assert self.env.bird_y[i] == game_manager.bird.y_pos
+                assert self.env.score[i] == game_manager.score
+                if self.env.alive[i]:
+                    expected = get_current_state(game_manager).to_numpy_array()
+                    np.testing.assert_allclose(self.env.get_observations()[i], expected, atol=2e-3)
+
+    def test_reset_mask(self):
+        """Test that only the selected games are restarted."""
+        for _ in range(30):
+            self.env.step()
+        mask = np.array([True, False, True, False])
+        self.env.reset(mask)
+
+        assert np.all(self.env.bird_y[mask] == BIRD_START_Y_POS)
+        assert np.all(self.env.frames[mask] == 0)
+        assert np.all(self.env.frames[~mask] == 30)
+
+    def test_shared_course(self):
+        """Test that a shared course gives every game identical random pipes."""
+        env = VectorizedEnvironment(8, shared_course=True, seed=1)
+        env.reset()
+        for _ in range(300):
+            env.step(np.ones(8, dtype=bool) if env.frames[0] % 20 == 0 else None)
+
+        assert np.all(env.pipe_gap_center == env.pipe_gap_center[0])
+        assert np.all(env.pipe_x == env.pipe_x[0])
+
+    def test_observations_shape(self):
+        """Test that observations are float32 rows written into a supplied buffer."""
+        out = np.empty((4, 9), dtype=np.float32)
+        observations = self.env.get_observations(out=out)
+        assert observations is out
+        assert observations.dtype == np.float32
+
+    def test_physics_randomization(self):
+        """Test that every game draws its physics from the ranges on reset and exposes them in info."""
+        ranges = PhysicsRanges(bird_gravity=(10, 20), initial_pipe_speed=(100, 150), pipe_min_gap_height=(120, 130))
+        env = VectorizedEnvironment(64, True, *MODES, seed=0, physics_ranges=ranges)
+        info = env.info
+        assert np.all((info["bird_gravity"] >= 10) & (info["bird_gravity"] <= 20))
+        assert len(np.unique(info["bird_gravity"])) == 64
+        assert np.all(env.pipe_speed == info["initial_pipe_speed"])
+        assert np.all(info["pipe_min_gap_height"] == np.round(info["pipe_min_gap_height"]))
+        assert np.all(info["bird_flap_force"] == env.config.bird_flap_force)
+
+        gravity = info["bird_gravity"].copy()
+        env.reset(np.arange(64) < 32)
+        assert np.all(env.info["bird_gravity"][:32] != gravity[:32])
+        assert np.all(env.info["bird_gravity"][32:] == gravity[32:])
+
+        env.step()
+        np.testing.assert_allclose(env.bird_velocity, env.info["bird_gravity"] / 60)
+
+    def test_observe_physics(self):
+        """Test that the physics relative to the config are appended to the features when observed."""
+        env = VectorizedEnvironment(8, seed=0, physics_ranges=PhysicsRanges.around(spread=0.2), observe_physics=True)
+        observations = env.get_observations()
+        assert observations.shape == (8, EnvironmentState.get_num_features() + len(PHYSICS_PARAMETERS))
+        relative_gravity = observations[:, EnvironmentState.get_num_features()]
+        np.testing.assert_allclose(relative_gravity, env.bird_gravity / env.config.bird_gravity, rtol=1e-6)
+        assert np.all((relative_gravity >= 0.8) & (relative_gravity <= 1.2))
+
+    def test_sample_config(self):
+        """Test that a config drawn from the ranges keeps unranged values and has whole-pixel gap heights."""
+        ranges = PhysicsRanges(bird_gravity=(10, 20), pipe_min_gap_height=(120.4, 130), pipe_max_gap_height=(120, 125))
+        config = ranges.sample_config(DEFAULT_GAME_CONFIG, np.random.default_rng(0))
+        assert 10 <= config.bird_gravity <= 20
+        assert isinstance(config.pipe_min_gap_height, int) and isinstance(config.pipe_max_gap_height, int)
+        assert config.pipe_min_gap_height <= config.pipe_max_gap_height
+        assert config.bird_flap_force == DEFAULT_GAME_CONFIG.bird_flap_force
+        assert config.screen_width == DEFAULT_GAME_CONFIG.screen_width
+
+    def test_invalid_physics_range(self):
+        """Test that a range with its low above its high is rejected."""
+        with pytest.raises(ValueError):
+            PhysicsRanges(bird_gravity=(20, 10))